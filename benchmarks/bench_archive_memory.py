@@ -0,0 +1,113 @@
+"""
+Measures the memory held by an ArchiveList of many archives, compared with the same archives
+kept as the Archive objects of opentok 3.12, which had a __dict__ and built created_at
+eagerly.
+
+Usage:
+
+    python benchmarks/bench_archive_memory.py [--archives 100000]
+"""
+import argparse
+from datetime import datetime, timezone
+import gc
+import json
+import time
+import tracemalloc
+
+from opentok import ArchiveList
+from opentok.archives import OutputModes, StreamModes
+
+
+class DictArchive(object):
+    """The Archive of opentok 3.12: a __dict__ per object and created_at built eagerly."""
+
+    def __init__(self, sdk, values):
+        self.sdk = sdk
+        self.id = values.get("id")
+        self.name = values.get("name")
+        self.status = values.get("status")
+        self.session_id = values.get("sessionId")
+        self.partner_id = values.get("partnerId")
+        self.created_at = datetime.fromtimestamp(
+            values.get("createdAt") // 1000, timezone.utc
+        )
+        self.size = values.get("size")
+        self.duration = values.get("duration")
+        self.has_audio = values.get("hasAudio")
+        self.has_video = values.get("hasVideo")
+        self.output_mode = OutputModes[values.get("outputMode", "composed")]
+        self.stream_mode = values.get("streamMode", StreamModes.auto)
+        self.streams = values.get("streams")
+        self.url = values.get("url")
+        self.resolution = values.get("resolution")
+        self.max_bitrate = values.get("maxBitrate")
+        self.quantization_parameter = values.get("quantizationParameter")
+
+
+def make_payload(count):
+    items = [
+        {
+            "createdAt": 1395183243556 + i,
+            "duration": 62,
+            "id": "b40ef09b-3811-4726-b508-e41a0f96c{0:05d}".format(i),
+            "name": "",
+            "partnerId": 123456,
+            "reason": "",
+            "sessionId": "2_MX4xMDB-flR1ZSBOb3YgMTkgMTE6MDk6NTggUFNUIDIwMTN-MC4zNzQxNzIxNX4",
+            "size": 8347554,
+            "status": "available",
+            "hasAudio": True,
+            "hasVideo": True,
+            "outputMode": "composed",
+            "url": "https://example.com/{0}/archive.mp4".format(i),
+        }
+        for i in range(count)
+    ]
+    return json.dumps({"count": count, "items": items})
+
+
+def measure(label, build):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        "{0:<40} {1:>8.1f} MiB held {2:>8.1f} MiB peak {3:>8.2f} s".format(
+            label, current / 2**20, peak / 2**20, elapsed
+        )
+    )
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--archives", type=int, default=100000)
+    args = parser.parse_args()
+
+    payload = make_payload(args.archives)
+
+    archives = measure(
+        "Archive objects of opentok 3.12",
+        lambda: [DictArchive(None, item) for item in json.loads(payload)["items"]],
+    )
+    del archives
+
+    archive_list = measure(
+        "ArchiveList", lambda: ArchiveList(None, json.loads(payload))
+    )
+    del archive_list
+
+    def with_created_at():
+        archive_list = ArchiveList(None, json.loads(payload))
+        for archive in archive_list:
+            archive.created_at
+        return archive_list
+
+    measure("ArchiveList with created_at read", with_created_at)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Compares tokens per second of Client.generate_token in a loop with Client.generate_tokens.
+
+Usage:
+
+    python benchmarks/bench_tokens.py [--tokens 20000]
+
+Run from the repository root, the Vonage (RS256) runs use the test private key in
+tests/fake_data.
+"""
+import argparse
+import time
+
+from opentok import Client, Roles
+
+API_KEY = "123456"
+API_SECRET = "1234567890abcdef1234567890abcdef1234567890"
+PRIVATE_KEY = "tests/fake_data/dummy_private_key.txt"
+SESSION_ID = "1_MX4xMjM0NTZ-flNhdCBNYXIgMTUgMTQ6NDI6MjMgUERUIDIwMTR-MC40OTAxMzAyNX4"
+
+
+def run(label, count, func):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print("{0:<40} {1:>10.0f} tokens/s".format(label, count / elapsed))
+
+
+def bench(label, client, count, use_jwt=True):
+    specs = [(Roles.publisher, "user=%d" % i, None, ["focus"]) for i in range(count)]
+    run(
+        label + " generate_token",
+        count,
+        lambda: [
+            client.generate_token(
+                SESSION_ID,
+                role,
+                expire_time,
+                data,
+                initial_layout_class_list=layout,
+                use_jwt=use_jwt,
+            )
+            for role, data, expire_time, layout in specs
+        ],
+    )
+    run(
+        label + " generate_tokens",
+        count,
+        lambda: client.generate_tokens(SESSION_ID, specs, use_jwt=use_jwt),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens", type=int, default=20000)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="worker processes for the pooled RS256 run (default: number of CPUs)",
+    )
+    args = parser.parse_args()
+
+    client = Client(API_KEY, API_SECRET)
+    bench("HS256", client, args.tokens)
+    bench("T1", client, args.tokens, use_jwt=False)
+
+    rs256_count = max(args.tokens // 10, 1)
+    vonage_client = Client(API_KEY, PRIVATE_KEY)
+    bench("RS256", vonage_client, rs256_count)
+
+    vonage_client.enable_signing_pool(workers=args.workers)
+    specs = [(Roles.publisher, "user=%d" % i) for i in range(rs256_count)]
+    # start the workers before timing
+    vonage_client.generate_tokens(SESSION_ID, specs[:1])
+    run(
+        "RS256 generate_tokens (signing pool)",
+        rs256_count,
+        lambda: vonage_client.generate_tokens(SESSION_ID, specs),
+    )
+    vonage_client.close()
+
+
+if __name__ == "__main__":
+    main()
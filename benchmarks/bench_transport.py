@@ -0,0 +1,90 @@
+"""
+Compares request throughput against a local stub server with and without connection pooling.
+
+Usage:
+
+    python benchmarks/bench_transport.py [--requests 2000]
+
+The "unpooled" run uses the module-level requests functions (a new connection per call), the
+"pooled" runs send the same calls through Client, which reuses keep-alive connections.
+"""
+import argparse
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from opentok import Client
+
+API_KEY = "123456"
+API_SECRET = "1234567890abcdef1234567890abcdef1234567890"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _reply(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        self.send_response(204)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    do_GET = do_POST = do_DELETE = _reply
+
+    def log_message(self, *args):
+        pass
+
+
+def start_stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run(label, count, func):
+    start = time.perf_counter()
+    for _ in range(count):
+        func()
+    elapsed = time.perf_counter() - start
+    print("{0:<32} {1:>10.0f} req/s".format(label, count / elapsed))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    server = start_stub_server()
+    api_url = "http://127.0.0.1:{0}".format(server.server_address[1])
+    client = Client(API_KEY, API_SECRET, api_url=api_url)
+    url = client.endpoints.get_signaling_url("SESSIONID")
+    payload = {"type": "bench", "data": "x"}
+
+    run(
+        "unpooled requests.post",
+        args.requests,
+        lambda: requests.post(url, json=payload, headers=client.get_json_headers()),
+    )
+    run(
+        "pooled transport",
+        args.requests,
+        lambda: client.transport.request(
+            "POST", url, json=payload, headers=client.get_json_headers()
+        ),
+    )
+    run(
+        "pooled Client.send_signal",
+        args.requests,
+        lambda: client.send_signal("SESSIONID", payload),
+    )
+
+    client.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Measures the time taken by import opentok, with python -X importtime, against a budget.
+
+Usage:
+
+    python benchmarks/import_time.py [--budget 50] [--runs 5] [--top 15]
+
+Each run imports the SDK in a new interpreter. The first run only writes the bytecode
+caches, as an installed package has them, and the fastest of the following --runs is
+reported. The command exits with status 1 when the import takes longer than --budget
+milliseconds or loads one of the HEAVY_MODULES, which the SDK only imports on first use.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BUDGET_MS = 50.0
+"""The longest time import opentok may take, in milliseconds."""
+
+HEAVY_MODULES = (
+    "aiohttp",
+    "asyncio",
+    "concurrent.futures",
+    "cryptography",
+    "jwt",
+    "pytz",
+    "requests",
+    "urllib3",
+    "uuid",
+    "xml.dom.minidom",
+)
+"""Modules that import opentok must not load."""
+
+_REPORT = "import json, sys; print(json.dumps([m for m in {0!r} if m in sys.modules]))"
+
+
+class ImportTime(object):
+    """
+    The result of measure(): total is the cumulative import time of the module, in seconds,
+    modules maps every module it imported to its own (self) import time, and loaded lists
+    the HEAVY_MODULES present once the statement has run.
+    """
+
+    def __init__(self, total, modules, loaded):
+        self.total = total
+        self.modules = modules
+        self.loaded = loaded
+
+    def slowest(self, count):
+        return sorted(self.modules.items(), key=lambda item: -item[1])[:count]
+
+
+def _run(statement, module, env):
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement + "\n" + _REPORT.format(HEAVY_MODULES)],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # every module is listed after the modules it imports, indented by its depth, so the
+    # modules imported by module are the lines since the previous top-level import
+    total = None
+    modules = {}
+    pending = {}
+    for line in output.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        pending[name.strip()] = int(self_us) / 1e6
+        if not name.startswith("  "):
+            if name.strip() == module:
+                total = int(cumulative_us) / 1e6
+                modules = pending
+            pending = {}
+    return total, modules, json.loads(output.stdout.splitlines()[-1])
+
+
+def measure(module="opentok", statement=None, runs=5):
+    """Imports module (or runs statement) in runs new interpreters, keeping the fastest run."""
+    statement = statement or "import " + module
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT, env.get("PYTHONPATH")]))
+    _run(statement, module, env)
+    best = None
+    for _ in range(max(1, runs)):
+        total, modules, loaded = _run(statement, module, env)
+        if best is None or total < best.total:
+            best = ImportTime(total, modules, loaded)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--budget", type=float, default=BUDGET_MS, help="in milliseconds")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="the slowest modules to list")
+    args = parser.parse_args()
+
+    result = measure(runs=args.runs)
+    for name, seconds in result.slowest(args.top):
+        print("{0:<50} {1:>8.2f} ms".format(name, seconds * 1e3))
+    print("{0:<50} {1:>8.2f} ms".format("import opentok", result.total * 1e3))
+
+    failed = False
+    if result.loaded:
+        print("import opentok loads " + ", ".join(result.loaded))
+        failed = True
+    if result.total * 1e3 > args.budget:
+        print("import opentok is over the budget of {0:.0f} ms".format(args.budget))
+        failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
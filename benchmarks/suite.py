@@ -0,0 +1,321 @@
+"""
+Micro-benchmarks of the SDK hot paths, with baselines to catch slowdowns.
+
+Usage:
+
+    python benchmarks/suite.py [--filter token] [--repeat 5]
+    python benchmarks/suite.py --save benchmarks/baselines/baseline.json
+    python benchmarks/suite.py --compare benchmarks/baselines/baseline.json [--threshold 0.25]
+
+Every benchmark is run with both OpenTok (HS256) and Vonage (RS256) credentials where the
+path depends on them. Each one is timed in batches sized by timeit's autorange, and the
+fastest of --repeat batches is reported, as the fastest run is the least disturbed by the
+rest of the machine. With --compare, the command exits with status 1 when a benchmark is
+more than --threshold (25% by default) slower than its baseline. Baselines depend on the
+machine: save a new one before comparing on other hardware.
+
+The request benchmarks send real HTTP requests to a local opentok.emulator.Emulator.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+from collections import OrderedDict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from opentok import Archive, ArchiveList, Client, Roles  # noqa: E402
+from opentok.emulator import Emulator  # noqa: E402
+from opentok.session import session_id_from_json, session_id_from_xml  # noqa: E402
+
+API_KEY = "123456"
+API_SECRET = "1234567890abcdef1234567890abcdef1234567890"
+PRIVATE_KEY = os.path.join(ROOT, "tests", "fake_data", "dummy_private_key.txt")
+SESSION_ID = "1_MX4xMjM0NTZ-flNhdCBNYXIgMTUgMTQ6NDI6MjMgUERUIDIwMTR-MC40OTAxMzAyNX4"
+ARCHIVE_ID = "b40ef09b-3811-4726-b508-e41a0f96c68f"
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "baselines", "baseline.json")
+
+BENCHMARKS = OrderedDict()
+
+
+def benchmark(name):
+    """Registers a function that sets a benchmark up and returns the callable to time."""
+
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+def archive_values(i=0):
+    return {
+        "createdAt": 1395183243556 + i,
+        "duration": 62,
+        "id": ARCHIVE_ID,
+        "name": "",
+        "partnerId": 123456,
+        "reason": "",
+        "sessionId": SESSION_ID,
+        "size": 8347554,
+        "status": "available",
+        "hasAudio": True,
+        "hasVideo": True,
+        "outputMode": "composed",
+        "url": "https://example.com/{0}/archive.mp4".format(i),
+    }
+
+
+class Context(object):
+    """The clients and the emulator shared by the benchmarks."""
+
+    def __init__(self):
+        self.emulator = Emulator().start()
+        self.clients = {
+            "opentok": Client(API_KEY, API_SECRET, api_url=self.emulator.url),
+            "vonage": Client(API_KEY, PRIVATE_KEY),
+        }
+        # Vonage clients always use the Vonage API URL: send their requests to the emulator
+        self.clients["vonage"].endpoints.api_url = self.emulator.url
+
+    def close(self):
+        for client in self.clients.values():
+            client.close()
+        self.emulator.stop()
+
+
+def per_credentials(name, setup):
+    for kind in ("opentok", "vonage"):
+        benchmark("{0}[{1}]".format(name, kind))(
+            lambda context, kind=kind: setup(context.clients[kind])
+        )
+
+
+per_credentials(
+    "generate_token.jwt",
+    lambda client: lambda: client.generate_token(SESSION_ID, Roles.publisher),
+)
+# T1 tokens can only be generated with OpenTok credentials
+@benchmark("generate_token.t1[opentok]")
+def generate_token_t1(context):
+    client = context.clients["opentok"]
+    return lambda: client.generate_token(SESSION_ID, Roles.publisher, use_jwt=False)
+
+
+per_credentials("auth_header.cached", lambda client: client._create_jwt_auth_header)
+per_credentials(
+    "auth_header.sign",
+    lambda client: lambda: client._sign_jwt_auth_header(int(time.time()), 180),
+)
+per_credentials("get_json_headers", lambda client: client.get_json_headers)
+
+
+@benchmark("endpoints.urls")
+def endpoints_urls(context):
+    endpoints = context.clients["opentok"].endpoints
+
+    def build():
+        endpoints.get_archive_url(ARCHIVE_ID)
+        endpoints.get_signaling_url(SESSION_ID, "CONNECTIONID")
+        endpoints.get_stream_url(SESSION_ID, "STREAMID")
+        endpoints.get_broadcast_url("BROADCASTID", stop=True)
+        endpoints.force_disconnect_url(SESSION_ID, "CONNECTIONID")
+
+    return build
+
+
+@benchmark("endpoints.family")
+def endpoints_family(context):
+    endpoints = context.clients["opentok"].endpoints
+    url = endpoints.get_signaling_url(SESSION_ID, "CONNECTIONID")
+    return lambda: endpoints.get_endpoint_family(url, "POST")
+
+
+@benchmark("archive.parse")
+def archive_parse(context):
+    client = context.clients["opentok"]
+    values = archive_values()
+    return lambda: Archive(client, values)
+
+
+@benchmark("archive_list.parse[1000]")
+def archive_list_parse(context):
+    client = context.clients["opentok"]
+    values = {"count": 1000, "items": [archive_values(i) for i in range(1000)]}
+    return lambda: ArchiveList(client, values)
+
+
+@benchmark("archive_list.iterate[1000]")
+def archive_list_iterate(context):
+    client = context.clients["opentok"]
+    archives = ArchiveList(
+        client, {"count": 1000, "items": [archive_values(i) for i in range(1000)]}
+    )
+    return lambda: [archive.id for archive in archives]
+
+
+def session_create_json(ice_servers=500):
+    """A /session/create JSON response, made large by its list of ICE servers."""
+    return json.dumps(
+        [
+            {
+                "session_id": SESSION_ID,
+                "project_id": API_KEY,
+                "partner_id": API_KEY,
+                "create_dt": "Fri Feb 14 05:14:54 PST 2025",
+                "media_server_url": "",
+                "properties": None,
+                "ice_servers": [
+                    {
+                        "urls": ["turn:turn{0}.example.com:443?transport=tcp".format(i)],
+                        "username": "user{0}".format(i),
+                        "credential": "x" * 40,
+                    }
+                    for i in range(ice_servers)
+                ],
+                "ice_credential_expiration": 86100,
+            }
+        ]
+    )
+
+
+def session_create_xml(properties=500):
+    """A legacy /session/create XML response, made large by its properties."""
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?><sessions><Session>'
+        "<session_id>{0}</session_id><partner_id>{1}</partner_id>"
+        "<create_dt>Mon Mar 17 00:41:31 PDT 2014</create_dt><properties>{2}</properties>"
+        "</Session></sessions>"
+    ).format(
+        SESSION_ID,
+        API_KEY,
+        "".join(
+            '<property name="p{0}" value="{1}"/>'.format(i, "x" * 40)
+            for i in range(properties)
+        ),
+    )
+
+
+@benchmark("session_create.parse_json[large]")
+def session_create_parse_json(context):
+    text = session_create_json()
+    return lambda: session_id_from_json(text)
+
+
+@benchmark("session_create.parse_xml[large]")
+def session_create_parse_xml(context):
+    text = session_create_xml()
+    return lambda: session_id_from_xml(text)
+
+
+def request_benchmarks(kind):
+    @benchmark("request.get_archive[{0}]".format(kind))
+    def get_archive(context):
+        client = context.clients[kind]
+        archive_id = client.start_archive(SESSION_ID + kind).id
+        return lambda: client.get_archive(archive_id)
+
+    @benchmark("request.create_session[{0}]".format(kind))
+    def create_session(context):
+        return context.clients[kind].create_session
+
+    @benchmark("request.send_signal[{0}]".format(kind))
+    def send_signal(context):
+        client = context.clients[kind]
+        payload = {"type": "bench", "data": "x"}
+        return lambda: client.send_signal(SESSION_ID, payload)
+
+
+request_benchmarks("opentok")
+request_benchmarks("vonage")
+
+
+def measure(func, repeat):
+    """Returns the fastest time of one call of func, in seconds."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(names, repeat):
+    context = Context()
+    results = OrderedDict()
+    try:
+        for name in names:
+            results[name] = measure(BENCHMARKS[name](context), repeat)
+            print(
+                "{0:<40} {1:>12.2f} us {2:>14.0f} ops/s".format(
+                    name, results[name] * 1e6, 1 / results[name]
+                )
+            )
+    finally:
+        context.close()
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Returns the (name, baseline, result) of the benchmarks slower than their baseline."""
+    regressions = []
+    for name, seconds in results.items():
+        reference = baseline.get(name)
+        if reference is not None and seconds > reference * (1 + threshold):
+            regressions.append((name, reference, seconds))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--filter", default="", help="only run benchmarks containing this")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", metavar="PATH", help="save the results as a baseline")
+    parser.add_argument("--compare", metavar="PATH", nargs="?", const=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.25)
+    args = parser.parse_args()
+
+    names = [name for name in BENCHMARKS if args.filter in name]
+    results = run(names, args.repeat)
+
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, "w") as f:
+            json.dump(
+                {
+                    "machine": {
+                        "python": platform.python_version(),
+                        "implementation": platform.python_implementation(),
+                        "platform": platform.platform(),
+                    },
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+            f.write("\n")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for name, reference, seconds in regressions:
+            print(
+                "SLOWER {0}: {1:.2f} us -> {2:.2f} us ({3:+.0%})".format(
+                    name, reference * 1e6, seconds * 1e6, seconds / reference - 1
+                )
+            )
+        if regressions:
+            sys.exit(1)
+        print(
+            "No benchmark is more than {0:.0%} slower than the baseline".format(
+                args.threshold
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
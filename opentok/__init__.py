@@ -1,13 +1,22 @@
 from .opentok import OpenTok, Client, Roles, MediaModes, ArchiveModes
+from .token_pool import TokenPool
+from .session_pool import SessionPool
+from .rate_limit import RateLimiter
+from .circuit_breaker import CircuitBreaker, CircuitState
+from .instrumentation import RequestMetrics, LatencyHistogram
 from .session import Session
-from .archives import Archive, ArchiveList, OutputModes, StreamModes
+from .archives import Archive, ArchiveList, ArchiveColumns, OutputModes, StreamModes
+from .archive_watcher import ArchiveWatcher
 from .exceptions import (
     OpenTokException,
     AuthError,
     ForceDisconnectError,
     ArchiveError,
+    ArchiveTimeoutError,
     SetStreamClassError,
-    BroadcastError
+    BroadcastError,
+    RateLimitError,
+    CircuitOpenError,
 )
 from .version import __version__
 from .stream import Stream
@@ -16,3 +25,21 @@ from .sip_call import SipCall
 from .broadcast import Broadcast, BroadcastStreamModes
 from .render import Render, RenderList
 from .websocket_audio_connection import WebSocketAudioConnection
+
+# AsyncClient (asyncio) and RetryPolicy (requests) are imported on first access, so that
+# import opentok stays fast for applications that do not use them.
+_LAZY_ATTRIBUTES = {"AsyncClient": ".async_client", "RetryPolicy": ".retry"}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        from importlib import import_module
+
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,292 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+
+from .exceptions import ArchiveError
+
+logger = logging.getLogger("opentok")
+
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+)")
+# the ETag of an S3 object uploaded in a single part is the MD5 of its content; multipart
+# ETags end with "-<number of parts>" and cannot be checked without the part sizes
+_MD5_ETAG = re.compile(r'^(?:W/)?"?([0-9a-f]{32})"?$')
+
+
+class _IncompleteChunk(Exception):
+    """For internal use. A chunk that should be downloaded again."""
+
+
+class _ArchiveDownload(object):
+    """
+    For internal use.
+    Downloads the MP4 file of an archive with concurrent HTTP Range requests.
+
+    The file is downloaded to path + ".part", preallocated to its full size, and every chunk
+    is written at its offset. The offsets of the completed chunks are kept in
+    path + ".part.json", so that a download interrupted by an error or a crash resumes with
+    the missing chunks, as long as the file (its size and ETag) and the chunk size have not
+    changed. Once every chunk is written, the size of the file and, when the ETag is an MD5,
+    its checksum are verified, and the file is renamed to path.
+
+    The download URL of an archive expires after 10 minutes. When a request is rejected with
+    403, a new URL is fetched with get_archive() and the request is sent again.
+    """
+
+    retries = 3
+    """The number of times a chunk is downloaded again after a network error."""
+
+    def __init__(self, archive, path, parallelism=4, chunk_size=8 << 20, verify=True):
+        from .transport import Transport
+
+        if not isinstance(archive.sdk.transport, Transport):
+            raise ArchiveError("Archive.download() needs an archive returned by a Client")
+        if parallelism < 1 or chunk_size < 1:
+            raise ValueError("parallelism and chunk_size must be positive")
+        self.archive = archive
+        self.client = archive.sdk
+        self.path = path
+        self.part_path = path + ".part"
+        self.state_path = path + ".part.json"
+        self.parallelism = parallelism
+        self.chunk_size = chunk_size
+        self.verify = verify
+        self.url = archive.url
+        self.size = None
+        self.etag = None
+        self.done = set()  # offsets of the chunks written to the part file
+        self.refreshes = 0
+        self._failed = False
+        self._lock = threading.Lock()
+
+    def run(self):
+        """Downloads the file and returns its path."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        if not self.url:
+            self._refresh()
+        with self._probe() as response:
+            if response.status_code == 200:
+                # the server ignores Range headers: the file comes in one piece
+                size = int(
+                    response.headers.get("Content-Length", self.archive.size or 0)
+                )
+                self._start(size, response.headers.get("ETag"), resume=False)
+                self._write(response, 0, size)
+                self.done.add(0)
+                return self._finish()
+            self._start(self._total_size(response), response.headers.get("ETag"))
+
+        pending = [
+            offset
+            for offset in range(0, self.size, self.chunk_size)
+            if offset not in self.done
+        ]
+        with ThreadPoolExecutor(
+            min(self.parallelism, max(1, len(pending))),
+            thread_name_prefix="opentok-archive-download",
+        ) as executor:
+            futures = [executor.submit(self._download_chunk, offset) for offset in pending]
+        for future in futures:
+            future.result()
+        return self._finish()
+
+    def _probe(self):
+        """Requests the first byte of the file, to learn its size and ETag."""
+        import requests
+
+        for _ in range(self.retries + 1):
+            try:
+                return self._request(0, 0)
+            except (_IncompleteChunk, requests.RequestException) as e:
+                error = e
+        raise ArchiveError(
+            "Could not download archive {0}: {1}".format(self.archive.id, error)
+        )
+
+    def _total_size(self, response):
+        match = _CONTENT_RANGE.match(response.headers.get("Content-Range", ""))
+        if match is None:
+            raise ArchiveError(
+                "Invalid Content-Range in the download of archive {0}: {1!r}".format(
+                    self.archive.id, response.headers.get("Content-Range")
+                )
+            )
+        return int(match.group(3))
+
+    def _start(self, size, etag, resume=True):
+        """Creates the part file, or keeps the one of a previous download of the same file."""
+        if self.archive.size and size != self.archive.size:
+            raise ArchiveError(
+                "The download of archive {0} is {1} bytes, but the archive is {2} "
+                "bytes".format(self.archive.id, size, self.archive.size)
+            )
+        self.size, self.etag = size, etag
+        state = self._load_state() if resume else None
+        if (
+            state is not None
+            and state.get("size") == size
+            and state.get("etag") == etag
+            and state.get("chunk_size") == self.chunk_size
+            and os.path.exists(self.part_path)
+            and os.path.getsize(self.part_path) == size
+        ):
+            self.done = set(state.get("done", ()))
+            logger.debug(
+                "Resuming the download of archive %s: %d of %d chunks are complete",
+                self.archive.id,
+                len(self.done),
+                -(-size // self.chunk_size),
+            )
+            return
+        self.done = set()
+        with open(self.part_path, "wb") as f:
+            f.truncate(size)
+        self._save_state()
+
+    def _load_state(self):
+        try:
+            with open(self.state_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save_state(self):
+        state = {
+            "size": self.size,
+            "etag": self.etag,
+            "chunk_size": self.chunk_size,
+            "done": sorted(self.done),
+        }
+        temporary = self.state_path + ".tmp"
+        with open(temporary, "w") as f:
+            json.dump(state, f)
+        os.replace(temporary, self.state_path)
+
+    def _refresh(self, expired_url=None):
+        """Fetches a new download URL, unless another thread already has."""
+        with self._lock:
+            if expired_url is not None and self.url != expired_url:
+                return
+            archive = self.client.get_archive(self.archive.id)
+            self.refreshes += 1
+            self.archive.status = archive.status
+            self.archive.size = archive.size
+            self.archive.url = archive.url
+            if not archive.url:
+                raise ArchiveError(
+                    "Archive {0} cannot be downloaded, its status is {1}".format(
+                        archive.id, archive.status
+                    )
+                )
+            self.url = archive.url
+
+    def _request(self, start, end):
+        """
+        Sends a Range request for the bytes start to end (included), with a new download URL
+        when the current one has expired. Returns the streamed response.
+        """
+        for _ in range(self.retries + 1):
+            url = self.url
+            response = self.client.transport.request(
+                "GET",
+                url,
+                headers={"Range": "bytes={0}-{1}".format(start, end)},
+                stream=True,
+                proxies=self.client.proxies,
+                timeout=self.client.timeout,
+            )
+            if response.status_code in (200, 206):
+                return response
+            response.close()
+            if response.status_code == 403:
+                # S3 rejects expired pre-signed URLs with 403
+                self._refresh(url)
+            elif response.status_code >= 500:
+                raise _IncompleteChunk("HTTP {0}".format(response.status_code))
+            else:
+                break
+        raise ArchiveError(
+            "Could not download archive {0}: HTTP {1}".format(
+                self.archive.id, response.status_code
+            )
+        )
+
+    def _download_chunk(self, offset):
+        import requests
+
+        length = min(self.chunk_size, self.size - offset)
+        for attempt in range(self.retries + 1):
+            if self._failed:
+                return
+            try:
+                with self._request(offset, offset + length - 1) as response:
+                    if response.status_code != 206:
+                        raise _IncompleteChunk("the server ignored the Range header")
+                    match = _CONTENT_RANGE.match(response.headers.get("Content-Range", ""))
+                    if match is None or int(match.group(1)) != offset:
+                        raise _IncompleteChunk("unexpected Content-Range")
+                    self._write(response, offset, length)
+            except (_IncompleteChunk, requests.RequestException) as e:
+                error = e
+                logger.debug(
+                    "Could not download bytes %d-%d of archive %s (attempt %d): %s",
+                    offset,
+                    offset + length - 1,
+                    self.archive.id,
+                    attempt + 1,
+                    e,
+                )
+                continue
+            except BaseException:
+                self._failed = True
+                raise
+            with self._lock:
+                self.done.add(offset)
+                self._save_state()
+            return
+        self._failed = True
+        raise ArchiveError(
+            "Could not download bytes {0}-{1} of archive {2}: {3}".format(
+                offset, offset + length - 1, self.archive.id, error
+            )
+        )
+
+    def _write(self, response, offset, length):
+        written = 0
+        with open(self.part_path, "r+b") as f:
+            f.seek(offset)
+            for block in response.iter_content(1 << 16):
+                if written + len(block) > length:
+                    raise _IncompleteChunk("more than {0} bytes received".format(length))
+                f.write(block)
+                written += len(block)
+        if written != length:
+            raise _IncompleteChunk("{0} of {1} bytes received".format(written, length))
+
+    def _finish(self):
+        size = os.path.getsize(self.part_path)
+        if size != self.size:
+            raise ArchiveError(
+                "The download of archive {0} is {1} bytes instead of {2}".format(
+                    self.archive.id, size, self.size
+                )
+            )
+        match = _MD5_ETAG.match(self.etag or "")
+        if self.verify and match is not None:
+            md5 = hashlib.md5()
+            with open(self.part_path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    md5.update(block)
+            if md5.hexdigest() != match.group(1):
+                # the chunks cannot be trusted: the next download starts over
+                os.remove(self.state_path)
+                raise ArchiveError(
+                    "The checksum of the download of archive {0} does not match its "
+                    "ETag".format(self.archive.id)
+                )
+        os.replace(self.part_path, self.path)
+        os.remove(self.state_path)
+        return self.path
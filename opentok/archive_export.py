@@ -0,0 +1,115 @@
+import csv
+import json
+from datetime import datetime
+from enum import Enum
+
+
+EXPORT_FIELDS = (
+    "id",
+    "session_id",
+    "name",
+    "status",
+    "created_at",
+    "duration",
+    "size",
+    "output_mode",
+    "stream_mode",
+    "has_audio",
+    "has_video",
+    "resolution",
+    "url",
+)
+"""The archive fields written by write_ndjson() and write_csv(), in column order."""
+
+
+def _export_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def archive_record(archive, fields=EXPORT_FIELDS):
+    """
+    Returns a dictionary of the fields of an Archive with JSON serializable values: datetimes
+    are converted to ISO 8601 strings and enums to their values.
+    """
+    return dict(
+        (field, _export_value(getattr(archive, field, None))) for field in fields
+    )
+
+
+class NDJSONWriter(object):
+    """
+    Writes archives to a text file-like object as newline delimited JSON, one archive per
+    line.
+
+    :param fp: The text file-like object written to.
+
+    :param tuple fields: Optional. The archive fields to write.
+    """
+
+    def __init__(self, fp, fields=EXPORT_FIELDS):
+        self.fp = fp
+        self.fields = fields
+        self.count = 0
+        self._dumps = json.JSONEncoder(separators=(",", ":")).encode
+
+    def write(self, archive):
+        self.fp.write(self._dumps(archive_record(archive, self.fields)))
+        self.fp.write("\n")
+        self.count += 1
+
+
+class CSVWriter(object):
+    """
+    Writes archives to a text file-like object as CSV, one archive per row. Open files with
+    newline="" as required by the csv module.
+
+    :param fp: The text file-like object written to.
+
+    :param tuple fields: Optional. The archive fields to write, one per column.
+
+    :param bool header: Optional. Whether to write a first row with the field names.
+    """
+
+    def __init__(self, fp, fields=EXPORT_FIELDS, header=True):
+        self.fields = fields
+        self.count = 0
+        self._writer = csv.writer(fp)
+        if header:
+            self._writer.writerow(fields)
+
+    def write(self, archive):
+        self._writer.writerow(
+            [_export_value(getattr(archive, field, None)) for field in self.fields]
+        )
+        self.count += 1
+
+
+EXPORT_WRITERS = {"ndjson": NDJSONWriter, "csv": CSVWriter}
+
+
+def write_ndjson(archives, fp, fields=EXPORT_FIELDS):
+    """
+    Writes archives to a text file-like object as newline delimited JSON, as they are read
+    from the archives iterable (an ArchiveList or the iterator returned by
+    Client.iter_archives(), for example). Returns the number of archives written.
+    """
+    writer = NDJSONWriter(fp, fields)
+    for archive in archives:
+        writer.write(archive)
+    return writer.count
+
+
+def write_csv(archives, fp, fields=EXPORT_FIELDS, header=True):
+    """
+    Writes archives to a text file-like object as CSV, as they are read from the archives
+    iterable (an ArchiveList or the iterator returned by Client.iter_archives(), for
+    example). Returns the number of archives written.
+    """
+    writer = CSVWriter(fp, fields, header)
+    for archive in archives:
+        writer.write(archive)
+    return writer.count
@@ -0,0 +1,311 @@
+import logging
+import threading
+import time
+
+from .exceptions import ArchiveError, ArchiveTimeoutError, NotFoundError
+
+logger = logging.getLogger("opentok")
+
+READY_STATES = frozenset(["available", "uploaded"])
+"""The statuses of an archive that can be downloaded."""
+
+FAILED_STATES = frozenset(["failed", "deleted", "expired"])
+"""The statuses of an archive that will never become available."""
+
+
+class _ArchiveWait(object):
+    """
+    For internal use.
+    The state of a wait for an archive to reach one of the given statuses, and the adaptive
+    delays between two polls of the archive.
+
+    Processing a stopped archive takes time roughly proportional to its duration. Until
+    processing_ratio times the duration has elapsed since the wait started, the delay halves
+    the time left to that point, so the archive is polled rarely at first and more often as
+    it gets close to ready. Past that point, the delay starts at min_interval and grows by
+    backoff at every poll. Delays are always between min_interval and max_interval.
+    """
+
+    def __init__(
+        self,
+        archive_id,
+        states=READY_STATES,
+        timeout=None,
+        min_interval=1.0,
+        max_interval=30.0,
+        processing_ratio=0.1,
+        backoff=1.5,
+        session_id=None,
+    ):
+        self.archive_id = archive_id
+        self.session_id = session_id
+        self.states = frozenset(states)
+        self.timeout = timeout
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.processing_ratio = processing_ratio
+        self.backoff = backoff
+        self.started = time.monotonic()
+        self.status = None
+        self.late_polls = 0
+        self.next_poll = self.started
+
+    def done(self, archive):
+        """
+        Records the polled archive. Returns True when it has reached one of the states, and
+        raises an ArchiveError when it has failed, been deleted or expired.
+        """
+        self.status = archive.status
+        if self.session_id is None:
+            self.session_id = archive.session_id
+        if archive.status in self.states:
+            return True
+        if archive.status in FAILED_STATES:
+            raise ArchiveError(
+                "Archive {0} is {1}".format(self.archive_id, archive.status)
+            )
+        return False
+
+    def next_delay(self, archive=None):
+        """
+        Returns the number of seconds to wait before the next poll, or raises an
+        ArchiveTimeoutError once the timeout has passed.
+        """
+        now = time.monotonic()
+        elapsed = now - self.started
+        expected = self.processing_ratio * ((archive and archive.duration) or 0)
+        if expected - elapsed > self.min_interval:
+            delay = (expected - elapsed) / 2
+        else:
+            delay = self.min_interval * self.backoff ** self.late_polls
+            self.late_polls += 1
+        delay = min(self.max_interval, max(self.min_interval, delay))
+        if self.timeout is not None:
+            remaining = self.timeout - elapsed
+            if remaining <= 0:
+                raise ArchiveTimeoutError(
+                    "Archive {0} is still {1} after {2} seconds".format(
+                        self.archive_id, self.status, self.timeout
+                    )
+                )
+            delay = min(delay, remaining)
+        self.next_poll = now + delay
+        return delay
+
+
+class ArchiveWatcher(object):
+    """
+    Watches many archives until they can be downloaded, for example to post-process them
+    after stop_archive().
+
+    A background thread polls every watched archive with adaptive delays (see
+    Client.wait_for_archive()). The archives of a session that are due at the same time are
+    polled with a single get_archives() call, which also refreshes the other watched
+    archives of that session.
+
+    watch() returns a concurrent.futures.Future that is resolved with the Archive once it
+    reaches one of the states, or fails with an ArchiveError when the archive fails, is
+    deleted or expires, and with an ArchiveTimeoutError after timeout seconds.
+
+    :param Client client: The client used to poll the archives.
+
+    :param callable on_change: Optional. Called with the Archive and its previous status
+        (None the first time it is polled) every time the status of a watched archive
+        changes, on the thread of the watcher.
+
+    :param states: The statuses that complete the watch of an archive.
+
+    :param float timeout: Optional. The number of seconds after which a watch fails.
+
+    :param float min_interval: The shortest delay between two polls of an archive, in seconds.
+
+    :param float max_interval: The longest delay between two polls of an archive, in seconds.
+
+    :param float processing_ratio: The expected processing time of a stopped archive, as a
+        fraction of its duration.
+
+    :ivar int requests: The number of requests sent to the OpenTok API.
+    """
+
+    def __init__(
+        self,
+        client,
+        on_change=None,
+        states=READY_STATES,
+        timeout=None,
+        min_interval=1.0,
+        max_interval=30.0,
+        processing_ratio=0.1,
+    ):
+        self.client = client
+        self.on_change = on_change
+        self.states = frozenset(states)
+        self.timeout = timeout
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.processing_ratio = processing_ratio
+        self.requests = 0
+        self._watches = {}  # archive_id -> (_ArchiveWait, Future)
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._poll_loop, name="opentok-archive-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def watch(self, archive_id, session_id=None):
+        """
+        Starts watching an archive and returns the Future of its watch. Pass the session ID
+        of the archive when it is known, to poll it together with the other archives of its
+        session from the start. Watching an archive twice returns the same Future.
+        """
+        from concurrent.futures import Future
+
+        with self._condition:
+            if archive_id in self._watches:
+                return self._watches[archive_id][1]
+            wait = _ArchiveWait(
+                archive_id,
+                self.states,
+                self.timeout,
+                self.min_interval,
+                self.max_interval,
+                self.processing_ratio,
+                session_id=session_id,
+            )
+            future = Future()
+            self._watches[archive_id] = (wait, future)
+            self._condition.notify()
+        return future
+
+    def unwatch(self, archive_id):
+        """Stops watching an archive. Its Future is cancelled."""
+        with self._condition:
+            watch = self._watches.pop(archive_id, None)
+        if watch is not None:
+            watch[1].cancel()
+
+    def watching(self):
+        """Returns the IDs of the archives being watched."""
+        with self._condition:
+            return list(self._watches)
+
+    def close(self):
+        """Stops the background thread. The Futures of the remaining watches are cancelled."""
+        with self._condition:
+            self._closed = True
+            watches = list(self._watches.values())
+            self._watches.clear()
+            self._condition.notify()
+        self._thread.join()
+        for _, future in watches:
+            future.cancel()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _due(self):
+        """Returns the watches due for a poll, grouped by session ID (None when unknown)."""
+        now = time.monotonic()
+        groups = {}
+        for wait, _ in self._watches.values():
+            if wait.next_poll <= now:
+                groups.setdefault(wait.session_id, []).append(wait)
+        return groups
+
+    def _poll_loop(self):
+        while True:
+            with self._condition:
+                groups = self._due()
+                while not groups and not self._closed:
+                    timeout = min(
+                        [wait.next_poll for wait, _ in self._watches.values()],
+                        default=time.monotonic() + self.max_interval,
+                    ) - time.monotonic()
+                    self._condition.wait(max(0, timeout))
+                    groups = self._due()
+                if self._closed:
+                    return
+
+            for session_id, waits in groups.items():
+                if session_id is None or len(waits) == 1:
+                    for wait in waits:
+                        self._poll_archive(wait)
+                else:
+                    self._poll_session(session_id, waits)
+
+    def _poll_archive(self, wait):
+        self.requests += 1
+        try:
+            archive = self.client.get_archive(wait.archive_id)
+        except NotFoundError as e:
+            self._finish(wait, exception=e)
+        except Exception:
+            logger.exception("Could not poll archive %s", wait.archive_id)
+            self._reschedule(wait)
+        else:
+            self._update(wait, archive)
+
+    def _poll_session(self, session_id, waits):
+        self.requests += 1
+        try:
+            archives = self.client.get_archives(session_id=session_id, count=1000)
+        except Exception:
+            logger.exception("Could not poll the archives of session %s", session_id)
+            for wait in waits:
+                self._reschedule(wait)
+            return
+
+        archives = {archive.id: archive for archive in archives}
+        with self._condition:
+            # every watched archive of the session is refreshed, not only the due ones
+            session_waits = [
+                wait
+                for wait, _ in self._watches.values()
+                if wait.session_id == session_id and wait.archive_id in archives
+            ]
+        for wait in session_waits:
+            self._update(wait, archives[wait.archive_id])
+        for wait in waits:
+            if wait.archive_id not in archives:
+                self._poll_archive(wait)
+
+    def _update(self, wait, archive):
+        previous = wait.status
+        error = None
+        try:
+            done = wait.done(archive)
+        except ArchiveError as e:
+            done, error = False, e
+        if archive.status != previous and self.on_change is not None:
+            try:
+                self.on_change(archive, previous)
+            except Exception:
+                logger.exception("Exception in the on_change callback of ArchiveWatcher")
+        if error is not None:
+            self._finish(wait, exception=error)
+        elif done:
+            self._finish(wait, result=archive)
+        else:
+            self._reschedule(wait, archive)
+
+    def _reschedule(self, wait, archive=None):
+        try:
+            wait.next_delay(archive)
+        except ArchiveTimeoutError as e:
+            self._finish(wait, exception=e)
+
+    def _finish(self, wait, result=None, exception=None):
+        with self._condition:
+            watch = self._watches.get(wait.archive_id)
+            if watch is None or watch[0] is not wait:
+                return
+            del self._watches[wait.archive_id]
+        future = watch[1]
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
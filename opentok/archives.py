@@ -1,7 +1,7 @@
 from datetime import datetime, date
 from six import iteritems, PY2, PY3, u
 import json
-import pytz
+from sys import intern
 from enum import Enum
 
 from .exceptions import ArchiveError
@@ -12,6 +12,11 @@ if PY3:
 # compat
 from six.moves import map
 
+def _shared(value):
+    """Interns the strings that repeat across archives, such as session IDs and statuses."""
+    return intern(value) if isinstance(value, str) else value
+
+
 dthandler = lambda obj: (
     obj.isoformat() if isinstance(obj, datetime) or isinstance(obj, date) else None
 )
@@ -116,33 +121,66 @@ class Archive(object):
     :ivar quantization_parameter: The quantization parameter (QP) for video encoding quality. Values between 15-40, where smaller values generate higher quality and larger archives.
     """
 
+    __slots__ = (
+        "sdk",
+        "id",
+        "name",
+        "status",
+        "session_id",
+        "partner_id",
+        "_created_at",
+        "size",
+        "duration",
+        "has_audio",
+        "has_video",
+        "output_mode",
+        "stream_mode",
+        "streams",
+        "url",
+        "resolution",
+        "max_bitrate",
+        "quantization_parameter",
+    )
+
     def __init__(self, sdk, values):
         self.sdk = sdk
         self.id = values.get("id")
         self.name = values.get("name")
-        self.status = values.get("status")
-        self.session_id = values.get("sessionId")
+        self.status = _shared(values.get("status"))
+        self.session_id = _shared(values.get("sessionId"))
         self.partner_id = values.get("partnerId")
-        if PY2:
-            self.created_at = datetime.fromtimestamp(
-                values.get("createdAt") / 1000, pytz.UTC
-            )
-        if PY3:
-            self.created_at = datetime.fromtimestamp(
-                values.get("createdAt") // 1000, timezone.utc
-            )
+        # converted to a datetime on first access
+        self._created_at = values.get("createdAt")
         self.size = values.get("size")
         self.duration = values.get("duration")
         self.has_audio = values.get("hasAudio")
         self.has_video = values.get("hasVideo")
-        self.output_mode = OutputModes[values.get("outputMode", "composed")]
-        self.stream_mode = values.get("streamMode", StreamModes.auto)
+        self.output_mode = OutputModes[values.get("outputMode") or "composed"]
+        stream_mode = values.get("streamMode")
+        self.stream_mode = StreamModes.auto if stream_mode is None else _shared(stream_mode)
         self.streams = values.get("streams")
         self.url = values.get("url")
-        self.resolution = values.get("resolution")
+        self.resolution = _shared(values.get("resolution"))
         self.max_bitrate = values.get("maxBitrate")
         self.quantization_parameter = values.get("quantizationParameter")
 
+    @property
+    def created_at(self):
+        created_at = self._created_at
+        if isinstance(created_at, int):
+            if PY2:
+                import pytz
+
+                created_at = datetime.fromtimestamp(created_at / 1000, pytz.UTC)
+            if PY3:
+                created_at = datetime.fromtimestamp(created_at // 1000, timezone.utc)
+            self._created_at = created_at
+        return created_at
+
+    @created_at.setter
+    def created_at(self, value):
+        self._created_at = value
+
     def stop(self):
         """
         Stops an OpenTok archive that is being recorded.
@@ -165,11 +203,44 @@ class Archive(object):
         self.sdk.delete_archive(self.id)
         # TODO: invalidate this object
 
+    def download(self, path, parallelism=4, chunk_size=8 * 1024 * 1024, verify=True):
+        """
+        Downloads the MP4 file of an archive with the status "available" to path, and returns
+        path.
+
+        The file is split into chunks of chunk_size bytes, which are downloaded with up to
+        parallelism concurrent HTTP Range requests, through the connection pool of the Client,
+        and written at their offsets in path + ".part". The download URL is only valid for
+        10 minutes: when it expires during the download, a new one is fetched with
+        get_archive().
+
+        When a chunk still fails after 4 attempts, an ArchiveError is raised and the completed
+        chunks are kept: calling download() again with the same path and chunk_size resumes
+        the download. Once complete, the size of the file is checked against the size of the
+        archive and, when verify is True and the ETag of the file is an MD5 checksum (as for
+        files uploaded in a single part), its checksum is checked too.
+
+        :param String path: The path of the downloaded file.
+
+        :param int parallelism: The maximum number of chunks downloaded at the same time.
+
+        :param int chunk_size: The size of the chunks, in bytes.
+
+        :param bool verify: Whether to check the MD5 checksum of the downloaded file.
+        """
+        from .archive_download import _ArchiveDownload
+
+        return _ArchiveDownload(self, path, parallelism, chunk_size, verify).run()
+
     def attrs(self):
         """
         Returns a dictionary of the archive's attributes.
         """
-        return dict((k, v) for k, v in iteritems(self.__dict__) if k != "sdk")
+        return dict(
+            (k.lstrip("_"), getattr(self, k.lstrip("_")))
+            for k in self.__slots__
+            if k != "sdk"
+        )
 
     def json(self):
         """
@@ -181,11 +252,10 @@ class Archive(object):
 class ArchiveList(object):
     def __init__(self, sdk, values):
         self.count = values.get("count")
-        self.items = list(map(lambda x: Archive(sdk, x), values.get("items", [])))
+        self.items = [Archive(sdk, item) for item in values.get("items", [])]
 
     def __iter__(self):
-        for x in self.items:
-            yield x
+        return iter(self.items)
 
     def attrs(self):
         return {"count": self.count, "items": map(Archive.attrs, self.items)}
@@ -194,7 +264,7 @@ class ArchiveList(object):
         return json.dumps(self.attrs(), default=dthandler, indent=4)
 
     def __getitem__(self, key):
-        return self.items.get(key)
+        return self.items[key]
 
     def __setitem__(self, key, item):
         raise ArchiveError(
@@ -203,3 +273,69 @@ class ArchiveList(object):
 
     def __len__(self):
         return len(self.items)
+
+    def columns(self):
+        """
+        Returns an ArchiveColumns view of the archives in this list.
+        """
+        return ArchiveColumns(self)
+
+
+class ArchiveColumns(object):
+    """
+    A columnar view of archives: one list per field, with the values of the n-th archive at
+    index n of every list. Totals over many archives can be computed in a single pass over
+    a column, without keeping Archive objects around.
+
+    :param archives: Optional. An iterable of Archive objects, such as an ArchiveList or the
+        iterator returned by Client.iter_archives().
+
+    :ivar id: The archive IDs.
+    :ivar session_id: The session IDs.
+    :ivar size: The sizes of the archive files, in bytes.
+    :ivar duration: The durations, in seconds.
+    :ivar created_at: The creation times, as datetime objects.
+    :ivar status: The statuses.
+    """
+
+    FIELDS = ("id", "session_id", "size", "duration", "created_at", "status")
+
+    def __init__(self, archives=()):
+        for field in self.FIELDS:
+            setattr(self, field, [])
+        self.extend(archives)
+
+    def append(self, archive):
+        """Adds the fields of an Archive to the columns."""
+        for field in self.FIELDS:
+            getattr(self, field).append(getattr(archive, field))
+
+    def extend(self, archives):
+        """Adds the fields of every Archive of an iterable to the columns."""
+        for archive in archives:
+            self.append(archive)
+
+    def __len__(self):
+        return len(self.id)
+
+    def total_size(self):
+        """Returns the storage used by the archives, in bytes."""
+        return sum(size or 0 for size in self.size)
+
+    def total_duration(self):
+        """Returns the total duration of the archives, in seconds."""
+        return sum(duration or 0 for duration in self.duration)
+
+    def size_by_session(self):
+        """Returns a dictionary of the storage used by the archives of each session, in bytes."""
+        totals = {}
+        for session_id, size in zip(self.session_id, self.size):
+            totals[session_id] = totals.get(session_id, 0) + (size or 0)
+        return totals
+
+    def minutes_by_session(self):
+        """Returns a dictionary of the archived minutes of each session."""
+        totals = {}
+        for session_id, duration in zip(self.session_id, self.duration):
+            totals[session_id] = totals.get(session_id, 0) + (duration or 0)
+        return dict((session_id, seconds / 60.0) for session_id, seconds in totals.items())
@@ -0,0 +1,259 @@
+import asyncio
+import time
+
+from . import tracing
+from .exceptions import OpenTokException
+from .opentok import Client
+from .archive_watcher import READY_STATES, _ArchiveWait
+from .archives import ArchiveList
+from .bulk import run_concurrently_async
+from .pagination import aiter_pages, afetch_all_pages, merge_pages
+from .render import RenderList
+from .transport import AsyncTransport
+
+
+class AsyncClient(Client):
+    """
+    An asyncio version of the Client class.
+
+    Every method of Client that calls the OpenTok REST API (create_session, start_archive,
+    send_signal, list_streams, force_disconnect, start_broadcast, start_render, mute_all,
+    play_dtmf and the rest) is awaitable on AsyncClient. The methods take the same
+    parameters, run the same validation and return the same model objects (Archive,
+    Broadcast, Render, StreamList, ...) or raise the same exceptions as their Client
+    counterparts. Methods that do not call the REST API, such as generate_token, are
+    unchanged.
+
+    Requests are sent through a pooled aiohttp connector, so many calls can run concurrently
+    on a single event loop thread::
+
+        async with AsyncClient(api_key, api_secret) as client:
+            await asyncio.gather(
+                *(client.force_disconnect(session_id, c) for c in connection_ids)
+            )
+
+    AsyncClient requires the aiohttp package (pip install opentok[async]).
+
+    Note that the convenience methods of the returned model objects, such as Archive.stop()
+    and Archive.delete(), are blocking helpers for Client: with AsyncClient, call
+    ``await client.stop_archive(archive.id)`` instead.
+
+    :param int pool_connections: Together with pool_maxsize, sets the total number of
+        simultaneous connections (pool_connections * pool_maxsize).
+
+    :param int pool_maxsize: The maximum number of simultaneous connections to the API host.
+
+    :param float pool_idle_timeout: The number of seconds an unused keep-alive connection is
+        kept open.
+    """
+
+    def __init__(
+        self,
+        api_key,
+        api_secret,
+        api_url="https://api.opentok.com",
+        timeout=None,
+        app_version=None,
+        pool_connections=10,
+        pool_maxsize=10,
+        pool_idle_timeout=None,
+        retry_policy=None,
+        rate_limiter=None,
+        circuit_breaker=None,
+        tracer=None,
+    ):
+        super(AsyncClient, self).__init__(
+            api_key,
+            api_secret,
+            api_url=api_url,
+            timeout=timeout,
+            app_version=app_version,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_idle_timeout=pool_idle_timeout,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            tracer=tracer,
+        )
+        self._transport = AsyncTransport(
+            limit=pool_connections * pool_maxsize,
+            limit_per_host=pool_maxsize,
+            idle_timeout=pool_idle_timeout,
+        )
+
+    async def _send(self, request):
+        self._prepare_request(request)
+        attempt = 1
+        while True:
+            try:
+                response = await self._send_once(request)
+            except Exception as e:
+                delay = self._retry_delay(request, attempt, exception=e)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_delay(request, attempt, response=response)
+                if delay is None:
+                    return response
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send_once(self, request):
+        request.attempts += 1
+        # an open circuit fails fast, without waiting for or using up a rate limit token
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_request(request.family)
+        if self.rate_limiter is not None:
+            try:
+                await self.rate_limiter.acquire_async(request.family)
+            except BaseException:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.cancel_request(request.family)
+                raise
+        self._log_request(request)
+        kwargs = self._transport_kwargs(request)
+        metrics = self._start_metrics(request, kwargs)
+        start = time.monotonic()
+        try:
+            response = await self._transport_request(request, kwargs)
+        except BaseException as e:
+            # cancelled and interrupted requests count as failures too, so that a probe
+            # request of a half-open circuit is always accounted for
+            self._record_outcome(request, start, exception=e, metrics=metrics)
+            raise
+        self._record_outcome(request, start, response=response, metrics=metrics)
+        return response
+
+    async def _transport_request(self, request, kwargs):
+        if self.tracer is None:
+            return await self._transport.request(request.method, request.url, **kwargs)
+        with tracing.request_span(self.tracer, request) as span:
+            response = await self._transport.request(request.method, request.url, **kwargs)
+            tracing.record_response(span, response)
+            return response
+
+    async def _run(self, operation):
+        if self.tracer is None:
+            return await self._drive(operation)
+        with tracing.OperationTrace(self.tracer, operation) as trace:
+            return trace.finish(await self._drive(operation, trace))
+
+    async def _drive(self, operation, trace=None):
+        try:
+            request = next(operation)
+            while True:
+                try:
+                    response = await self._send(request)
+                except Exception as e:
+                    if trace is not None:
+                        trace.record(request)
+                    request = operation.throw(e)
+                else:
+                    if trace is not None:
+                        trace.record(request, response)
+                    request = operation.send(response)
+        except StopIteration as e:
+            return e.value
+
+    def iter_archives(self, session_id=None, page_size=100, prefetch=1):
+        """
+        Returns an asynchronous iterator over every archive for your API key, see
+        Client.iter_archives(). The next pages are fetched in tasks on the event loop::
+
+            async for archive in client.iter_archives():
+                ...
+        """
+        if not 0 < page_size <= 1000:
+            raise OpenTokException("page_size must be between 1 and 1000")
+
+        def fetch_page(offset, count):
+            return self.get_archives(offset=offset, count=count, session_id=session_id)
+
+        return self._aiter_unique_archives(aiter_pages(fetch_page, page_size, prefetch))
+
+    @staticmethod
+    async def _aiter_unique_archives(pages):
+        previous_ids = set()
+        async for page in pages:
+            page_ids = set()
+            for archive in page:
+                page_ids.add(archive.id)
+                if archive.id not in previous_ids:
+                    yield archive
+            previous_ids = page_ids
+
+    async def export_archives(
+        self, fp, format="ndjson", session_id=None, page_size=1000, prefetch=1
+    ):
+        """
+        Writes every archive for your API key to a text file-like object as NDJSON or CSV,
+        see Client.export_archives().
+        """
+        writer = self._export_writer(format, fp)
+        async for archive in self.iter_archives(session_id, page_size, prefetch):
+            writer.write(archive)
+        return writer.count
+
+    async def get_all_archives(self, session_id=None, page_size=1000, concurrency=8):
+        """
+        Returns an ArchiveList with every archive for your API key, see
+        Client.get_all_archives(). The remaining pages are fetched concurrently on the event
+        loop, at most concurrency at a time.
+        """
+        if not 0 < page_size <= 1000:
+            raise OpenTokException("page_size must be between 1 and 1000")
+
+        def fetch_page(offset, count):
+            return self.get_archives(offset=offset, count=count, session_id=session_id)
+
+        pages = await afetch_all_pages(fetch_page, page_size, concurrency)
+        return merge_pages(ArchiveList(self, {}), pages)
+
+    async def list_all_renders(self, page_size=1000, concurrency=8):
+        """
+        Returns a RenderList with every render associated with the project's API key, see
+        Client.list_all_renders().
+        """
+        if not 0 < page_size <= 1000:
+            raise OpenTokException("page_size must be between 1 and 1000")
+
+        pages = await afetch_all_pages(self.list_renders, page_size, concurrency)
+        return merge_pages(RenderList(self, {}), pages)
+
+    async def wait_for_archive(
+        self,
+        archive_id,
+        states=READY_STATES,
+        timeout=300,
+        min_interval=1.0,
+        max_interval=30.0,
+    ):
+        """
+        Waits, without blocking the event loop, until an archive reaches one of the given
+        statuses and returns the Archive object, see Client.wait_for_archive().
+        """
+        wait = _ArchiveWait(archive_id, states, timeout, min_interval, max_interval)
+        while True:
+            archive = await self.get_archive(archive_id)
+            if wait.done(archive):
+                return archive
+            await asyncio.sleep(wait.next_delay(archive))
+
+    async def _run_bulk(self, func, items, keys, concurrency, rate=None):
+        outcomes = await run_concurrently_async(func, items, concurrency, rate)
+        return outcomes if keys is None else dict(zip(keys, outcomes))
+
+    async def close(self):
+        """Closes the pooled connections to the OpenTok API."""
+        await self._transport.close()
+        self.disable_signing_pool()
+
+    def __enter__(self):
+        raise TypeError("Use 'async with' with AsyncClient")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
@@ -0,0 +1,65 @@
+import time
+
+from .rate_limit import TokenBucket
+
+# requests per second of the bulk moderation calls, unless the caller passes a rate
+DEFAULT_BULK_RATE = 20
+
+
+def _call(func, item):
+    try:
+        return func(item)
+    except Exception as e:
+        return e
+
+
+def run_concurrently(func, items, concurrency=10, rate=None):
+    """
+    For internal use.
+    Calls func for every item on up to concurrency threads and returns the outcomes in the
+    order of items: the value returned by func, or the exception it raised. A slow call only
+    holds up its own thread. With a rate, calls are started at most rate times per second.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    items = list(items)
+    if not items:
+        return []
+    if rate is not None:
+        bucket = TokenBucket(rate, burst=1)
+        unpaced = func
+
+        def func(item):
+            time.sleep(bucket.reserve())
+            return unpaced(item)
+
+    workers = max(1, min(concurrency, len(items)))
+    if workers == 1:
+        return [_call(func, item) for item in items]
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="opentok-bulk"
+    ) as executor:
+        return list(executor.map(lambda item: _call(func, item), items))
+
+
+async def run_concurrently_async(func, items, concurrency=10, rate=None):
+    """
+    For internal use.
+    The asyncio version of run_concurrently: func returns an awaitable, and at most
+    concurrency of them are awaited at the same time.
+    """
+    import asyncio
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    bucket = TokenBucket(rate, burst=1) if rate is not None else None
+
+    async def call(item):
+        async with semaphore:
+            if bucket is not None:
+                await asyncio.sleep(bucket.reserve())
+            try:
+                return await func(item)
+            except Exception as e:
+                return e
+
+    return list(await asyncio.gather(*(call(item) for item in items)))
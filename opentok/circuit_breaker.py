@@ -0,0 +1,212 @@
+import threading
+import time
+from collections import deque
+from enum import Enum
+
+from .exceptions import CircuitOpenError
+
+
+class CircuitState(Enum):
+    """The states of a circuit of the CircuitBreaker class."""
+
+    closed = "closed"
+    """Requests are sent, and their outcomes are recorded."""
+    open = "open"
+    """Requests fail immediately with a CircuitOpenError."""
+    half_open = "half_open"
+    """A few probe requests are sent to check whether the API has recovered."""
+
+
+class _Circuit(object):
+    __slots__ = ("state", "outcomes", "opened_at", "probes", "probe_successes", "latency")
+
+    def __init__(self, window_size):
+        self.state = CircuitState.closed
+        self.outcomes = deque(maxlen=window_size)  # True for each failed request
+        self.opened_at = None
+        self.probes = 0
+        self.probe_successes = 0
+        self.latency = None  # moving average, in seconds
+
+
+class CircuitBreaker(object):
+    """
+    A circuit breaker for the requests of a Client or AsyncClient, with one circuit per
+    endpoint family (see Endpoints.ENDPOINT_FAMILIES).
+
+    Each circuit records the outcome of the last window_size requests of its family. A
+    request fails when it raises an exception (a connection error or a timeout, for
+    example), when its response status is in failure_statuses, or when it takes longer than
+    slow_call_threshold. Once at least minimum_requests outcomes are recorded and the share
+    of failures reaches failure_threshold, the circuit opens: requests of that family then
+    fail immediately with a CircuitOpenError instead of waiting on a degraded API. After
+    open_timeout seconds the circuit is half-open and lets half_open_max_calls probe requests
+    through. It closes when they all succeed and opens again as soon as one fails.
+
+    Note that the circuit breaker cannot interrupt a request in progress: set the timeout
+    parameter of the Client as well.
+
+    :param float failure_threshold: The share of failed requests, between 0 and 1, that opens
+        a circuit.
+
+    :param int minimum_requests: The number of recorded requests needed before a circuit
+        can open.
+
+    :param int window_size: The number of most recent requests a circuit records.
+
+    :param float open_timeout: The number of seconds a circuit stays open before probing.
+
+    :param int half_open_max_calls: The number of probe requests sent while half-open.
+
+    :param float slow_call_threshold: A duration, in seconds, above which a request counts as
+        failed. None (the default) ignores durations.
+
+    :param failure_statuses: The HTTP status codes that count as failures.
+
+    :param on_state_change: A function called with the endpoint family, the previous
+        CircuitState and the new CircuitState whenever a circuit changes state, for example
+        to shed load upstream while a circuit is open.
+    """
+
+    DEFAULT_FAILURE_STATUSES = frozenset([500, 502, 503, 504])
+
+    def __init__(
+        self,
+        failure_threshold=0.5,
+        minimum_requests=10,
+        window_size=50,
+        open_timeout=30.0,
+        half_open_max_calls=1,
+        slow_call_threshold=None,
+        failure_statuses=DEFAULT_FAILURE_STATUSES,
+        on_state_change=None,
+    ):
+        self.failure_threshold = failure_threshold
+        self.minimum_requests = minimum_requests
+        self.window_size = window_size
+        self.open_timeout = open_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.slow_call_threshold = slow_call_threshold
+        self.failure_statuses = frozenset(failure_statuses)
+        self.on_state_change = on_state_change
+        self._circuits = {}
+        self._lock = threading.Lock()
+
+    def _circuit(self, family):
+        circuit = self._circuits.get(family)
+        if circuit is None:
+            circuit = self._circuits[family] = _Circuit(self.window_size)
+        return circuit
+
+    def _set_state(self, family, circuit, state, changes):
+        if circuit.state is state:
+            return
+        changes.append((family, circuit.state, state))
+        circuit.state = state
+        if state is CircuitState.open:
+            circuit.opened_at = time.monotonic()
+        elif state is CircuitState.half_open:
+            circuit.probes = 0
+            circuit.probe_successes = 0
+        else:
+            circuit.outcomes.clear()
+
+    def _notify(self, changes):
+        if self.on_state_change is not None:
+            for family, previous, state in changes:
+                self.on_state_change(family, previous, state)
+
+    def state(self, family):
+        """Returns the CircuitState of an endpoint family."""
+        with self._lock:
+            circuit = self._circuits.get(family)
+            return circuit.state if circuit is not None else CircuitState.closed
+
+    def stats(self, family):
+        """
+        Returns a dictionary with the state, the failure rate over the recorded requests and
+        the moving average latency, in seconds, of an endpoint family.
+        """
+        with self._lock:
+            circuit = self._circuit(family)
+            outcomes = circuit.outcomes
+            return {
+                "state": circuit.state,
+                "requests": len(outcomes),
+                "failure_rate": sum(outcomes) / len(outcomes) if outcomes else 0.0,
+                "latency": circuit.latency,
+            }
+
+    def before_request(self, family):
+        """
+        For internal use.
+        Raises CircuitOpenError when a request of the endpoint family must not be sent.
+        """
+        changes = []
+        try:
+            with self._lock:
+                circuit = self._circuit(family)
+                if circuit.state is CircuitState.open:
+                    remaining = circuit.opened_at + self.open_timeout - time.monotonic()
+                    if remaining > 0:
+                        raise CircuitOpenError(family, remaining)
+                    self._set_state(family, circuit, CircuitState.half_open, changes)
+                if circuit.state is CircuitState.half_open:
+                    if circuit.probes >= self.half_open_max_calls:
+                        raise CircuitOpenError(family, 0.0)
+                    circuit.probes += 1
+        finally:
+            self._notify(changes)
+
+    def cancel_request(self, family):
+        """
+        For internal use.
+        Gives back the probe taken by before_request() for a request that was not sent, when
+        the rate limiter rejected it for example.
+        """
+        with self._lock:
+            circuit = self._circuit(family)
+            if circuit.state is CircuitState.half_open and circuit.probes > 0:
+                circuit.probes -= 1
+
+    def is_failure(self, response=None, exception=None, duration=None):
+        """Whether a request that returned response or raised exception failed."""
+        if exception is not None:
+            return True
+        if response is not None and response.status_code in self.failure_statuses:
+            return True
+        return (
+            self.slow_call_threshold is not None
+            and duration is not None
+            and duration > self.slow_call_threshold
+        )
+
+    def record(self, family, failed, duration):
+        """
+        For internal use.
+        Records the outcome and duration, in seconds, of a request of the endpoint family.
+        """
+        changes = []
+        with self._lock:
+            circuit = self._circuit(family)
+            if circuit.latency is None:
+                circuit.latency = duration
+            else:
+                circuit.latency += 0.2 * (duration - circuit.latency)
+
+            if circuit.state is CircuitState.half_open:
+                if failed:
+                    self._set_state(family, circuit, CircuitState.open, changes)
+                else:
+                    circuit.probe_successes += 1
+                    if circuit.probe_successes >= self.half_open_max_calls:
+                        self._set_state(family, circuit, CircuitState.closed, changes)
+            elif circuit.state is CircuitState.closed:
+                circuit.outcomes.append(failed)
+                outcomes = circuit.outcomes
+                if (
+                    len(outcomes) >= self.minimum_requests
+                    and sum(outcomes) >= self.failure_threshold * len(outcomes)
+                ):
+                    self._set_state(family, circuit, CircuitState.open, changes)
+        self._notify(changes)
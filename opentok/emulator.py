@@ -0,0 +1,794 @@
+import argparse
+import base64
+import hashlib
+import json
+import logging
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from .endpoints import Endpoints
+from .exceptions import RateLimitError
+from .rate_limit import RateLimiter
+
+logger = logging.getLogger("opentok")
+
+_PROJECT = r"/v2/project/(?P<project_id>[^/]+)"
+_DOWNLOAD = re.compile(r"/archives/(?P<archive_id>[^/]+)\.mp4$")
+_RANGE = re.compile(r"bytes=(\d+)-(\d*)$")
+
+
+def _archive_content(archive_id, start, end):
+    """Returns the bytes start to end (excluded) of the emulated MP4 file of an archive."""
+    # the length of the pattern is a prime number, so that a chunk written at a wrong offset
+    # never matches
+    pattern = (hashlib.sha256(archive_id.encode("utf-8")).digest() * 128)[:4093]
+    offset = start % len(pattern)
+    count = end - start
+    return (pattern * ((offset + count) // len(pattern) + 1))[offset : offset + count]
+
+
+class EmulatorResponse(Exception):
+    """For internal use. Raised by a handler to answer with an error status."""
+
+    def __init__(self, status, message=None, headers=None):
+        super(EmulatorResponse, self).__init__(message)
+        self.status = status
+        self.message = message or "Error {0}".format(status)
+        self.headers = headers or {}
+
+
+class _EmulatorRequest(object):
+    __slots__ = ("method", "path", "query", "headers", "body")
+
+    def __init__(self, method, path, query, headers, body):
+        self.method = method
+        self.path = path
+        self.query = query
+        self.headers = headers
+        self.body = body
+
+    def json(self):
+        try:
+            return json.loads(self.body.decode("utf-8")) if self.body else {}
+        except ValueError:
+            raise EmulatorResponse(400, "Invalid JSON in request body")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "OpenTokEmulator"
+    # the headers and the body are written separately: without TCP_NODELAY, delayed ACKs
+    # hold the body back for 40 ms
+    disable_nagle_algorithm = True
+
+    def _dispatch(self):
+        self.server.emulator._handle(self)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _dispatch
+
+    def log_message(self, format, *args):
+        logger.debug("emulator: " + format, *args)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class Emulator(object):
+    """
+    A local emulator of the OpenTok REST API, for load testing and offline development.
+
+    The emulator is an HTTP server running in a background thread. Pass its url as the
+    api_url of a Client or AsyncClient, and the client's REST calls are answered locally,
+    without network access or API usage::
+
+        with Emulator(latency=0.05) as emulator:
+            opentok = Client(api_key, api_secret, api_url=emulator.url)
+            session = opentok.create_session()
+            archive = opentok.start_archive(session.session_id)
+
+    Session creation, archives, broadcasts, Experience Composer renders, signals, streams,
+    SIP dial and DTMF, force disconnect and force mute, Audio Connector and live captions
+    are emulated. Archives, broadcasts, renders, captions and streams are stateful: a stopped
+    archive can be fetched, listed and deleted, and starting a second broadcast for a session
+    fails with 409, as it does with the OpenTok API. Sessions do not need to be created with
+    the emulator first. Signals, force disconnects, mutes and DTMF are acknowledged without
+    checking the connection IDs. Requests are not checked against the API secret, but they
+    must carry an authentication header.
+
+    The MP4 file of an available archive can be downloaded from its url, in one piece or with
+    Range requests. Its content is generated from the archive ID, and its ETag is the MD5 of
+    the content, as for an S3 object. Every get_archive() call returns a new URL, which
+    expires after url_lifetime seconds; requests to an expired URL fail with 403. Downloads
+    count as the "download" endpoint family in request_counts and inject_errors().
+
+    :param String host: The address the server listens on.
+
+    :param int port: The port the server listens on. 0 (the default) picks a free port.
+
+    :param latency: The delay added to every response, in seconds, either as a number or as
+        a (min, max) tuple for a uniformly distributed delay.
+
+    :param float error_rate: The probability, between 0 and 1, that a request fails with
+        error_status instead of being handled.
+
+    :param int error_status: The HTTP status code of the failures injected by error_rate.
+
+    :param dict rate_limits: The number of requests per second accepted for each endpoint
+        family (see Endpoints.ENDPOINT_FAMILIES), in the format of the rates parameter of
+        RateLimiter. Requests over the limit get a 429 response with a Retry-After header.
+
+    :param default_rate_limit: The rate limit of the endpoint families missing from
+        rate_limits. None (the default) leaves them unlimited.
+
+    :param float processing_time: The number of seconds a stopped archive takes to become
+        available for download.
+
+    :param float url_lifetime: The number of seconds the download URL of an archive is valid.
+
+    :ivar request_counts: A Counter of the requests received, by endpoint family.
+    """
+
+    def __init__(
+        self,
+        host="127.0.0.1",
+        port=0,
+        latency=0.0,
+        error_rate=0.0,
+        error_status=500,
+        rate_limits=None,
+        default_rate_limit=None,
+        processing_time=0.0,
+        url_lifetime=600.0,
+    ):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.processing_time = processing_time
+        self.url_lifetime = url_lifetime
+        self.rate_limiter = None
+        if rate_limits or default_rate_limit is not None:
+            self.rate_limiter = RateLimiter(
+                rates=rate_limits, default_rate=default_rate_limit, block=False
+            )
+        self.request_counts = Counter()
+        self._endpoints = Endpoints("", "")
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+        self._routes = self._create_routes()
+        self.reset()
+
+    def reset(self):
+        """Forgets every archive, broadcast, render, caption, stream and injected error."""
+        with self._lock:
+            self.archives = OrderedDict()
+            self.broadcasts = OrderedDict()
+            self.renders = OrderedDict()
+            self.captions = {}
+            self.streams = {}  # session ID -> OrderedDict of streams by stream ID
+            self._injected_errors = deque()
+            self._etags = {}  # (archive ID, size) -> MD5 of the content
+            self.request_counts.clear()
+
+    @property
+    def url(self):
+        """The URL to use as the api_url of a client, once the emulator is started."""
+        if self._server is None:
+            raise RuntimeError("The emulator is not started")
+        host, port = self._server.server_address[:2]
+        return "http://{0}:{1}".format(host, port)
+
+    def start(self):
+        """Starts the server in a background thread."""
+        if self._server is not None:
+            return self
+        self._server = _Server((self.host, self.port), _Handler)
+        self._server.emulator = self
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name="opentok-emulator",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops the server."""
+        server = self._server
+        if server is None:
+            return
+        self._server = None
+        server.shutdown()
+        server.server_close()
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def inject_errors(self, status, count=1, family=None):
+        """
+        Makes the next count requests, or the next count requests of an endpoint family,
+        fail with the HTTP status code status.
+        """
+        with self._lock:
+            for _ in range(count):
+                self._injected_errors.append((status, family))
+
+    def add_stream(
+        self, session_id, stream_id=None, video_type="camera", name="", layout_class_list=()
+    ):
+        """Adds a stream to a session, as if a client published it, and returns its ID."""
+        stream_id = stream_id or str(uuid.uuid4())
+        with self._lock:
+            self.streams.setdefault(session_id, OrderedDict())[stream_id] = {
+                "id": stream_id,
+                "videoType": video_type,
+                "name": name,
+                "layoutClassList": list(layout_class_list),
+            }
+        return stream_id
+
+    def _create_routes(self):
+        archive = _PROJECT + r"/archive/(?P<archive_id>[^/]+)"
+        broadcast = _PROJECT + r"/broadcast/(?P<broadcast_id>[^/]+)"
+        render = _PROJECT + r"/render/(?P<render_id>[^/]+)"
+        session = _PROJECT + r"/session/(?P<session_id>[^/]+)"
+        stream = session + r"/stream/(?P<stream_id>[^/]+)"
+        connection = session + r"/connection/[^/]+"
+        routes = [
+            ("POST", r"/session/create", self._create_session),
+            ("POST", _PROJECT + r"/archive", self._start_archive),
+            ("GET", _PROJECT + r"/archive", self._list_archives),
+            ("GET", archive, self._get_archive),
+            ("DELETE", archive, self._delete_archive),
+            ("POST", archive + r"/stop", self._stop_archive),
+            ("PUT", archive + r"/layout", self._set_archive_layout),
+            ("PATCH", archive + r"/streams", self._patch_archive_streams),
+            ("POST", _PROJECT + r"/broadcast", self._start_broadcast),
+            ("GET", _PROJECT + r"/broadcast", self._list_broadcasts),
+            ("GET", broadcast, self._get_broadcast),
+            ("POST", broadcast + r"/stop", self._stop_broadcast),
+            ("PUT", broadcast + r"/layout", self._set_broadcast_layout),
+            ("PATCH", broadcast + r"/streams", self._patch_broadcast_streams),
+            ("POST", _PROJECT + r"/render", self._start_render),
+            ("GET", _PROJECT + r"/render", self._list_renders),
+            ("GET", render, self._get_render),
+            ("DELETE", render, self._stop_render),
+            ("POST", session + r"/signal", self._acknowledge),
+            ("POST", connection + r"/signal", self._acknowledge),
+            ("DELETE", connection, self._acknowledge),
+            ("GET", session + r"/stream", self._list_streams),
+            ("PUT", session + r"/stream", self._set_stream_class_lists),
+            ("GET", stream, self._get_stream),
+            ("POST", stream + r"/mute", self._mute_stream),
+            ("POST", session + r"/mute", self._ok),
+            ("POST", session + r"/play-dtmf", self._play_dtmf),
+            ("POST", connection + r"/play-dtmf", self._play_dtmf),
+            ("POST", _PROJECT + r"/dial", self._dial),
+            ("POST", _PROJECT + r"/connect", self._connect),
+            ("POST", _PROJECT + r"/captions", self._start_captions),
+            ("POST", _PROJECT + r"/captions/(?P<captions_id>[^/]+)/stop", self._stop_captions),
+        ]
+        return [
+            (method, re.compile(pattern + r"/?$"), handler)
+            for method, pattern, handler in routes
+        ]
+
+    def _handle(self, handler):
+        parts = urlsplit(handler.path)
+        length = int(handler.headers.get("Content-Length") or 0)
+        request = _EmulatorRequest(
+            handler.command,
+            parts.path,
+            dict(parse_qsl(parts.query)),
+            handler.headers,
+            handler.rfile.read(length) if length else b"",
+        )
+        download = _DOWNLOAD.match(request.path) if request.method == "GET" else None
+        if download:
+            family = "download"
+        else:
+            family = self._endpoints.get_endpoint_family(request.path, request.method)
+        with self._lock:
+            self.request_counts[family] += 1
+
+        self._sleep()
+        content_type = "application/json"
+        try:
+            if download:
+                status, headers, content = self._download(request, **download.groupdict())
+                content_type = "video/mp4"
+            else:
+                status, body = self._respond(request, family)
+                headers = {}
+                content = b"" if body is None else json.dumps(body).encode("utf-8")
+        except EmulatorResponse as e:
+            status, headers = e.status, e.headers
+            body = {"code": e.status, "message": e.message}
+            content = json.dumps(body).encode("utf-8")
+
+        handler.send_response(status)
+        handler.send_header("Content-Type", content_type)
+        handler.send_header("Content-Length", str(len(content)))
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        if content:
+            handler.wfile.write(content)
+
+    def _sleep(self):
+        latency = self.latency
+        if isinstance(latency, (tuple, list)):
+            latency = random.uniform(*latency)
+        if latency:
+            time.sleep(latency)
+
+    def _respond(self, request, family):
+        if not (
+            request.headers.get("X-OPENTOK-AUTH")
+            or request.headers.get("Authorization")
+        ):
+            raise EmulatorResponse(403, "Authentication failed")
+        if self.rate_limiter is not None:
+            try:
+                self.rate_limiter.reserve(family)
+            except RateLimitError as e:
+                raise EmulatorResponse(429, str(e), {"Retry-After": "1"})
+        self._raise_injected_error(family)
+        if self.error_rate and random.random() < self.error_rate:
+            raise EmulatorResponse(self.error_status)
+
+        for method, pattern, route in self._routes:
+            match = pattern.match(request.path)
+            if match and method == request.method:
+                with self._lock:
+                    return route(request, **match.groupdict())
+        raise EmulatorResponse(404, "Resource not found")
+
+    def _raise_injected_error(self, family):
+        with self._lock:
+            for index, (status, error_family) in enumerate(self._injected_errors):
+                if error_family is None or error_family == family:
+                    del self._injected_errors[index]
+                    raise EmulatorResponse(status)
+
+    @staticmethod
+    def _now():
+        return int(time.time() * 1000)
+
+    @staticmethod
+    def _project_id(request):
+        """Reads the API key from the unverified claims of the JWT auth header."""
+        token = request.headers.get("X-OPENTOK-AUTH") or request.headers.get(
+            "Authorization", ""
+        ).replace("Bearer ", "")
+        try:
+            claims = token.split(".")[1]
+            claims = json.loads(base64.urlsafe_b64decode(claims + "=" * (-len(claims) % 4)))
+            return str(claims.get("iss") or claims.get("application_id"))
+        except (IndexError, ValueError):
+            return "0"
+
+    @staticmethod
+    def _partner_id(project_id):
+        return int(project_id) if project_id.isdigit() else project_id
+
+    @staticmethod
+    def _page(records, query):
+        offset = int(query.get("offset", 0))
+        count = int(query.get("count", 50))
+        return {"count": len(records), "items": records[offset : offset + count]}
+
+    def _find(self, records, record_id, name):
+        record = records.get(record_id)
+        if record is None:
+            raise EmulatorResponse(404, "{0} not found".format(name))
+        return record
+
+    def _ok(self, request, **ids):
+        return 200, {}
+
+    def _acknowledge(self, request, **ids):
+        return 204, None
+
+    def _create_session(self, request):
+        project_id = self._project_id(request)
+        decoded = "1~{0}~127.0.0.1~{1}~{2}~MX4".format(
+            project_id, time.strftime("%a %b %d %H:%M:%S PST %Y"), uuid.uuid4().hex
+        )
+        session_id = "1_" + base64.urlsafe_b64encode(decoded.encode("utf-8")).decode(
+            "ascii"
+        ).rstrip("=")
+        self.streams.setdefault(session_id, OrderedDict())
+        return 200, [
+            {
+                "session_id": session_id,
+                "project_id": project_id,
+                "partner_id": project_id,
+                "create_dt": time.strftime("%a %b %d %H:%M:%S PST %Y"),
+                "media_server_url": "",
+            }
+        ]
+
+    # Archives
+
+    def _start_archive(self, request, project_id):
+        payload = request.json()
+        session_id = payload.get("sessionId")
+        if not session_id:
+            raise EmulatorResponse(400, "sessionId is required")
+        tag = payload.get("multiArchiveTag")
+        for archive in self.archives.values():
+            if (
+                archive["sessionId"] == session_id
+                and archive["status"] == "started"
+                and archive["multiArchiveTag"] == tag
+            ):
+                raise EmulatorResponse(409, "The session is already being archived")
+        archive = {
+            "id": str(uuid.uuid4()),
+            "name": payload.get("name") or "",
+            "status": "started",
+            "sessionId": session_id,
+            "partnerId": self._partner_id(project_id),
+            "projectId": self._partner_id(project_id),
+            "createdAt": self._now(),
+            "size": 0,
+            "duration": 0,
+            "hasAudio": payload.get("hasAudio", True),
+            "hasVideo": payload.get("hasVideo", True),
+            "outputMode": payload.get("outputMode") or "composed",
+            "streamMode": payload.get("streamMode") or "auto",
+            "streams": [],
+            "url": None,
+            "reason": "",
+            "resolution": payload.get("resolution") or "640x480",
+            "multiArchiveTag": tag,
+            "maxBitrate": payload.get("maxBitrate"),
+        }
+        if "quantizationParameter" in payload:
+            archive["quantizationParameter"] = payload["quantizationParameter"]
+        self.archives[archive["id"]] = archive
+        return 200, dict(archive)
+
+    def _archive(self, archive_id):
+        archive = self._find(self.archives, archive_id, "Archive")
+        stopped_at = archive.pop("_stoppedAt", None)
+        if stopped_at is not None:
+            if time.time() - stopped_at >= self.processing_time:
+                archive["status"] = "available"
+                archive["size"] = 125000 * max(1, archive["duration"])
+            else:
+                archive["_stoppedAt"] = stopped_at
+        if archive["status"] == "available":
+            archive["url"] = "{0}/archives/{1}.mp4?expires={2}".format(
+                self.url, archive_id, time.time() + self.url_lifetime
+            )
+        return archive
+
+    def _etag(self, archive_id, size):
+        key = (archive_id, size)
+        if key not in self._etags:
+            md5 = hashlib.md5()
+            for start in range(0, size, 1 << 20):
+                md5.update(_archive_content(archive_id, start, min(size, start + (1 << 20))))
+            self._etags[key] = md5.hexdigest()
+        return self._etags[key]
+
+    def _download(self, request, archive_id):
+        """Serves the MP4 file of an available archive, or the single range requested."""
+        self._raise_injected_error("download")
+        with self._lock:
+            archive = self.archives.get(archive_id)
+            if archive is None or archive["status"] != "available":
+                raise EmulatorResponse(404, "The specified key does not exist.")
+            size = archive["size"]
+            etag = self._etag(archive_id, size)
+        if float(request.query.get("expires", 0)) < time.time():
+            raise EmulatorResponse(403, "Request has expired")
+
+        status, start, end = 200, 0, size
+        headers = {"ETag": '"{0}"'.format(etag), "Accept-Ranges": "bytes"}
+        match = _RANGE.match(request.headers.get("Range", ""))
+        if match:
+            start = int(match.group(1))
+            end = min(size, int(match.group(2) or size - 1) + 1)
+            if start >= size:
+                raise EmulatorResponse(
+                    416, "Range not satisfiable", {"Content-Range": "bytes */%d" % size}
+                )
+            status = 206
+            headers["Content-Range"] = "bytes {0}-{1}/{2}".format(start, end - 1, size)
+        return status, headers, _archive_content(archive_id, start, end)
+
+    def _archive_view(self, archive):
+        return {key: value for key, value in archive.items() if key[0] != "_"}
+
+    def _get_archive(self, request, project_id, archive_id):
+        return 200, self._archive_view(self._archive(archive_id))
+
+    def _list_archives(self, request, project_id):
+        session_id = request.query.get("sessionId")
+        archives = [
+            self._archive_view(self._archive(archive_id))
+            for archive_id in reversed(self.archives)
+            if session_id is None or self.archives[archive_id]["sessionId"] == session_id
+        ]
+        return 200, self._page(archives, request.query)
+
+    def _stop_archive(self, request, project_id, archive_id):
+        archive = self._archive(archive_id)
+        if archive["status"] != "started":
+            raise EmulatorResponse(409, "Archive is not in started state")
+        archive["status"] = "stopped"
+        archive["duration"] = (self._now() - archive["createdAt"]) // 1000
+        archive["_stoppedAt"] = time.time()
+        return 200, self._archive_view(archive)
+
+    def _delete_archive(self, request, project_id, archive_id):
+        archive = self._archive(archive_id)
+        if archive["status"] == "started":
+            raise EmulatorResponse(409, "Stop the archive before deleting it")
+        del self.archives[archive_id]
+        return 204, None
+
+    def _set_archive_layout(self, request, project_id, archive_id):
+        self._archive(archive_id)["layout"] = request.json()
+        return 200, {}
+
+    def _patch_streams(self, record, request):
+        if record["streamMode"] != "manual":
+            raise EmulatorResponse(405, "The stream mode does not support stream changes")
+        payload = request.json()
+        streams = record["streams"]
+        if "addStream" in payload:
+            streams.append(
+                {
+                    "streamId": payload["addStream"],
+                    "hasAudio": payload.get("hasAudio", True),
+                    "hasVideo": payload.get("hasVideo", True),
+                }
+            )
+        elif "removeStream" in payload:
+            streams[:] = [s for s in streams if s["streamId"] != payload["removeStream"]]
+        else:
+            raise EmulatorResponse(400, "addStream or removeStream is required")
+        return 204, None
+
+    def _patch_archive_streams(self, request, project_id, archive_id):
+        return self._patch_streams(self._archive(archive_id), request)
+
+    # Broadcasts
+
+    def _start_broadcast(self, request, project_id):
+        payload = request.json()
+        session_id = payload.get("sessionId")
+        if not session_id or "outputs" not in payload:
+            raise EmulatorResponse(400, "sessionId and outputs are required")
+        for broadcast in self.broadcasts.values():
+            if broadcast["sessionId"] == session_id and broadcast["status"] == "started":
+                raise EmulatorResponse(409, "The session is already being broadcast")
+        broadcast_id = str(uuid.uuid4())
+        outputs = payload["outputs"]
+        urls = {}
+        if "hls" in outputs:
+            urls["hls"] = "{0}/broadcasts/{1}/hls/index.m3u8".format(self.url, broadcast_id)
+        if "rtmp" in outputs:
+            urls["rtmp"] = [dict(rtmp, status="live") for rtmp in outputs["rtmp"]]
+        now = self._now()
+        broadcast = {
+            "id": broadcast_id,
+            "sessionId": session_id,
+            "projectId": self._partner_id(project_id),
+            "createdAt": now,
+            "updatedAt": now,
+            "hasAudio": payload.get("hasAudio", True),
+            "hasVideo": payload.get("hasVideo", True),
+            "maxBitrate": payload.get("maxBitrate"),
+            "maxDuration": payload.get("maxDuration", 7200),
+            "resolution": payload.get("resolution") or "640x480",
+            "status": "started",
+            "broadcastUrls": urls,
+            "streamMode": payload.get("streamMode") or "auto",
+            "streams": [],
+        }
+        self.broadcasts[broadcast_id] = broadcast
+        return 200, dict(broadcast)
+
+    def _get_broadcast(self, request, project_id, broadcast_id):
+        return 200, dict(self._find(self.broadcasts, broadcast_id, "Broadcast"))
+
+    def _list_broadcasts(self, request, project_id):
+        session_id = request.query.get("sessionId")
+        broadcasts = [
+            dict(broadcast)
+            for broadcast in reversed(self.broadcasts.values())
+            if session_id is None or broadcast["sessionId"] == session_id
+        ]
+        return 200, self._page(broadcasts, request.query)
+
+    def _stop_broadcast(self, request, project_id, broadcast_id):
+        broadcast = self._find(self.broadcasts, broadcast_id, "Broadcast")
+        if broadcast["status"] != "started":
+            raise EmulatorResponse(409, "The broadcast is already stopped")
+        broadcast["status"] = "stopped"
+        broadcast["updatedAt"] = self._now()
+        return 200, dict(broadcast)
+
+    def _set_broadcast_layout(self, request, project_id, broadcast_id):
+        self._find(self.broadcasts, broadcast_id, "Broadcast")["layout"] = request.json()
+        return 200, {}
+
+    def _patch_broadcast_streams(self, request, project_id, broadcast_id):
+        return self._patch_streams(
+            self._find(self.broadcasts, broadcast_id, "Broadcast"), request
+        )
+
+    # Experience Composer renders
+
+    def _start_render(self, request, project_id):
+        payload = request.json()
+        if not payload.get("sessionId") or not payload.get("url"):
+            raise EmulatorResponse(400, "sessionId and url are required")
+        now = self._now()
+        render = {
+            "id": str(uuid.uuid4()),
+            "sessionId": payload["sessionId"],
+            "projectId": self._partner_id(project_id),
+            "createdAt": now,
+            "updatedAt": now,
+            "url": payload["url"],
+            "resolution": payload.get("resolution") or "1280x720",
+            "status": "starting",
+            "streamId": str(uuid.uuid4()),
+        }
+        self.renders[render["id"]] = render
+        response = dict(render)
+        render["status"] = "started"
+        return 202, response
+
+    def _get_render(self, request, project_id, render_id):
+        return 200, dict(self._find(self.renders, render_id, "Render"))
+
+    def _list_renders(self, request, project_id):
+        renders = [dict(render) for render in reversed(self.renders.values())]
+        return 200, self._page(renders, request.query)
+
+    def _stop_render(self, request, project_id, render_id):
+        render = self._find(self.renders, render_id, "Render")
+        render["status"] = "stopped"
+        render["reason"] = "Stop Requested"
+        render["updatedAt"] = self._now()
+        return 200, {}
+
+    # Streams, moderation and SIP
+
+    def _session_streams(self, session_id):
+        return self.streams.get(session_id, OrderedDict())
+
+    def _get_stream(self, request, project_id, session_id, stream_id):
+        return 200, dict(self._find(self._session_streams(session_id), stream_id, "Stream"))
+
+    def _list_streams(self, request, project_id, session_id):
+        streams = [dict(stream) for stream in self._session_streams(session_id).values()]
+        return 200, {"count": len(streams), "items": streams}
+
+    def _set_stream_class_lists(self, request, project_id, session_id):
+        streams = self._session_streams(session_id)
+        items = request.json().get("items", [])
+        if any(item.get("id") not in streams for item in items):
+            raise EmulatorResponse(400, "Invalid stream ID")
+        for item in items:
+            streams[item["id"]]["layoutClassList"] = item.get("layoutClassList", [])
+        return 200, {}
+
+    def _mute_stream(self, request, project_id, session_id, stream_id):
+        self._find(self._session_streams(session_id), stream_id, "Stream")
+        return 200, {}
+
+    def _play_dtmf(self, request, project_id, session_id):
+        if not re.match(r"^[0-9*#p]+$", request.json().get("digits") or ""):
+            raise EmulatorResponse(400, "Invalid DTMF digits")
+        return 200, {}
+
+    def _dial(self, request, project_id):
+        payload = request.json()
+        if not payload.get("sessionId") or not payload.get("sip", {}).get("uri"):
+            raise EmulatorResponse(400, "sessionId and sip.uri are required")
+        session_id = payload["sessionId"]
+        self.streams.setdefault(session_id, OrderedDict())
+        stream_id = str(uuid.uuid4())
+        self.streams[session_id][stream_id] = {
+            "id": stream_id,
+            "videoType": "camera",
+            "name": "",
+            "layoutClassList": [],
+        }
+        return 200, {
+            "id": str(uuid.uuid4()),
+            "connectionId": str(uuid.uuid4()),
+            "streamId": stream_id,
+        }
+
+    def _connect(self, request, project_id):
+        payload = request.json()
+        if not payload.get("sessionId") or not payload.get("websocket", {}).get("uri"):
+            raise EmulatorResponse(400, "sessionId and websocket.uri are required")
+        return 200, {
+            "id": str(uuid.uuid4()),
+            "connectionId": str(uuid.uuid4()),
+            "bidirectional": payload["websocket"].get("bidirectional", False),
+        }
+
+    # Live captions
+
+    def _start_captions(self, request, project_id):
+        session_id = request.json().get("sessionId")
+        if not session_id:
+            raise EmulatorResponse(400, "sessionId is required")
+        if session_id in self.captions.values():
+            raise EmulatorResponse(409, "Live captions have already started for this session")
+        captions_id = str(uuid.uuid4())
+        self.captions[captions_id] = session_id
+        return 202, {"captionsId": captions_id}
+
+    def _stop_captions(self, request, project_id, captions_id):
+        self._find(self.captions, captions_id, "Captions")
+        del self.captions[captions_id]
+        return 202, None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m opentok.emulator",
+        description="Runs a local emulator of the OpenTok REST API.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=None,
+        help="requests per second accepted for each endpoint family",
+    )
+    parser.add_argument("--processing-time", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    emulator = Emulator(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        default_rate_limit=args.rate_limit,
+        processing_time=args.processing_time,
+    ).start()
+    print("OpenTok emulator listening on " + emulator.url)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        emulator.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -220,3 +220,52 @@ class Endpoints(object):
             url += f'/{captions_id}/stop'
 
         return url
+
+    ENDPOINT_FAMILIES = (
+        "session",
+        "archive",
+        "broadcast",
+        "render",
+        "signal",
+        "moderation",
+        "stream",
+        "sip",
+        "connect",
+        "captions",
+    )
+    """The endpoint families returned by get_endpoint_family()."""
+
+    def get_endpoint_family(self, url, method="GET"):
+        """
+        Returns the family of a URL returned by this class: "session" for session creation,
+        "signal" for signals, "moderation" for force disconnect and force mute, "sip" for SIP
+        dial and DTMF, "stream" for the other stream calls, or the API name ("archive",
+        "broadcast", "render", "connect", "captions"). Returns "other" for any other URL.
+        """
+        path = url.split("?", 1)[0]
+        if path.startswith(self.api_url):
+            path = path[len(self.api_url) :]
+        parts = path.strip("/").split("/")
+        if parts[:2] == ["session", "create"]:
+            return "session"
+        if parts[:2] == ["v2", "project"]:
+            parts = parts[3:]
+        if not parts:
+            return "other"
+
+        if parts[0] == "session":
+            last = parts[-1]
+            if last == "signal":
+                return "signal"
+            if last == "play-dtmf":
+                return "sip"
+            if last == "mute" or (last != "stream" and method == "DELETE"):
+                return "moderation"
+            if "stream" in parts:
+                return "stream"
+            return "session"
+        if parts[0] == "dial":
+            return "sip"
+        if parts[0] in self.ENDPOINT_FAMILIES:
+            return parts[0]
+        return "other"
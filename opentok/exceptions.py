@@ -26,6 +26,10 @@ class ArchiveError(OpenTokException):
     """
 
 
+class ArchiveTimeoutError(ArchiveError):
+    """Indicates that an archive did not reach the expected status before the timeout."""
+
+
 class SignalingError(OpenTokException):
     """Indicates that there was a signaling specific problem, one of the parameter
     is invalid or the type|data string doesn't have a correct size"""
@@ -116,3 +120,29 @@ class CaptioningAlreadyInProgressError(OpenTokException):
     """
     Indicates that captioning was requested for an OpenTok session where live captions have already started.
     """
+
+
+class RateLimitError(OpenTokException):
+    """
+    Indicates that a request was not sent because the client-side rate limit of its endpoint
+    family was reached (see the RateLimiter class).
+    """
+
+
+class CircuitOpenError(OpenTokException):
+    """
+    Indicates that a request was not sent because the circuit breaker of its endpoint family
+    is open (see the CircuitBreaker class).
+
+    :ivar family: The endpoint family of the request.
+    :ivar retry_after: The number of seconds before the circuit lets a probe request through.
+    """
+
+    def __init__(self, family, retry_after):
+        super(CircuitOpenError, self).__init__(
+            "The circuit breaker for {0} requests is open, retry in {1:.1f}s".format(
+                family, retry_after
+            )
+        )
+        self.family = family
+        self.retry_after = retry_after
@@ -0,0 +1,266 @@
+import bisect
+import json
+import threading
+from urllib.parse import urlencode
+
+
+def _body_size(kwargs):
+    """For internal use. Returns the size, in bytes, of the body of a Request."""
+    body = kwargs.get("data")
+    if body is None and kwargs.get("json") is not None:
+        body = json.dumps(kwargs["json"])
+    if body is None:
+        return 0
+    if isinstance(body, dict):
+        body = urlencode(body)
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    return len(body)
+
+
+class RequestMetrics(object):
+    """
+    Describes one HTTP request sent to the OpenTok API, for the hooks registered with
+    Client.add_request_hook() and Client.add_response_hook().
+
+    Request hooks get the metrics before the request is sent, when only method, url, family
+    and request_bytes are set. Response hooks get the same object once the response is
+    received, or once sending the request failed.
+
+    :ivar method: The HTTP method.
+
+    :ivar url: The URL of the request.
+
+    :ivar family: The endpoint family of the request (see Endpoints.ENDPOINT_FAMILIES).
+
+    :ivar request_bytes: The size of the request body, in bytes.
+
+    :ivar status_code: The HTTP status code of the response, or None when the request failed.
+
+    :ivar response_bytes: The size of the response body, in bytes.
+
+    :ivar connect: The number of seconds spent opening a connection (including the TLS
+        handshake), 0 when a pooled connection was reused.
+
+    :ivar ttfb: The number of seconds from the start of the request to the response headers.
+
+    :ivar total: The number of seconds from the start of the request to the end of the
+        response body.
+
+    :ivar exception: The exception raised while sending the request, if any.
+    """
+
+    __slots__ = (
+        "method",
+        "url",
+        "family",
+        "request_bytes",
+        "status_code",
+        "response_bytes",
+        "connect",
+        "ttfb",
+        "total",
+        "exception",
+    )
+
+    def __init__(self, request):
+        self.method = request.method
+        self.url = request.url
+        self.family = request.family
+        self.request_bytes = _body_size(request.kwargs)
+        self.status_code = None
+        self.response_bytes = None
+        self.connect = 0.0
+        self.ttfb = None
+        self.total = None
+        self.exception = None
+
+    def record(self, total, response=None, exception=None):
+        """For internal use. Completes the metrics once the request is over."""
+        self.total = total
+        self.exception = exception
+        if response is not None:
+            self.status_code = response.status_code
+            self.response_bytes = len(response.content or b"")
+        if self.ttfb is None or self.ttfb > total:
+            self.ttfb = total
+
+    def __repr__(self):
+        return "<RequestMetrics %s %s %s %.3fs>" % (
+            self.method,
+            self.family,
+            self.status_code,
+            self.total or 0.0,
+        )
+
+
+class _Series(object):
+    __slots__ = ("buckets", "count", "sum", "max", "statuses")
+
+    def __init__(self, size):
+        self.buckets = [0] * size
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self.statuses = {}
+
+
+class LatencyHistogram(object):
+    """
+    An in-memory histogram of the duration of the requests of a client, by endpoint family.
+    Register it as a response hook::
+
+        histogram = LatencyHistogram()
+        client.add_response_hook(histogram)
+        ...
+        histogram.percentile("archive", 0.99)
+
+    Percentiles are estimated from the buckets, interpolating linearly inside the bucket
+    that holds them, the same way as the histogram_quantile() function of Prometheus.
+
+    :param buckets: The upper bounds of the buckets, in seconds, in increasing order. A
+        last bucket holds the requests slower than the highest bound.
+    """
+
+    DEFAULT_BUCKETS = (
+        0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.15, 0.2, 0.3, 0.4,
+        0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 7.5, 10.0, 30.0,
+    )
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.bounds = tuple(sorted(buckets))
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, metrics):
+        self.observe(
+            metrics.family,
+            metrics.total,
+            metrics.status_code if metrics.exception is None else "error",
+        )
+
+    def observe(self, family, duration, status=None):
+        """Records a request of an endpoint family that took duration seconds."""
+        index = bisect.bisect_left(self.bounds, duration)
+        with self._lock:
+            series = self._series.get(family)
+            if series is None:
+                series = self._series[family] = _Series(len(self.bounds) + 1)
+            series.buckets[index] += 1
+            series.count += 1
+            series.sum += duration
+            if duration > series.max:
+                series.max = duration
+            if status is not None:
+                series.statuses[status] = series.statuses.get(status, 0) + 1
+
+    def families(self):
+        """Returns the endpoint families with recorded requests."""
+        with self._lock:
+            return sorted(self._series)
+
+    def count(self, family):
+        """Returns the number of recorded requests of an endpoint family."""
+        with self._lock:
+            series = self._series.get(family)
+            return series.count if series is not None else 0
+
+    def percentile(self, family, q):
+        """
+        Returns the estimated q-quantile (between 0 and 1) of the duration of the requests
+        of an endpoint family, in seconds, or None when no request is recorded.
+        """
+        with self._lock:
+            series = self._series.get(family)
+            if series is None or not series.count:
+                return None
+            rank = q * series.count
+            seen = 0
+            lower = 0.0
+            for index, count in enumerate(series.buckets):
+                upper = self.bounds[index] if index < len(self.bounds) else series.max
+                upper = min(upper, series.max)
+                if count and seen + count >= rank:
+                    return lower + (upper - lower) * (rank - seen) / count
+                seen += count
+                lower = upper
+            return series.max
+
+    def summary(self):
+        """
+        Returns a dictionary with the count, the total duration and the 50th, 95th and 99th
+        percentiles of every endpoint family, in seconds.
+        """
+        return {
+            family: {
+                "count": self.count(family),
+                "sum": self._series[family].sum,
+                "p50": self.percentile(family, 0.5),
+                "p95": self.percentile(family, 0.95),
+                "p99": self.percentile(family, 0.99),
+            }
+            for family in self.families()
+        }
+
+    def reset(self):
+        """Forgets every recorded request."""
+        with self._lock:
+            self._series.clear()
+
+    def prometheus(self, prefix="opentok"):
+        """
+        Returns the histogram in the Prometheus text exposition format, with the
+        <prefix>_request_duration_seconds histogram and the <prefix>_requests_total counter,
+        labelled by family (and by status for the counter).
+        """
+        name = prefix + "_request_duration_seconds"
+        lines = [
+            "# HELP %s Duration of the OpenTok API requests." % name,
+            "# TYPE %s histogram" % name,
+        ]
+        totals = []
+        with self._lock:
+            for family in sorted(self._series):
+                series = self._series[family]
+                cumulative = 0
+                for index, count in enumerate(series.buckets):
+                    cumulative += count
+                    le = "%g" % self.bounds[index] if index < len(self.bounds) else "+Inf"
+                    lines.append(
+                        '%s_bucket{family="%s",le="%s"} %d' % (name, family, le, cumulative)
+                    )
+                lines.append('%s_sum{family="%s"} %r' % (name, family, series.sum))
+                lines.append('%s_count{family="%s"} %d' % (name, family, series.count))
+                for status, count in sorted(series.statuses.items(), key=str):
+                    totals.append(
+                        '%s_requests_total{family="%s",status="%s"} %d'
+                        % (prefix, family, status, count)
+                    )
+        lines.append("# HELP %s_requests_total OpenTok API requests." % prefix)
+        lines.append("# TYPE %s_requests_total counter" % prefix)
+        return "\n".join(lines + totals) + "\n"
+
+    def statsd_lines(self, prefix="opentok"):
+        """
+        Returns StatsD gauges of the count and of the 50th, 95th and 99th percentiles, in
+        milliseconds, of every endpoint family, such as ``opentok.archive.p99:12.5|g``.
+        """
+        lines = []
+        for family, values in self.summary().items():
+            lines.append("%s.%s.count:%d|g" % (prefix, family, values["count"]))
+            for key in ("p50", "p95", "p99"):
+                lines.append("%s.%s.%s:%.3f|g" % (prefix, family, key, values[key] * 1000))
+        return lines
+
+    def send_statsd(self, host="127.0.0.1", port=8125, prefix="opentok"):
+        """Sends the gauges of statsd_lines() to a StatsD server over UDP."""
+        import socket
+
+        lines = self.statsd_lines(prefix)
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            for line in lines:
+                sock.sendto(line.encode("ascii"), (host, port))
+        finally:
+            sock.close()
+        return len(lines)
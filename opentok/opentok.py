@@ -1,6 +1,6 @@
 from datetime import datetime  # generate_token
 import re
-from typing import List, Optional  # imports List, Optional type hint
+from typing import TYPE_CHECKING, List, Optional  # imports List, Optional type hint
 import calendar  # generate_token
 import base64  # generate_token
 import random  # generate_token
@@ -8,13 +8,8 @@ import time  # generate_token
 import hmac  # _sign_string
 import hashlib
 from typing import List
-import uuid
-import requests  # create_session, archiving
+import threading
 import json  # archiving
-import platform  # user-agent
-from socket import inet_aton  # create_session
-import xml.dom.minidom as xmldom  # create_session
-from jwt import encode  # _create_jwt_auth_header
 import random  # _create_jwt_auth_header
 import logging  # logging
 import warnings  # Native. Used for notifying deprecations
@@ -25,10 +20,21 @@ from urllib.parse import urlencode
 from six import text_type, u, b, PY3
 from enum import Enum
 
+if TYPE_CHECKING:
+    import requests  # return type hints
+
 from .version import __version__
 from .endpoints import Endpoints
-from .session import Session
+from .transport import Transport, Request, operation
+from .pagination import iter_pages, fetch_all_pages, merge_pages
+from .bulk import DEFAULT_BULK_RATE, run_concurrently
+from .tokens import TokenMinter, SigningPool
+from .session import Session, session_id_from_json, session_id_from_xml
 from .archives import Archive, ArchiveList, OutputModes, StreamModes
+from .archive_export import EXPORT_WRITERS
+from .archive_watcher import READY_STATES, _ArchiveWait
+from .instrumentation import RequestMetrics
+from . import tracing
 from .captions import Captions
 from .render import Render, RenderList
 from .stream import Stream
@@ -56,6 +62,8 @@ from .exceptions import (
     InvalidWebSocketOptionsError,
     InvalidMediaModeError,
     CaptioningAlreadyInProgressError,
+    CircuitOpenError,
+    RateLimitError,
 )
 
 
@@ -118,11 +126,32 @@ class Client(object):
     on OpenTok API key and secret, you can pass in a Vonage application ID and private key,
     e.g. api_key=VONAGE_APPLICATION_ID, api_secret=VONAGE_PRIVATE_KEY. You do not need to set the API
     URL differently, the SDK will set this for you.
+
+    Every request to the OpenTok API goes through a connection pool owned by the client, so
+    keep-alive connections are reused between calls. Use the pool_connections, pool_maxsize
+    and pool_idle_timeout parameters to size the pool (see the Transport class), and call
+    close() (or use the client as a context manager) to release the connections.
+
+    Failed requests are not retried unless a retry_policy (see the RetryPolicy class) is set,
+    either as a parameter or with the retry_policy attribute. Likewise, set a rate_limiter
+    (see the RateLimiter class) to keep requests under the per-project rate limits, and a
+    circuit_breaker (see the CircuitBreaker class) to fail fast while the API is degraded.
+
+    Pass an OpenTelemetry tracer, such as ``opentelemetry.trace.get_tracer("opentok")``, as
+    the tracer parameter to get a span for every call to the OpenTok API (opentok.start_archive,
+    opentok.dial, ...), with a child span for every HTTP request sent and for the signature
+    of the JWT auth header. Without a tracer, no span is created.
     """
 
     TOKEN_SENTINEL = "T1=="
     """For internal use."""
 
+    TOKEN_SPEC_FIELDS = ("role", "data", "expire_time", "initial_layout_class_list")
+    """The order of the values in a tuple token spec passed to generate_tokens()."""
+
+    JWT_REFRESH_MARGIN = 30
+    """The number of seconds before expiry at which the cached JWT auth header is re-signed."""
+
     def __init__(
         self,
         api_key,
@@ -130,6 +159,13 @@ class Client(object):
         api_url="https://api.opentok.com",
         timeout=None,
         app_version=None,
+        pool_connections=10,
+        pool_maxsize=10,
+        pool_idle_timeout=None,
+        retry_policy=None,
+        rate_limiter=None,
+        circuit_breaker=None,
+        tracer=None,
     ):
 
         if isinstance(api_secret, (str, bytes)) and re.search(
@@ -148,14 +184,32 @@ class Client(object):
 
         self.api_key = str(api_key)
         self.timeout = timeout
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.tracer = tracer
+        self._request_hooks = ()
+        self._response_hooks = ()
         self._proxies = None
         self.endpoints = Endpoints(self._api_url, self.api_key)
         self._app_version = __version__ if app_version == None else app_version
+        import platform  # user-agent
+
+        self._python_version = platform.python_version()
         self._user_agent = (
-            f"OpenTok-Python-SDK/{self.app_version} python/{platform.python_version()}"
+            f"OpenTok-Python-SDK/{self.app_version} python/{self._python_version}"
         )
         # JWT custom claims - Default values
         self._jwt_livetime = 3  # In minutes
+        self._jwt_auth_header = None  # (token, refresh time) cached by _create_jwt_auth_header
+        self._jwt_lock = threading.Lock()
+        self._token_minter = None  # (api_secret, TokenMinter) used by generate_token
+        self._signing_pool = None
+        self._transport = Transport(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            idle_timeout=pool_idle_timeout,
+        )
 
     @property
     def proxies(self):
@@ -180,6 +234,47 @@ class Client(object):
     def append_to_user_agent(self, value):
         self._user_agent = self._user_agent + value
 
+    @property
+    def transport(self):
+        """The connection-pooled transport used for every request to the OpenTok API."""
+        return self._transport
+
+    def add_request_hook(self, hook):
+        """
+        Registers a function called with a RequestMetrics before every request to the OpenTok
+        API is sent, including every retry. Hooks run on the thread (or the event loop) that
+        sends the request, so they must be fast; an exception raised by a hook is logged and
+        ignored.
+        """
+        self._request_hooks = self._request_hooks + (hook,)
+
+    def add_response_hook(self, hook):
+        """
+        Registers a function called with a RequestMetrics after every request to the OpenTok
+        API, once the response is read or once sending the request failed. Pass a
+        LatencyHistogram to collect latency percentiles by endpoint family.
+        """
+        self._response_hooks = self._response_hooks + (hook,)
+
+    def remove_hook(self, hook):
+        """Unregisters a request or response hook."""
+        self._request_hooks = tuple(h for h in self._request_hooks if h != hook)
+        self._response_hooks = tuple(h for h in self._response_hooks if h != hook)
+
+    def close(self):
+        """
+        Closes the pooled connections to the OpenTok API. The client can still be used
+        afterwards; new connections are opened on the next request.
+        """
+        self._transport.close()
+        self.disable_signing_pool()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
     @property
     def jwt_livetime(self):
         return self._jwt_livetime
@@ -187,6 +282,7 @@ class Client(object):
     @jwt_livetime.setter
     def jwt_livetime(self, minutes):
         self._jwt_livetime = minutes
+        self._jwt_auth_header = None
 
     def generate_token(
         self,
@@ -235,42 +331,145 @@ class Client(object):
           `composed archives <https://tokbox.com/developer/guides/archiving/layout-control.html>`_
 
         :param bool use_jwt: Whether to use JWT tokens or not. If set to False, the token will be a
-            plain text token. If set to True (the default), the token will be a JWT.
+            plain text token. If set to True (the default), the token will be a JWT. With Vonage
+            credentials, tokens are always JWTs: setting this to False raises an
+            OpenTokException.
 
         :rtype:
           The token string.
         """
 
-        # normalize
-        # expire_time can be an integer, a datetime object, or anything else that can be coerced into an integer
-        # after this block it will only be an integer
-        if expire_time is not None:
-            if isinstance(expire_time, datetime):
-                expire_time = calendar.timegm(expire_time.utctimetuple())
+        now = int(time.time())
+        expire_time = self._normalize_expire_time(expire_time, now)
+        self._validate_token_session_id(session_id)
+        self._validate_token_options(role, expire_time, data, now)
+        initial_layout_class_list_serialized = self._serialize_layout_class_list(
+            initial_layout_class_list
+        )
+
+        return self._mint_token(
+            self._get_token_minter(),
+            session_id,
+            role,
+            expire_time,
+            data,
+            initial_layout_class_list_serialized,
+            use_jwt,
+            now,
+        )
+
+    def generate_tokens(self, session_id, specs, use_jwt=True):
+        """
+        Generates many tokens for a given session.
+
+        The session ID is decoded and validated once, and the JWT header and signing key are
+        prepared once, so this is much faster than calling generate_token() in a loop when
+        issuing a large number of tokens.
+
+        :param String session_id: The session ID of the session to be accessed by the clients
+          using the tokens.
+
+        :param list specs: One item per token to generate. Each item is either a dictionary
+          with any of the role, data, expire_time and initial_layout_class_list keys, or a
+          tuple with the same values in that order, for example
+          ``(Roles.moderator, "name=Johnny")``. These have the same meaning and defaults as the
+          parameters of generate_token().
+
+        :param bool use_jwt: Whether to generate JWT tokens (True, the default) or T1 tokens.
+            T1 tokens require OpenTok credentials.
+
+        With Vonage credentials, call enable_signing_pool() first to spread the RS256
+        signatures across several CPU cores.
+
+        :rtype:
+          A list of token strings, in the same order as specs.
+        """
+        now = int(time.time())
+        self._validate_token_session_id(session_id)
+        minter = self._get_token_minter()
+        signing_pool = self._signing_pool
+        serialized_layouts = {}
+
+        tokens = []
+        payloads = []
+        for spec in specs:
+            if not isinstance(spec, dict):
+                spec = dict(zip(self.TOKEN_SPEC_FIELDS, spec))
+            role = spec.get("role", Roles.publisher)
+            data = spec.get("data")
+            expire_time = self._normalize_expire_time(spec.get("expire_time"), now)
+            self._validate_token_options(role, expire_time, data, now)
+
+            # layout class lists are usually shared by many specs, validate each one once
+            initial_layout_class_list = tuple(spec.get("initial_layout_class_list") or ())
+            serialized = serialized_layouts.get(initial_layout_class_list)
+            if serialized is None:
+                serialized = self._serialize_layout_class_list(initial_layout_class_list)
+                serialized_layouts[initial_layout_class_list] = serialized
+
+            if use_jwt and signing_pool is not None:
+                payloads.append(
+                    self._token_payload(session_id, role, expire_time, data, serialized, now)
+                )
             else:
-                try:
-                    expire_time = int(expire_time)
-                except (ValueError, TypeError):
-                    raise OpenTokException(
-                        u("Cannot generate token, invalid expire time {0}").format(
-                            expire_time
-                        )
+                tokens.append(
+                    self._mint_token(
+                        minter, session_id, role, expire_time, data, serialized, use_jwt, now
                     )
-        else:
-            expire_time = int(time.time()) + (60 * 60 * 24)  # 1 day
+                )
 
-        # validations
-        if not text_type(session_id):
+        if payloads:
+            signing_inputs = [minter.signing_input(payload) for payload in payloads]
+            signatures = signing_pool.sign(signing_inputs)
+            tokens = list(map(minter.join, signing_inputs, signatures))
+        return tokens
+
+    def enable_signing_pool(self, workers=None, chunk_size=64):
+        """
+        Spreads the signatures of generate_tokens() across a pool of worker processes.
+
+        This is only used with Vonage credentials, where every token is signed with RS256,
+        a CPU-bound private key operation that a single Python process can only run on one
+        core at a time. Each worker process parses the private key once. Tokens are still
+        returned in the same order as the specs passed to generate_tokens().
+
+        Call close() to stop the worker processes.
+
+        :param int workers: The number of worker processes. Defaults to the number of CPUs.
+
+        :param int chunk_size: The number of tokens signed per task sent to a worker.
+        """
+        self.disable_signing_pool()
+        if self._using_vonage:
+            self._signing_pool = SigningPool(
+                self.api_secret, "RS256", workers=workers, chunk_size=chunk_size
+            )
+
+    def disable_signing_pool(self):
+        """Stops the worker processes started by enable_signing_pool()."""
+        if self._signing_pool is not None:
+            self._signing_pool.close()
+            self._signing_pool = None
+
+    def _normalize_expire_time(self, expire_time, now):
+        # expire_time can be an integer, a datetime object, or anything else that can be coerced into an integer
+        # the result will only be an integer
+        if expire_time is None:
+            return now + (60 * 60 * 24)  # 1 day
+        if isinstance(expire_time, datetime):
+            return calendar.timegm(expire_time.utctimetuple())
+        try:
+            return int(expire_time)
+        except (ValueError, TypeError):
             raise OpenTokException(
-                u("Cannot generate token, session_id was not valid {0}").format(
-                    session_id
-                )
+                u("Cannot generate token, invalid expire time {0}").format(expire_time)
             )
+
+    def _validate_token_options(self, role, expire_time, data, now):
         if not isinstance(role, Roles):
             raise OpenTokException(
                 u("Cannot generate token, {0} is not a valid role").format(role)
             )
-        now = int(time.time())
         if expire_time < now:
             raise OpenTokException(
                 u("Cannot generate token, expire_time is not in the future {0}").format(
@@ -287,6 +486,8 @@ class Client(object):
             raise OpenTokException(
                 u("Cannot generate token, data must be less than 1000 characters")
             )
+
+    def _serialize_layout_class_list(self, initial_layout_class_list):
         if initial_layout_class_list and not all(
             text_type(c) for c in initial_layout_class_list
         ):
@@ -302,6 +503,15 @@ class Client(object):
                     "Cannot generate token, initial_layout_class_list must be less than 1000 characters"
                 )
             )
+        return initial_layout_class_list_serialized
+
+    def _validate_token_session_id(self, session_id):
+        if not text_type(session_id):
+            raise OpenTokException(
+                u("Cannot generate token, session_id was not valid {0}").format(
+                    session_id
+                )
+            )
 
         # decode session id to verify api_key
         sub_session_id = session_id[2:]
@@ -325,46 +535,45 @@ class Client(object):
                 ).format(session_id, self.api_key)
             )
 
-        if use_jwt:
-            payload = {}
-
-            payload['session_id'] = session_id
-            payload['role'] = role.value
-            payload['iat'] = now
-            payload["exp"] = expire_time
-            payload['scope'] = 'session.connect'
-
-            if initial_layout_class_list:
-                payload['initial_layout_class_list'] = (
-                    initial_layout_class_list_serialized
-                )
-            if data:
-                payload['connection_data'] = data
-
-            if not self._using_vonage:
-                payload['iss'] = self.api_key
-                payload['ist'] = 'project'
-                payload['nonce'] = random.randint(0, 999999)
-
-                headers = {'alg': 'HS256', 'typ': 'JWT'}
-
-                token = encode(
-                    payload, self.api_secret, algorithm="HS256", headers=headers
-                )
-            else:
-                payload['application_id'] = self.api_key
-                payload['jti'] = str(uuid.uuid4())
-                payload['subject'] = 'video'
-                payload['acl'] = {'paths': {'/session/**': {}}}
-
-                headers = {'alg': 'RS256', 'typ': 'JWT'}
+    def _get_token_minter(self):
+        """Returns a TokenMinter for the current api_secret, creating it on first use."""
+        cached = self._token_minter
+        if cached is None or cached[0] is not self.api_secret:
+            algorithm = "RS256" if self._using_vonage else "HS256"
+            cached = self._token_minter = (
+                self.api_secret,
+                TokenMinter(self.api_secret, algorithm),
+            )
+        return cached[1]
 
-                token = encode(
-                    payload, self.api_secret, algorithm="RS256", headers=headers
+    def _mint_token(
+        self,
+        minter,
+        session_id,
+        role,
+        expire_time,
+        data,
+        initial_layout_class_list_serialized,
+        use_jwt,
+        now,
+    ):
+        if use_jwt:
+            return minter.encode(
+                self._token_payload(
+                    session_id,
+                    role,
+                    expire_time,
+                    data,
+                    initial_layout_class_list_serialized,
+                    now,
                 )
+            )
 
-            return token
-
+        if self._using_vonage:
+            # T1 tokens are signed with the OpenTok API secret, which Vonage credentials lack
+            raise OpenTokException(
+                u("Cannot generate token, T1 tokens require OpenTok credentials, use a JWT")
+            )
         data_params = dict(
             session_id=session_id,
             create_time=now,
@@ -377,7 +586,7 @@ class Client(object):
             data_params["connection_data"] = data
         data_string = urlencode(data_params, True)
 
-        sig = self._sign_string(data_string, self.api_secret)
+        sig = minter.sign_legacy(data_string)
         decoded_base64_bytes = u("partner_id={api_key}&sig={sig}:{payload}").format(
             api_key=self.api_key, sig=sig, payload=data_string
         )
@@ -390,6 +599,43 @@ class Client(object):
 
         return token
 
+    def _token_payload(
+        self,
+        session_id,
+        role,
+        expire_time,
+        data,
+        initial_layout_class_list_serialized,
+        now,
+    ):
+        payload = {}
+
+        payload['session_id'] = session_id
+        payload['role'] = role.value
+        payload['iat'] = now
+        payload["exp"] = expire_time
+        payload['scope'] = 'session.connect'
+
+        if initial_layout_class_list_serialized:
+            payload['initial_layout_class_list'] = initial_layout_class_list_serialized
+        if data:
+            payload['connection_data'] = data
+
+        if not self._using_vonage:
+            payload['iss'] = self.api_key
+            payload['ist'] = 'project'
+            payload['nonce'] = random.randint(0, 999999)
+        else:
+            import uuid
+
+            payload['application_id'] = self.api_key
+            payload['jti'] = str(uuid.uuid4())
+            payload['subject'] = 'video'
+            payload['acl'] = {'paths': {'/session/**': {}}}
+
+        return payload
+
+    @operation
     def create_session(
         self,
         location=None,
@@ -471,8 +717,19 @@ class Client(object):
 
         :rtype: The Session object. The session_id property of the object is the session ID.
         """
+        options = self._session_options(
+            location, media_mode, archive_mode, archive_name, archive_resolution, e2ee
+        )
+        return (
+            yield from self._create_session_operation(
+                options, location, media_mode, archive_mode, e2ee
+            )
+        )
 
-        # build options
+    def _session_options(
+        self, location, media_mode, archive_mode, archive_name, archive_resolution, e2ee
+    ):
+        """Validates the arguments of create_session and returns the form it posts."""
         options = {}
         if not isinstance(media_mode, MediaModes):
             raise OpenTokException(
@@ -523,6 +780,8 @@ class Client(object):
         if location:
             # validate IP address
             try:
+                from socket import inet_aton
+
                 inet_aton(location)
             except:
                 raise OpenTokException(
@@ -532,60 +791,45 @@ class Client(object):
                 )
             options[u("location")] = location
         options["e2ee"] = str(e2ee).lower()
+        return options
 
+    def _create_session_operation(self, options, location, media_mode, archive_mode, e2ee):
+        """The operation of create_session, for options already validated."""
         try:
-            logger.debug(
-                "POST to %r with params %r, headers %r, proxies %r",
-                self.endpoints.get_session_url(),
-                options,
-                self.get_json_headers(),
-                self.proxies,
-            )
             if not self._using_vonage:
-                response = requests.post(
+                response = yield Request(
+                    "POST",
                     self.endpoints.get_session_url(),
                     data=options,
                     headers=self.get_headers(),
-                    proxies=self.proxies,
-                    timeout=self.timeout,
                 )
             else:
                 headers = self.get_headers()
-                response = requests.post(
+                response = yield Request(
+                    "POST",
                     self.endpoints.get_session_url(),
                     data=options,
                     headers=headers,
-                    proxies=self.proxies,
-                    timeout=self.timeout,
                 )
             response.encoding = "utf-8"
             if response.status_code == 403:
                 raise AuthError("Failed to create session, invalid credentials")
             if not response.content:
                 raise RequestError()
+        except (CircuitOpenError, RateLimitError):
+            # the fail-fast errors of the circuit breaker and the rate limiter reach the caller
+            raise
         except Exception as e:
             raise RequestError("Failed to create session: %s" % str(e))
 
         try:
             content_type = response.headers["Content-Type"]
+            content = response.content.decode("utf-8")
             # Legacy behaviour
             if content_type != "application/json":
-                dom = xmldom.parseString(response.content.decode("utf-8"))
-                error = dom.getElementsByTagName("error")
-                if error:
-                    error = error[0]
-                    raise AuthError(
-                        "Failed to create session (code=%s): %s"
-                        % (
-                            error.attributes["code"].value,
-                            error.firstChild.attributes["message"].value,
-                        )
-                    )
-                session_id = (
-                    dom.getElementsByTagName("session_id")[0].childNodes[0].nodeValue
-                )
+                session_id = session_id_from_xml(content)
             else:
-                session_id = response.json()[0]["session_id"]
+                session_id = session_id_from_json(content)
             return Session(
                 self,
                 session_id,
@@ -597,6 +841,53 @@ class Client(object):
         except Exception as e:
             raise OpenTokException("Failed to generate session: %s" % str(e))
 
+    def create_sessions(
+        self,
+        count,
+        location=None,
+        media_mode=MediaModes.relayed,
+        archive_mode=ArchiveModes.manual,
+        archive_name=None,
+        archive_resolution=None,
+        e2ee=False,
+        concurrency=10,
+        rate=None,
+    ):
+        """
+        Creates many OpenTok sessions with the same settings at once, for example to provision
+        the sessions of scheduled meetings ahead of time.
+
+        The settings are validated once, then the requests are sent concurrently, at most
+        concurrency at a time, through the connection pool of the client. A failed request does
+        not stop the others.
+
+        :param int count: The number of sessions to create.
+
+        :param int concurrency: The maximum number of requests sent at the same time. Keep it
+        at or below the pool_maxsize of the client, so that every request reuses a pooled
+        connection.
+
+        :param float rate: Optional. The maximum number of requests sent per second.
+
+        See create_session() for the other parameters. An invalid setting raises an
+        OpenTokException before any request is sent.
+
+        :rtype: A list of count items, each either a Session object or the exception raised
+        while creating that session (AuthError, RequestError, OpenTokException, ...).
+        """
+        options = self._session_options(
+            location, media_mode, archive_mode, archive_name, archive_resolution, e2ee
+        )
+
+        def create(_):
+            return self._run(
+                self._create_session_operation(
+                    options, location, media_mode, archive_mode, e2ee
+                )
+            )
+
+        return self._run_bulk(create, range(count), None, concurrency, rate)
+
     def get_headers(self):
         """For internal use."""
         if not self._using_vonage:
@@ -604,7 +895,7 @@ class Client(object):
                 "User-Agent": "OpenTok-Python-SDK/"
                 + self.app_version
                 + " python/"
-                + platform.python_version(),
+                + self._python_version,
                 "X-OPENTOK-AUTH": self._create_jwt_auth_header(),
                 "Accept": "application/json",
             }
@@ -614,6 +905,12 @@ class Client(object):
             "Accept": "application/json",
         }
 
+    def _auth_header(self):
+        """For internal use. Returns the name and the value of the authentication header."""
+        if not self._using_vonage:
+            return "X-OPENTOK-AUTH", self._create_jwt_auth_header()
+        return "Authorization", "Bearer " + self._create_jwt_auth_header()
+
     def headers(self):
         warnings.warn(
             "opentok.headers is deprecated (use opentok.get_headers instead).",
@@ -636,6 +933,7 @@ class Client(object):
         )
         return self.get_json_headers()
 
+    @operation
     def start_archive(
         self,
         session_id,
@@ -756,20 +1054,11 @@ class Client(object):
         if layout is not None:
             payload["layout"] = layout
 
-        logger.debug(
-            "POST to %r with params %r, headers %r, proxies %r",
-            self.endpoints.get_archive_url(),
-            json.dumps(payload),
-            self.get_json_headers(),
-            self.proxies,
-        )
-
-        response = requests.post(
+        response = yield Request(
+            "POST",
             self.endpoints.get_archive_url(),
             data=json.dumps(payload),
             headers=self.get_json_headers(),
-            proxies=self.proxies,
-            timeout=self.timeout,
         )
 
         if response:
@@ -792,6 +1081,7 @@ class Client(object):
         else:
             raise RequestError("An unexpected error occurred", response.status_code)
 
+    @operation
     def stop_archive(self, archive_id):
         """
         Stops an OpenTok archive that is being recorded.
@@ -803,18 +1093,11 @@ class Client(object):
 
         :rtype: The Archive object corresponding to the archive being stopped.
         """
-        logger.debug(
-            "POST to %r with headers %r, proxies %r",
-            self.endpoints.get_archive_url(archive_id) + "/stop",
-            self.get_json_headers(),
-            self.proxies,
-        )
-
-        response = requests.post(
+        response = yield Request(
+            "POST",
             self.endpoints.get_archive_url(archive_id) + "/stop",
+            idempotent=True,
             headers=self.get_json_headers(),
-            proxies=self.proxies,
-            timeout=self.timeout,
         )
 
         if response.status_code < 300:
@@ -828,6 +1111,7 @@ class Client(object):
         else:
             raise RequestError("An unexpected error occurred", response.status_code)
 
+    @operation
     def delete_archive(self, archive_id):
         """
         Deletes an OpenTok archive.
@@ -838,18 +1122,10 @@ class Client(object):
 
         :param String archive_id: The archive ID of the archive to be deleted.
         """
-        logger.debug(
-            "DELETE to %r with headers %r, proxies %r",
-            self.endpoints.get_archive_url(archive_id),
-            self.get_json_headers(),
-            self.proxies,
-        )
-
-        response = requests.delete(
+        response = yield Request(
+            "DELETE",
             self.endpoints.get_archive_url(archive_id),
             headers=self.get_json_headers(),
-            proxies=self.proxies,
-            timeout=self.timeout,
         )
 
         if response.status_code < 300:
@@ -861,6 +1137,7 @@ class Client(object):
         else:
             raise RequestError("An unexpected error occurred", response.status_code)
 
+    @operation
     def get_archive(self, archive_id):
         """Gets an Archive object for the given archive ID.
 
@@ -868,18 +1145,10 @@ class Client(object):
 
         :rtype: The Archive object.
         """
-        logger.debug(
-            "GET to %r with headers %r, proxies %r",
-            self.endpoints.get_archive_url(archive_id),
-            self.get_json_headers(),
-            self.proxies,
-        )
-
-        response = requests.get(
+        response = yield Request(
+            "GET",
             self.endpoints.get_archive_url(archive_id),
             headers=self.get_json_headers(),
-            proxies=self.proxies,
-            timeout=self.timeout,
         )
 
         if response:
@@ -891,6 +1160,45 @@ class Client(object):
         else:
             raise RequestError("An unexpected error occurred", response.status_code)
 
+    def wait_for_archive(
+        self,
+        archive_id,
+        states=READY_STATES,
+        timeout=300,
+        min_interval=1.0,
+        max_interval=30.0,
+    ):
+        """
+        Waits until an archive reaches one of the given statuses, by default until it is
+        available or uploaded after stop_archive(), and returns the Archive object.
+
+        The archive is polled with adaptive delays: processing a stopped archive takes time
+        roughly proportional to its duration, so a long archive is polled rarely at first and
+        more often as it gets close to its expected processing time, then with a growing
+        delay. To wait for many archives at once, use an ArchiveWatcher.
+
+        :param String archive_id: The archive ID.
+
+        :param states: The statuses to wait for.
+
+        :param float timeout: The maximum number of seconds to wait, None to wait forever.
+
+        :param float min_interval: The shortest delay between two polls, in seconds.
+
+        :param float max_interval: The longest delay between two polls, in seconds.
+
+        :rtype: The Archive object, once its status is one of states. An ArchiveError is
+          raised if the archive fails, is deleted or expires, and an ArchiveTimeoutError
+          after timeout seconds.
+        """
+        wait = _ArchiveWait(archive_id, states, timeout, min_interval, max_interval)
+        while True:
+            archive = self.get_archive(archive_id)
+            if wait.done(archive):
+                return archive
+            time.sleep(wait.next_delay(archive))
+
+    @operation
     def get_archives(self, offset=None, count=None, session_id=None):
         """Returns an ArchiveList, which is an array of archives that are completed and in-progress,
         for your API key.
@@ -914,18 +1222,10 @@ class Client(object):
 
         endpoint = self.endpoints.get_archive_url() + "?" + urlencode(params)
 
-        logger.debug(
-            "GET to %r with headers %r, proxies %r",
-            endpoint,
-            self.get_json_headers(),
-            self.proxies,
-        )
-
-        response = requests.get(
+        response = yield Request(
+            "GET",
             endpoint,
             headers=self.get_json_headers(),
-            proxies=self.proxies,
-            timeout=self.timeout,
         )
 
         if response:
@@ -944,13 +1244,98 @@ class Client(object):
         """
         return self.get_archives(offset, count, session_id)
 
+    def iter_archives(self, session_id=None, page_size=100, prefetch=1):
+        """Returns an iterator over every archive for your API key, from the most recently
+        started one. Archives are fetched one page at a time with get_archives(), and the
+        next pages are fetched in background threads while the current one is processed, so
+        memory use does not depend on the number of archives.
+
+        An archive that moves to the next page because a new archive was started during the
+        iteration is only returned once.
+
+        :param string: session_id Optional. Used to list archives for a specific session ID.
+        :param int: page_size Optional. The number of archives fetched per request, up to 1000.
+        :param int: prefetch Optional. The number of pages fetched ahead, 1 by default. With 0,
+          each page is only fetched once the previous one has been consumed.
+
+        :rtype: An iterator of Archive objects.
+        """
+        if not 0 < page_size <= 1000:
+            raise OpenTokException("page_size must be between 1 and 1000")
+
+        def fetch_page(offset, count):
+            return self.get_archives(offset=offset, count=count, session_id=session_id)
+
+        return self._iter_unique_archives(iter_pages(fetch_page, page_size, prefetch))
+
+    def get_all_archives(self, session_id=None, page_size=1000, concurrency=8):
+        """Returns an ArchiveList with every archive for your API key. The first page tells the
+        total number of archives, then every remaining page is fetched at the same time, on up
+        to concurrency threads, and the pages are merged in order.
+
+        :param string: session_id Optional. Used to list archives for a specific session ID.
+        :param int: page_size Optional. The number of archives fetched per request, up to 1000.
+        :param int: concurrency Optional. The maximum number of pages fetched at the same time.
+
+        :rtype: An ArchiveList object, which is an array of Archive objects.
+        """
+        if not 0 < page_size <= 1000:
+            raise OpenTokException("page_size must be between 1 and 1000")
+
+        def fetch_page(offset, count):
+            return self.get_archives(offset=offset, count=count, session_id=session_id)
+
+        pages = fetch_all_pages(fetch_page, page_size, concurrency)
+        return merge_pages(ArchiveList(self, {}), pages)
+
+    def export_archives(
+        self, fp, format="ndjson", session_id=None, page_size=1000, prefetch=1
+    ):
+        """Writes every archive for your API key to a text file-like object, page by page as
+        they are fetched with iter_archives(), so the archives are never all held in memory.
+
+        :param file: fp The text file-like object written to. Open files written as CSV with
+          newline="".
+        :param string: format Optional. "ndjson" (the default) for one JSON object per line, or
+          "csv" for CSV with a header row.
+        :param string: session_id Optional. Used to export archives for a specific session ID.
+        :param int: page_size Optional. The number of archives fetched per request, up to 1000.
+        :param int: prefetch Optional. The number of pages fetched ahead.
+
+        :rtype: The number of archives written.
+        """
+        writer = self._export_writer(format, fp)
+        for archive in self.iter_archives(session_id, page_size, prefetch):
+            writer.write(archive)
+        return writer.count
+
+    @staticmethod
+    def _export_writer(format, fp):
+        if format not in EXPORT_WRITERS:
+            raise OpenTokException(
+                u("Unsupported export format {0}, use ndjson or csv").format(format)
+            )
+        return EXPORT_WRITERS[format](fp)
+
+    @staticmethod
+    def _iter_unique_archives(pages):
+        previous_ids = set()
+        for page in pages:
+            page_ids = set()
+            for archive in page:
+                page_ids.add(archive.id)
+                if archive.id not in previous_ids:
+                    yield archive
+            previous_ids = page_ids
+
+    @operation
     def add_archive_stream(
         self,
         archive_id: str,
         stream_id: str,
         has_audio: bool = True,
         has_video: bool = True,
-    ) -> requests.Response:
+    ) -> "requests.Response":
         """
         This method will add streams to the archive with addStream for new participant(choosing audio, video or both).
 
@@ -968,12 +1353,11 @@ class Client(object):
 
         streams = {"hasAudio": has_audio, "hasVideo": has_video, "addStream": stream_id}
 
-        response = requests.patch(
+        response = yield Request(
+            "PATCH",
             endpoint,
             data=json.dumps(streams),
             headers=self.get_json_headers(),
-            proxies=self.proxies,
-            timeout=self.timeout,
         )
 
         if response:
@@ -1001,7 +1385,8 @@ class Client(object):
         else:
             raise RequestError("An unexpected error occurred.", response.status_code)
 
-    def remove_archive_stream(self, archive_id: str, stream_id: str) -> requests.Response:
+    @operation
+    def remove_archive_stream(self, archive_id: str, stream_id: str) -> "requests.Response":
         """
         This method will remove streams from the archive with removeStream.
 
@@ -1013,12 +1398,11 @@ class Client(object):
 
         streams = {"removeStream": stream_id}
 
-        response = requests.patch(
+        response = yield Request(
+            "PATCH",
             endpoint,
             data=json.dumps(streams),
             headers=self.get_json_headers(),
-            proxies=self.proxies,
-            timeout=self.timeout,
         )
 
         if response:
@@ -1046,6 +1430,7 @@ class Client(object):
         else:
             raise RequestError("An unexpected error occurred.", response.status_code)
 
+    @operation
     def send_signal(self, session_id, payload, connection_id=None):
         """
         Send signals to all participants in an active OpenTok session or to a specific client
@@ -1061,52 +1446,96 @@ class Client(object):
         the signal is sent to the specified client. Otherwise, the signal is sent to all clients
         connected to the session
         """
-        logger.debug(
-            "POST to %r with params %r, headers %r, proxies %r",
-            self.endpoints.get_signaling_url(session_id, connection_id),
-            json.dumps(payload),
-            self.get_json_headers(),
-            self.proxies,
+        return (
+            yield from self._send_signal_operation(
+                session_id, json.dumps(payload), connection_id
+            )
         )
 
-        response = requests.post(
+    def _send_signal_operation(self, session_id, data, connection_id=None):
+        """The operation of send_signal, for a payload already serialized to JSON."""
+        response = yield Request(
+            "POST",
             self.endpoints.get_signaling_url(session_id, connection_id),
-            data=json.dumps(payload),
+            data=data,
             headers=self.get_json_headers(),
-            proxies=self.proxies,
-            timeout=self.timeout,
         )
 
-        if response:
-            if response.status_code == 204:
-                return None
-            elif response.status_code == 400:
-                raise SignalingError(
-                    "One of the signal properties - data, type, sessionId or connectionId - is invalid."
-                )
-            elif response.status_code == 403:
-                raise AuthError(
-                    "You are not authorized to send the signal. Check your authentication credentials."
-                )
-            elif response.status_code == 404:
-                raise SignalingError(
-                    "The client specified by the connectionId property is not connected to the session."
-                )
-            elif response.status_code == 413:
-                raise SignalingError(
-                    "The type string exceeds the maximum length (128 bytes), or the data string exceeds the maximum size (8 kB)."
-                )
-        else:
+        if response.status_code == 204:
+            return None
+        elif response.status_code == 400:
+            raise SignalingError(
+                "One of the signal properties - data, type, sessionId or connectionId - is invalid."
+            )
+        elif response.status_code == 403:
+            raise AuthError(
+                "You are not authorized to send the signal. Check your authentication credentials."
+            )
+        elif response.status_code == 404:
+            raise SignalingError(
+                "The client specified by the connectionId property is not connected to the session."
+            )
+        elif response.status_code == 413:
+            raise SignalingError(
+                "The type string exceeds the maximum length (128 bytes), or the data string exceeds the maximum size (8 kB)."
+            )
+        elif not response:
             raise RequestError("An unexpected error occurred.", response.status_code)
 
+    def send_signals(self, session_id, signals, concurrency=10, rate=None):
+        """
+        Sends signals to many clients connected to an OpenTok session at once.
+
+        The payloads are serialized before any request is sent, then the requests are sent
+        concurrently, at most concurrency at a time, through the connection pool of the client.
+        A failed signal does not stop the others.
+
+        :param String session_id: The session ID of the OpenTok session that receives the signals
+
+        :param list signals: (connection_id, payload) tuples, where payload is a dictionary with
+        the type and data fields (see send_signal). A connection_id of None sends the signal to
+        all clients connected to the session.
+
+        :param int concurrency: The maximum number of signals sent at the same time. Keep it
+        at or below the pool_maxsize of the client, so that every request reuses a pooled
+        connection.
+
+        :param float rate: Optional. The maximum number of signals sent per second.
+
+        :rtype: A list with the outcome of every signal, in the order of signals: None when the
+        signal was sent, or the exception raised for it (SignalingError for the 400, 404 and
+        413 responses, AuthError, RequestError, ...). A connection can receive several
+        signals, so the outcomes are not keyed by connection ID.
+        """
+        targets = [
+            (connection_id, json.dumps(payload)) for connection_id, payload in signals
+        ]
+
+        def send(target):
+            connection_id, data = target
+            return self._run(
+                self._send_signal_operation(session_id, data, connection_id)
+            )
+
+        return self._run_bulk(send, targets, None, concurrency, rate)
+
+    def _run_bulk(self, func, items, keys, concurrency, rate=None):
+        """
+        Runs func for every item concurrently and maps each key to the item's outcome, or
+        returns the outcomes in the order of items when keys is None.
+        """
+        outcomes = run_concurrently(func, items, concurrency, rate)
+        return outcomes if keys is None else dict(zip(keys, outcomes))
+
     def signal(self, session_id, payload, connection_id=None):
         warnings.warn(
             "opentok.signal is deprecated (use opentok.send_signal instead).",
             DeprecationWarning,
             stacklevel=2,
         )
-        self.send_signal(session_id, payload, connection_id)
+        return self.send_signal(session_id, payload, connection_id)
 
+    @operation
     def get_stream(self, session_id, stream_id):
         """
         Returns an Stream object that contains information of an OpenTok stream:
@@ -1118,18 +1547,10 @@ class Client(object):
         """
         endpoint = self.endpoints.get_stream_url(session_id, stream_id)
 
-        logger.debug(
-            "GET to %r with headers %r, proxies %r",
-            endpoint,
-            self.get_json_headers(),
-            self.proxies,
-        )
-
-        response = requests.get(
+        response = yield Request(
+            "GET",
             endpoint,
             headers=self.get_json_headers(),
-            proxies=self.proxies,
-            timeout=self.timeout,
         )
 
         if response.status_code == 200:
@@ -1145,6 +1566,7 @@ class Client(object):
         else:
             raise RequestError("An unexpected error occurred", response.status_code)
 
+    @operation
     def list_streams(self, session_id):
         """
         Returns a list of Stream objects that contains information of all
@@ -1155,18 +1577,10 @@ class Client(object):
         """
         endpoint = self.endpoints.get_stream_url(session_id)
 
-        logger.debug(
-            "GET to %r with headers %r, proxies %r",
-            endpoint,
-            self.get_json_headers(),
-            self.proxies,
-        )
-
-        response = requests.get(
+        response = yield Request(
+            "GET",
             endpoint,
             headers=self.get_json_headers(),
-            proxies=self.proxies,
-            timeout=self.timeout,
         )
 
         if response.status_code == 200:
@@ -1182,6 +1596,7 @@ class Client(object):
         else:
             raise RequestError("An unexpected error occurred", response.status_code)
 
+    @operation
     def force_disconnect(self, session_id, connection_id):
         """
         Sends a request to disconnect a client from an OpenTok session
@@ -1193,18 +1608,10 @@ class Client(object):
         """
         endpoint = self.endpoints.force_disconnect_url(session_id, connection_id)
 
-        logger.debug(
-            "DELETE to %r with headers %r, proxies %r",
-            endpoint,
-            self.get_json_headers(),
-            self.proxies,
-        )
-
-        response = requests.delete(
+        response = yield Request(
+            "DELETE",
             endpoint,
             headers=self.get_json_headers(),
-            proxies=self.proxies,
-            timeout=self.timeout,
         )
 
         if response.status_code == 204:
@@ -1224,6 +1631,39 @@ class Client(object):
         else:
             raise RequestError("An unexpected error occurred", response.status_code)
 
+    def force_disconnect_many(
+        self, session_id, connection_ids, concurrency=10, rate=DEFAULT_BULK_RATE
+    ):
+        """
+        Disconnects many clients from an OpenTok session at once, for example to end a session.
+
+        The requests are sent concurrently, at most concurrency at a time, so a slow request
+        only holds up one of them, and a failed request does not stop the others.
+
+        :param String session_id: The session ID of the OpenTok session from which the
+        clients will be disconnected
+
+        :param list connection_ids: The connection IDs of the clients that will be disconnected
+
+        :param int concurrency: The maximum number of requests sent at the same time
+
+        :param float rate: The maximum number of requests sent per second, 20 by default,
+        or None to send them as fast as concurrency allows
+
+        :rtype: A dictionary mapping each connection ID to None when the client was
+        disconnected, or to the exception raised for it (ForceDisconnectError, AuthError,
+        RequestError, ...).
+        """
+        connection_ids = list(connection_ids)
+        return self._run_bulk(
+            lambda connection_id: self.force_disconnect(session_id, connection_id),
+            connection_ids,
+            connection_ids,
+            concurrency,
+            rate,
+        )
+
+    @operation
     def set_archive_layout(
         self, archive_id, layout_type, stylesheet=None, screenshare_type=None
     ):
@@ -1254,20 +1694,11 @@ class Client(object):
 
         endpoint = self.endpoints.set_archive_layout_url(archive_id)
 
-        logger.debug(
-            "PUT to %r with params %r, headers %r, proxies %r",
-            endpoint,
-            json.dumps(payload),
-            self.get_json_headers(),
-            self.proxies,
-        )
-
-        response = requests.put(
+        response = yield Request(
+            "PUT",
             endpoint,
             data=json.dumps(payload),
             headers=self.get_json_headers(),
-            proxies=self.proxies,
-            timeout=self.timeout,
         )
 
         if response.status_code == 200:
@@ -1281,6 +1712,7 @@ class Client(object):
         else:
             raise RequestError("OpenTok server error.", response.status_code)
 
+    @operation
     def dial(self, session_id, token, sip_uri, options={}):
         """
         Use this method to connect a SIP platform to an OpenTok session. The audio from the end
@@ -1369,20 +1801,11 @@ class Client(object):
 
         endpoint = self.endpoints.dial_url()
 
-        logger.debug(
-            "POST to %r with params %r, headers %r, proxies %r",
-            endpoint,
-            json.dumps(payload),
-            self.get_json_headers(),
-            self.proxies,
-        )
-
-        response = requests.post(
+        response = yield Request(
+            "POST",
             endpoint,
             data=json.dumps(payload),
             headers=self.get_json_headers(),
-            proxies=self.proxies,
-            timeout=self.timeout,
         )
 
         if response.status_code == 200:
@@ -1401,6 +1824,7 @@ class Client(object):
         else:
             raise RequestError("OpenTok server error.", response.status_code)
 
+    @operation
     def set_stream_class_lists(self, session_id, payload):
         """
         Use this method to change layout classes for OpenTok streams. The layout classes
@@ -1423,20 +1847,11 @@ class Client(object):
 
         endpoint = self.endpoints.set_stream_class_lists_url(session_id)
 
-        logger.debug(
-            "PUT to %r with params %r, headers %r, proxies %r",
-            endpoint,
-            json.dumps(items_payload),
-            self.get_json_headers(),
-            self.proxies,
-        )
-
-        response = requests.put(
+        response = yield Request(
+            "PUT",
             endpoint,
             data=json.dumps(items_payload),
             headers=self.get_json_headers(),
-            proxies=self.proxies,
-            timeout=self.timeout,
         )
 
         if response.status_code == 200:
@@ -1451,6 +1866,7 @@ class Client(object):
         else:
             raise RequestError("OpenTok server error.", response.status_code)
 
+    @operation
     def start_broadcast(self, session_id, options, stream_mode=BroadcastStreamModes.auto):
         """
         Use this method to start a live streaming broadcast for an OpenTok session. This broadcasts
@@ -1562,20 +1978,11 @@ class Client(object):
 
         endpoint = self.endpoints.get_broadcast_url()
 
-        logger.debug(
-            "POST to %r with params %r, headers %r, proxies %r",
-            endpoint,
-            json.dumps(payload),
-            self.get_json_headers(),
-            self.proxies,
-        )
-
-        response = requests.post(
+        response = yield Request(
+            "POST",
             endpoint,
             data=json.dumps(payload),
             headers=self.get_json_headers(),
-            proxies=self.proxies,
-            timeout=self.timeout,
         )
 
         if response:
@@ -1594,6 +2001,7 @@ class Client(object):
         else:
             raise RequestError("OpenTok server error.", response.status_code)
 
+    @operation
     def stop_broadcast(self, broadcast_id):
         """
         Use this method to stop a live broadcast of an OpenTok session
@@ -1606,18 +2014,10 @@ class Client(object):
 
         endpoint = self.endpoints.get_broadcast_url(broadcast_id, stop=True)
 
-        logger.debug(
-            "POST to %r with headers %r, proxies %r",
-            endpoint,
-            self.get_json_headers(),
-            self.proxies,
-        )
-
-        response = requests.post(
+        response = yield Request(
+            "POST",
             endpoint,
             headers=self.get_json_headers(),
-            proxies=self.proxies,
-            timeout=self.timeout,
         )
 
         if response.status_code == 200:
@@ -1637,13 +2037,14 @@ class Client(object):
         else:
             raise RequestError("OpenTok server error.", response.status_code)
 
+    @operation
     def add_broadcast_stream(
         self,
         broadcast_id: str,
         stream_id: str,
         has_audio: bool = True,
         has_video: bool = True,
-    ) -> requests.Response:
+    ) -> "requests.Response":
         """
         This method will add streams to the broadcast with addStream for new participant(choosing audio, video or both).
 
@@ -1661,12 +2062,11 @@ class Client(object):
 
         streams = {"hasAudio": has_audio, "hasVideo": has_video, "addStream": stream_id}
 
-        response = requests.patch(
+        response = yield Request(
+            "PATCH",
             endpoint,
             data=json.dumps(streams),
             headers=self.get_json_headers(),
-            proxies=self.proxies,
-            timeout=self.timeout,
         )
 
         if response:
@@ -1690,9 +2090,10 @@ class Client(object):
         else:
             raise RequestError("An unexpected error occurred.", response.status_code)
 
+    @operation
     def remove_broadcast_stream(
         self, broadcast_id: str, stream_id: str
-    ) -> requests.Response:
+    ) -> "requests.Response":
         """
         This method will remove streams from the broadcast with removeStream.
 
@@ -1704,12 +2105,11 @@ class Client(object):
 
         streams = {"removeStream": stream_id}
 
-        response = requests.patch(
+        response = yield Request(
+            "PATCH",
             endpoint,
             data=json.dumps(streams),
             headers=self.get_json_headers(),
-            proxies=self.proxies,
-            timeout=self.timeout,
         )
 
         if response:
@@ -1733,6 +2133,7 @@ class Client(object):
         else:
             raise RequestError("OpenTok server error.", response.status_code)
 
+    @operation
     def get_broadcast(self, broadcast_id):
         """
         Use this method to get details on a broadcast that is in-progress.
@@ -1745,18 +2146,10 @@ class Client(object):
 
         endpoint = self.endpoints.get_broadcast_url(broadcast_id)
 
-        logger.debug(
-            "GET to %r with headers %r, proxies %r",
-            endpoint,
-            self.get_json_headers(),
-            self.proxies,
-        )
-
-        response = requests.get(
+        response = yield Request(
+            "GET",
             endpoint,
             headers=self.get_json_headers(),
-            proxies=self.proxies,
-            timeout=self.timeout,
         )
 
         if response.status_code == 200:
@@ -1773,6 +2166,7 @@ class Client(object):
         else:
             raise RequestError("OpenTok server error.", response.status_code)
 
+    @operation
     def set_broadcast_layout(
         self, broadcast_id, layout_type, stylesheet=None, screenshare_type=None
     ):
@@ -1803,20 +2197,11 @@ class Client(object):
 
         endpoint = self.endpoints.get_broadcast_url(broadcast_id, layout=True)
 
-        logger.debug(
-            "PUT to %r with params %r, headers %r, proxies %r",
-            endpoint,
-            json.dumps(payload),
-            self.get_json_headers(),
-            self.proxies,
-        )
-
-        response = requests.put(
+        response = yield Request(
+            "PUT",
             endpoint,
             data=json.dumps(payload),
             headers=self.get_json_headers(),
-            proxies=self.proxies,
-            timeout=self.timeout,
         )
 
         if response.status_code == 200:
@@ -1831,6 +2216,7 @@ class Client(object):
         else:
             raise RequestError("OpenTok server error.", response.status_code)
 
+    @operation
     def start_render(
         self,
         session_id,
@@ -1862,20 +2248,11 @@ class Client(object):
             "properties": properties,
         }
 
-        logger.debug(
-            "POST to %r with params %r, headers %r, proxies %r",
-            self.endpoints.get_render_url(),
-            json.dumps(payload),
-            self.get_json_headers(),
-            self.proxies,
-        )
-
-        response = requests.post(
+        response = yield Request(
+            "POST",
             self.endpoints.get_render_url(),
             json=payload,
             headers=self.get_json_headers(),
-            proxies=self.proxies,
-            timeout=self.timeout,
         )
 
         if response and response.status_code == 202:
@@ -1892,6 +2269,7 @@ class Client(object):
         else:
             raise RequestError("An unexpected error occurred", response.status_code)
 
+    @operation
     def get_render(self, render_id):
         """
         This method allows you to see the status of a render, which can be one of the following:
@@ -1899,18 +2277,10 @@ class Client(object):
 
         :param String 'render_id': The ID of a specific render.
         """
-        logger.debug(
-            "GET to %r with headers %r, proxies %r",
-            self.endpoints.get_render_url(render_id=render_id),
-            self.get_json_headers(),
-            self.proxies,
-        )
-
-        response = requests.get(
+        response = yield Request(
+            "GET",
             self.endpoints.get_render_url(render_id=render_id),
             headers=self.get_json_headers(),
-            proxies=self.proxies,
-            timeout=self.timeout,
         )
 
         if response.status_code == 200:
@@ -1926,24 +2296,17 @@ class Client(object):
         else:
             raise RequestError("An unexpected error occurred", response.status_code)
 
+    @operation
     def stop_render(self, render_id):
         """
         This method stops a render.
 
         :param String 'render_id': The ID of a specific render.
         """
-        logger.debug(
-            "DELETE to %r with headers %r, proxies %r",
-            self.endpoints.get_render_url(render_id=render_id),
-            self.get_json_headers(),
-            self.proxies,
-        )
-
-        response = requests.delete(
+        response = yield Request(
+            "DELETE",
             self.endpoints.get_render_url(render_id=render_id),
             headers=self.get_json_headers(),
-            proxies=self.proxies,
-            timeout=self.timeout,
         )
 
         if response.status_code == 200:
@@ -1959,6 +2322,7 @@ class Client(object):
         else:
             raise RequestError("An unexpected error occurred", response.status_code)
 
+    @operation
     def list_renders(self, offset=0, count=50):
         """
         List existing renders associated with the project's API key.
@@ -1969,20 +2333,11 @@ class Client(object):
 
         query_params = {"offset": offset, "count": count}
 
-        logger.debug(
-            "GET to %r with headers %r, params %r, proxies %r",
-            self.endpoints.get_render_url(),
-            self.get_json_headers(),
-            query_params,
-            self.proxies,
-        )
-
-        response = requests.get(
+        response = yield Request(
+            "GET",
             self.endpoints.get_render_url(),
             headers=self.get_json_headers(),
             params=query_params,
-            proxies=self.proxies,
-            timeout=self.timeout,
         )
 
         if response.status_code == 200:
@@ -1996,6 +2351,22 @@ class Client(object):
         else:
             raise RequestError("An unexpected error occurred", response.status_code)
 
+    def list_all_renders(self, page_size=1000, concurrency=8):
+        """
+        Returns a RenderList with every render associated with the project's API key. The first
+        page tells the total number of renders, then every remaining page is fetched at the
+        same time, on up to concurrency threads, and the pages are merged in order.
+
+        :param Integer 'page_size' Optional: Number of renders retrieved per request, up to 1000.
+        :param Integer 'concurrency' Optional: Maximum number of pages fetched at the same time.
+        """
+        if not 0 < page_size <= 1000:
+            raise OpenTokException("page_size must be between 1 and 1000")
+
+        pages = fetch_all_pages(self.list_renders, page_size, concurrency)
+        return merge_pages(RenderList(self, {}), pages)
+
+    @operation
     def connect_audio_to_websocket(
         self, session_id: str, opentok_token: str, websocket_options: dict
     ):
@@ -2019,20 +2390,11 @@ class Client(object):
             "websocket": websocket_options,
         }
 
-        logger.debug(
-            "POST to %r with params %r, headers %r, proxies %r",
-            self.endpoints.get_audio_connector_url(),
-            json.dumps(payload),
-            self.get_json_headers(),
-            self.proxies,
-        )
-
-        response = requests.post(
+        response = yield Request(
+            "POST",
             self.endpoints.get_audio_connector_url(),
             json=payload,
             headers=self.get_json_headers(),
-            proxies=self.proxies,
-            timeout=self.timeout,
         )
 
         if response and response.status_code == 200:
@@ -2065,6 +2427,7 @@ class Client(object):
             if not isinstance(options["bidirectional"], bool):
                 raise InvalidWebSocketOptionsError("'bidirectional' must be a boolean if provided.")
 
+    @operation
     def start_captions(
         self,
         session_id: str,
@@ -2099,20 +2462,11 @@ class Client(object):
             "statusCallbackUrl": status_callback_url,
         }
 
-        logger.debug(
-            "POST to %r with params %r, headers %r, proxies %r",
-            self.endpoints.get_captions_url(),
-            json.dumps(payload),
-            self.get_json_headers(),
-            self.proxies,
-        )
-
-        response = requests.post(
+        response = yield Request(
+            "POST",
             self.endpoints.get_captions_url(),
             json=payload,
             headers=self.get_json_headers(),
-            proxies=self.proxies,
-            timeout=self.timeout,
         )
 
         # Keeping backwards compat just in case
@@ -2136,25 +2490,17 @@ class Client(object):
         else:
             raise RequestError("An unexpected error occurred", response.status_code)
 
+    @operation
     def stop_captions(self, captions_id: str):
         """
         Stops live captioning for the specified captioning session.
 
         :param String captions_id: The ID of the captioning session to stop.
         """
-
-        logger.debug(
-            "POST to %r with headers %r, proxies %r",
-            self.endpoints.get_captions_url(captions_id),
-            self.get_json_headers(),
-            self.proxies,
-        )
-
-        response = requests.post(
+        response = yield Request(
+            "POST",
             self.endpoints.get_captions_url(captions_id),
             headers=self.get_json_headers(),
-            proxies=self.proxies,
-            timeout=self.timeout,
         )
 
         if response and response.status_code == 202:
@@ -2166,17 +2512,204 @@ class Client(object):
         else:
             raise RequestError("An unexpected error occurred", response.status_code)
 
+    def _log_request(self, request):
+        if logger.isEnabledFor(logging.DEBUG):
+            kwargs = request.kwargs
+            logger.debug(
+                "%s to %r with params %r, proxies %r",
+                request.method,
+                request.url,
+                kwargs.get("json", kwargs.get("data", kwargs.get("params"))),
+                self.proxies,
+            )
+
+    def _send(self, request):
+        """
+        Sends a request, and sends it again as long as the retry policy allows it. Returns the
+        last response, or raises the last exception.
+        """
+        self._prepare_request(request)
+        attempt = 1
+        while True:
+            try:
+                response = self._send_once(request)
+            except Exception as e:
+                delay = self._retry_delay(request, attempt, exception=e)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_delay(request, attempt, response=response)
+                if delay is None:
+                    return response
+            time.sleep(delay)
+            attempt += 1
+
+    def _prepare_request(self, request):
+        if request.family is None:
+            request.family = self.endpoints.get_endpoint_family(
+                request.url, request.method
+            )
+
+    def _send_once(self, request):
+        request.attempts += 1
+        # an open circuit fails fast, without waiting for or using up a rate limit token
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_request(request.family)
+        if self.rate_limiter is not None:
+            try:
+                self.rate_limiter.acquire(request.family)
+            except BaseException:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.cancel_request(request.family)
+                raise
+        self._log_request(request)
+        kwargs = self._transport_kwargs(request)
+        metrics = self._start_metrics(request, kwargs)
+        start = time.monotonic()
+        try:
+            response = self._transport_request(request, kwargs)
+        except BaseException as e:
+            # cancelled and interrupted requests count as failures too, so that a probe
+            # request of a half-open circuit is always accounted for
+            self._record_outcome(request, start, exception=e, metrics=metrics)
+            raise
+        self._record_outcome(request, start, response=response, metrics=metrics)
+        return response
+
+    def _transport_request(self, request, kwargs):
+        if self.tracer is None:
+            return self._transport.request(request.method, request.url, **kwargs)
+        with tracing.request_span(self.tracer, request) as span:
+            response = self._transport.request(request.method, request.url, **kwargs)
+            tracing.record_response(span, response)
+            return response
+
+    def _transport_kwargs(self, request):
+        kwargs = dict(request.kwargs)
+        headers = kwargs.get("headers")
+        if headers:
+            # the auth header is signed again when needed: retries, Retry-After sleeps and
+            # rate limiter waits can outlive the cached JWT the request was built with
+            name, value = self._auth_header()
+            if name in headers:
+                kwargs["headers"] = dict(headers)
+                kwargs["headers"][name] = value
+        kwargs.setdefault("proxies", self.proxies)
+        kwargs.setdefault("timeout", self.timeout)
+        return kwargs
+
+    def _start_metrics(self, request, kwargs):
+        """Returns the RequestMetrics of a request, or None when no hook is registered."""
+        if not (self._request_hooks or self._response_hooks):
+            return None
+        metrics = RequestMetrics(request)
+        kwargs["metrics"] = metrics
+        self._call_hooks(self._request_hooks, metrics)
+        return metrics
+
+    @staticmethod
+    def _call_hooks(hooks, metrics):
+        for hook in hooks:
+            try:
+                hook(metrics)
+            except Exception:
+                logger.exception("Exception in OpenTok instrumentation hook %r", hook)
+
+    def _record_outcome(self, request, start, response=None, exception=None, metrics=None):
+        breaker = self.circuit_breaker
+        if breaker is None and metrics is None:
+            return
+        duration = time.monotonic() - start
+        if breaker is not None:
+            breaker.record(
+                request.family, breaker.is_failure(response, exception, duration), duration
+            )
+        if metrics is not None:
+            metrics.record(duration, response, exception)
+            self._call_hooks(self._response_hooks, metrics)
+
+    def _retry_delay(self, request, attempt, response=None, exception=None):
+        if self.retry_policy is None:
+            return None
+        delay = self.retry_policy.next_delay(request, attempt, response, exception)
+        if delay is not None:
+            logger.debug(
+                "Retrying %s to %r in %.2fs after attempt %d (%s)",
+                request.method,
+                request.url,
+                delay,
+                attempt,
+                exception if exception is not None else response.status_code,
+            )
+        return delay
+
+    def _run(self, operation):
+        """
+        Drives an operation (see opentok.transport.operation): every Request it yields is
+        sent through the transport and the response, or the exception raised while
+        sending it, is passed back in. Returns the value the operation returns.
+        """
+        if self.tracer is None:
+            return self._drive(operation)
+        with tracing.OperationTrace(self.tracer, operation) as trace:
+            return trace.finish(self._drive(operation, trace))
+
+    def _drive(self, operation, trace=None):
+        try:
+            request = next(operation)
+            while True:
+                try:
+                    response = self._send(request)
+                except Exception as e:
+                    if trace is not None:
+                        trace.record(request)
+                    request = operation.throw(e)
+                else:
+                    if trace is not None:
+                        trace.record(request, response)
+                    request = operation.send(response)
+        except StopIteration as e:
+            return e.value
+
     def _sign_string(self, string, secret):
         return hmac.new(
             secret.encode("utf-8"), string.encode("utf-8"), hashlib.sha1
         ).hexdigest()
 
     def _create_jwt_auth_header(self):
+        """
+        Returns the JWT used to authenticate REST calls. The token is signed once and reused
+        until shortly before it expires (see JWT_REFRESH_MARGIN), so that most requests do not
+        pay for an HS256 or RS256 signature.
+        """
+        now = time.time()
+        cached = self._jwt_auth_header
+        if cached is not None and now < cached[1]:
+            return cached[0]
+
+        with self._jwt_lock:
+            cached = self._jwt_auth_header
+            if cached is None or now >= cached[1]:
+                lifetime = 60 * self._jwt_livetime
+                if self.tracer is None:
+                    token = self._sign_jwt_auth_header(int(now), lifetime)
+                else:
+                    algorithm = "RS256" if self._using_vonage else "HS256"
+                    with tracing.signing_span(self.tracer, algorithm):
+                        token = self._sign_jwt_auth_header(int(now), lifetime)
+                refresh_at = now + lifetime - min(self.JWT_REFRESH_MARGIN, lifetime / 2)
+                cached = self._jwt_auth_header = (token, refresh_at)
+            return cached[0]
+
+    def _sign_jwt_auth_header(self, now, lifetime):
+        # imported here rather than at module level, pyjwt pulls in cryptography
+        from jwt import encode
+        import uuid
+
         payload = {
             "ist": "project",
-            "iat": int(time.time()),  # current time in unix time (seconds)
-            "exp": int(time.time())
-            + (60 * self._jwt_livetime),  # 3 minutes in the future (seconds)
+            "iat": now,  # current time in unix time (seconds)
+            "exp": now + lifetime,  # jwt_livetime minutes in the future (seconds)
         }
 
         if not self._using_vonage:
@@ -2190,9 +2723,10 @@ class Client(object):
 
         return encode(payload, self.api_secret, algorithm='RS256', headers=headers)
 
+    @operation
     def mute_all(
         self, session_id: str, excludedStreamIds: Optional[List[str]]
-    ) -> requests.Response:
+    ) -> "requests.Response":
         """
         Mutes all streams in an OpenTok session.
 
@@ -2217,8 +2751,8 @@ class Client(object):
             else:
                 options = {"active": True, "excludedStreams": []}
 
-            response = requests.post(
-                url, headers=self.get_json_headers(), data=json.dumps(options)
+            response = yield Request(
+                "POST", url, headers=self.get_json_headers(), data=json.dumps(options)
             )
 
             if response:
@@ -2231,6 +2765,8 @@ class Client(object):
                 raise AuthError("Failed to mute, invalid credentials.")
             elif response.status_code == 404:
                 raise NotFoundError("The session or a stream is not found.")
+        except (CircuitOpenError, RateLimitError):
+            raise
         except Exception as e:
             raise OpenTokException(
                 (
@@ -2238,7 +2774,8 @@ class Client(object):
                 ).format(session_id, excludedStreamIds)
             )
 
-    def disable_force_mute(self, session_id: str) -> requests.Response:
+    @operation
+    def disable_force_mute(self, session_id: str) -> "requests.Response":
         """
         Disables the active mute state of the session. After you call this method, new streams
         published to the session will no longer have audio muted.
@@ -2254,8 +2791,8 @@ class Client(object):
         options = {"active": False}
         url = self.endpoints.get_mute_all_url(session_id)
 
-        response = requests.post(
-            url, headers=self.get_json_headers(), data=json.dumps(options)
+        response = yield Request(
+            "POST", url, headers=self.get_json_headers(), data=json.dumps(options)
         )
 
         try:
@@ -2269,6 +2806,8 @@ class Client(object):
                 raise AuthError("Failed to mute, invalid credentials.")
             elif response.status_code == 404:
                 raise NotFoundError("The session or a stream is not found.")
+        except (CircuitOpenError, RateLimitError):
+            raise
         except Exception as e:
             raise OpenTokException(
                 (
@@ -2276,7 +2815,8 @@ class Client(object):
                 ).format(session_id)
             )
 
-    def mute_stream(self, session_id: str, stream_id: str) -> requests.Response:
+    @operation
+    def mute_stream(self, session_id: str, stream_id: str) -> "requests.Response":
         """
         Mutes a single stream in an OpenTok session.
 
@@ -2286,21 +2826,11 @@ class Client(object):
         """
 
         try:
-            if stream_id:
-                url = self.endpoints.get_stream_url(session_id, stream_id) + "/mute"
-
-            response = requests.post(url, headers=self.get_json_headers())
-
+            response = yield from self._mute_stream_operation(session_id, stream_id)
             if response:
                 return response
-            elif response.status_code == 400:
-                raise GetStreamError(
-                    "Invalid request. This response may indicate that data in your request data is invalid JSON. Or it may indicate that you do not pass in a session ID or you passed in an invalid stream ID."
-                )
-            elif response.status_code == 403:
-                raise AuthError("Failed to mute, invalid credentials.")
-            elif response.status_code == 404:
-                raise NotFoundError("Mute not found")
+        except (CircuitOpenError, RateLimitError):
+            raise
         except Exception as e:
             raise OpenTokException(
                 (
@@ -2308,9 +2838,71 @@ class Client(object):
                 ).format(session_id, stream_id)
             )
 
+    def _mute_stream_operation(self, session_id, stream_id):
+        """
+        The request of mute_stream, raising GetStreamError, AuthError or NotFoundError for
+        the 400, 403 and 404 responses, and returning the response otherwise, which is falsy
+        for the other error statuses.
+        """
+        if not stream_id:
+            # without a stream ID the URL would mute every stream of the session
+            raise OpenTokException("A stream ID is required to mute a stream")
+        url = self.endpoints.get_stream_url(session_id, stream_id) + "/mute"
+
+        response = yield Request("POST", url, headers=self.get_json_headers())
+
+        if response:
+            return response
+        elif response.status_code == 400:
+            raise GetStreamError(
+                "Invalid request. This response may indicate that data in your request data is invalid JSON. Or it may indicate that you do not pass in a session ID or you passed in an invalid stream ID."
+            )
+        elif response.status_code == 403:
+            raise AuthError("Failed to mute, invalid credentials.")
+        elif response.status_code == 404:
+            raise NotFoundError("Mute not found")
+        return response
+
+    def mute_streams(
+        self, session_id, stream_ids, concurrency=10, rate=DEFAULT_BULK_RATE
+    ):
+        """
+        Mutes many streams in an OpenTok session at once.
+
+        The requests are sent concurrently, at most concurrency at a time, so a slow request
+        only holds up one of them, and a failed request does not stop the others.
+
+        :param session_id The session ID.
+
+        :param stream_ids The IDs of the streams to mute.
+
+        :param concurrency The maximum number of requests sent at the same time.
+
+        :param rate The maximum number of requests sent per second, 20 by default, or None
+        to send them as fast as concurrency allows.
+
+        :rtype: A dictionary mapping each stream ID to None when the stream was muted, or to
+        the exception raised for it (NotFoundError, GetStreamError, AuthError, RequestError, ...).
+        """
+        stream_ids = list(stream_ids)
+
+        def mute(stream_id):
+            def mute_stream():
+                # the response itself is not kept
+                response = yield from self._mute_stream_operation(session_id, stream_id)
+                if not response:
+                    raise RequestError(
+                        "An unexpected error occurred", response.status_code
+                    )
+
+            return self._run(mute_stream())
+
+        return self._run_bulk(mute, stream_ids, stream_ids, concurrency, rate)
+
+    @operation
     def play_dtmf(
         self, session_id: str, connection_id: str, digits: str, options: dict = {}
-    ) -> requests.Response:
+    ) -> "requests.Response":
         """
         Plays a DTMF string into a session or to a specific connection
 
@@ -2334,8 +2926,8 @@ class Client(object):
                 url = self.endpoints.get_dtmf_specific_url(session_id, connection_id)
                 payload = {"digits": digits}
 
-            response = requests.post(
-                url, headers=self.get_json_headers(), data=json.dumps(payload)
+            response = yield Request(
+                "POST", url, headers=self.get_json_headers(), data=json.dumps(payload)
             )
 
             if response.status_code == 200:
@@ -2352,6 +2944,8 @@ class Client(object):
                 raise NotFoundError(
                     "The session does not exists or the client specified by the connection_id is not connected to the session"
                 )
+        except (CircuitOpenError, RateLimitError):
+            raise
         except Exception as e:
             raise OpenTokException(
                 (
@@ -2368,6 +2962,13 @@ class OpenTok(Client):
         api_url="https://api.opentok.com",
         timeout=None,
         app_version=None,
+        pool_connections=10,
+        pool_maxsize=10,
+        pool_idle_timeout=None,
+        retry_policy=None,
+        rate_limiter=None,
+        circuit_breaker=None,
+        tracer=None,
     ):
         warnings.warn(
             "OpenTok class is deprecated (Use Client class instead)",
@@ -2380,11 +2981,19 @@ class OpenTok(Client):
             api_url=api_url,
             timeout=timeout,
             app_version=app_version,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_idle_timeout=pool_idle_timeout,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            tracer=tracer,
         )
 
+    @operation
     def mute_all(
         self, session_id: str, excludedStreamIds: Optional[List[str]]
-    ) -> requests.Response:
+    ) -> "requests.Response":
         """
         Mutes all streams in an OpenTok session.
         You can include an optional list of streams IDs to exclude from being muted.
@@ -2405,8 +3014,8 @@ class OpenTok(Client):
             else:
                 options = {"active": True, "excludedStreams": []}
 
-            response = requests.post(
-                url, headers=self.get_json_headers(), data=json.dumps(options)
+            response = yield Request(
+                "POST", url, headers=self.get_json_headers(), data=json.dumps(options)
             )
 
             if response:
@@ -2419,6 +3028,8 @@ class OpenTok(Client):
                 raise AuthError("Failed to mute, invalid credentials.")
             elif response.status_code == 404:
                 raise NotFoundError("The session or a stream is not found.")
+        except (CircuitOpenError, RateLimitError):
+            raise
         except Exception as e:
             raise OpenTokException(
                 (
@@ -2426,7 +3037,8 @@ class OpenTok(Client):
                 ).format(session_id, excludedStreamIds)
             )
 
-    def disable_force_mute(self, session_id: str) -> requests.Response:
+    @operation
+    def disable_force_mute(self, session_id: str) -> "requests.Response":
         """
         Disables the active mute state of the session. After you call this method, new streams
         published to the session will no longer have audio muted.
@@ -2440,8 +3052,8 @@ class OpenTok(Client):
         options = {"active": False}
         url = self.endpoints.get_mute_all_url(session_id)
 
-        response = requests.post(
-            url, headers=self.get_json_headers(), data=json.dumps(options)
+        response = yield Request(
+            "POST", url, headers=self.get_json_headers(), data=json.dumps(options)
         )
 
         try:
@@ -2455,6 +3067,8 @@ class OpenTok(Client):
                 raise AuthError("Failed to mute, invalid credentials.")
             elif response.status_code == 404:
                 raise NotFoundError("The session or a stream is not found.")
+        except (CircuitOpenError, RateLimitError):
+            raise
         except Exception as e:
             raise OpenTokException(
                 (
@@ -2462,7 +3076,8 @@ class OpenTok(Client):
                 ).format(session_id)
             )
 
-    def mute_stream(self, session_id: str, stream_id: str) -> requests.Response:
+    @operation
+    def mute_stream(self, session_id: str, stream_id: str) -> "requests.Response":
         """
         Mutes a single stream in an OpenTok session.
         :param session_id The session ID.
@@ -2470,21 +3085,11 @@ class OpenTok(Client):
         """
 
         try:
-            if stream_id:
-                url = self.endpoints.get_stream_url(session_id, stream_id) + "/mute"
-
-            response = requests.post(url, headers=self.get_json_headers())
-
+            response = yield from self._mute_stream_operation(session_id, stream_id)
             if response:
                 return response
-            elif response.status_code == 400:
-                raise GetStreamError(
-                    "Invalid request. This response may indicate that data in your request data is invalid JSON. Or it may indicate that you do not pass in a session ID or you passed in an invalid stream ID."
-                )
-            elif response.status_code == 403:
-                raise AuthError("Failed to mute, invalid credentials.")
-            elif response.status_code == 404:
-                raise NotFoundError("Mute not found")
+        except (CircuitOpenError, RateLimitError):
+            raise
         except Exception as e:
             raise OpenTokException(
                 (
@@ -2492,9 +3097,10 @@ class OpenTok(Client):
                 ).format(session_id, stream_id)
             )
 
+    @operation
     def play_dtmf(
         self, session_id: str, connection_id: str, digits: str, options: dict = {}
-    ) -> requests.Response:
+    ) -> "requests.Response":
         """
         Plays a DTMF string into a session or to a specific connection
         :param session_id The ID of the OpenTok session that the participant being called
@@ -2514,8 +3120,8 @@ class OpenTok(Client):
                 url = self.endpoints.get_dtmf_specific_url(session_id, connection_id)
                 payload = {"digits": digits}
 
-            response = requests.post(
-                url, headers=self.get_json_headers(), data=json.dumps(payload)
+            response = yield Request(
+                "POST", url, headers=self.get_json_headers(), data=json.dumps(payload)
             )
 
             if response.status_code == 200:
@@ -2532,6 +3138,8 @@ class OpenTok(Client):
                 raise NotFoundError(
                     "The session does not exists or the client specified by the connection_id is not connected to the session"
                 )
+        except (CircuitOpenError, RateLimitError):
+            raise
         except Exception as e:
             raise OpenTokException(
                 (
@@ -0,0 +1,165 @@
+from collections import deque
+
+
+def _more_pages(page, offset, page_size):
+    """Whether a page other than the last one was just fetched at the given offset."""
+    if len(page.items) < page_size:
+        return False
+    return page.count is None or offset + page_size < page.count
+
+
+def iter_pages(fetch_page, page_size, prefetch=1):
+    """
+    For internal use.
+    Yields the pages of an offset based listing, such as ArchiveList objects, in order. While
+    the caller processes a page, up to prefetch following pages are fetched in background
+    threads. At most prefetch + 1 pages are held in memory at any time.
+
+    :param fetch_page: A function taking the offset and count of a page and returning an
+        object with count and items attributes.
+
+    :param int page_size: The number of items requested per page.
+
+    :param int prefetch: The number of pages fetched ahead of the caller. 0 fetches each page
+        only when it is needed.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if prefetch <= 0:
+        offset = 0
+        while True:
+            page = fetch_page(offset, page_size)
+            yield page
+            if not _more_pages(page, offset, page_size):
+                return
+            offset += page_size
+
+    executor = ThreadPoolExecutor(
+        max_workers=prefetch, thread_name_prefix="opentok-prefetch"
+    )
+    pending = deque()
+    try:
+        pending.append((0, executor.submit(fetch_page, 0, page_size)))
+        next_offset = page_size
+        while pending:
+            offset, future = pending.popleft()
+            page = future.result()
+            if not _more_pages(page, offset, page_size):
+                yield page
+                return
+            while len(pending) < prefetch and (
+                page.count is None or next_offset < page.count
+            ):
+                pending.append(
+                    (next_offset, executor.submit(fetch_page, next_offset, page_size))
+                )
+                next_offset += page_size
+            yield page
+    finally:
+        for _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def aiter_pages(fetch_page, page_size, prefetch=1):
+    """
+    For internal use.
+    The asyncio version of iter_pages: fetch_page is a coroutine function and the following
+    pages are fetched in tasks running on the event loop.
+    """
+    import asyncio
+
+    if prefetch <= 0:
+        offset = 0
+        while True:
+            page = await fetch_page(offset, page_size)
+            yield page
+            if not _more_pages(page, offset, page_size):
+                return
+            offset += page_size
+
+    pending = deque()
+    try:
+        pending.append((0, asyncio.ensure_future(fetch_page(0, page_size))))
+        next_offset = page_size
+        while pending:
+            offset, task = pending.popleft()
+            page = await task
+            if not _more_pages(page, offset, page_size):
+                yield page
+                return
+            while len(pending) < prefetch and (
+                page.count is None or next_offset < page.count
+            ):
+                task = asyncio.ensure_future(fetch_page(next_offset, page_size))
+                pending.append((next_offset, task))
+                next_offset += page_size
+            yield page
+    finally:
+        for _, task in pending:
+            task.cancel()
+
+
+def _remaining_offsets(first_page, page_size):
+    if not _more_pages(first_page, 0, page_size) or first_page.count is None:
+        return []
+    return list(range(page_size, first_page.count, page_size))
+
+
+def fetch_all_pages(fetch_page, page_size, concurrency=8):
+    """
+    For internal use.
+    Fetches the first page of an offset based listing, then every remaining page announced by
+    its count at once, on at most concurrency threads. Returns the pages in offset order.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    first_page = fetch_page(0, page_size)
+    offsets = _remaining_offsets(first_page, page_size)
+    if not offsets:
+        return [first_page]
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(concurrency, len(offsets))),
+        thread_name_prefix="opentok-fanout",
+    ) as executor:
+        pages = list(executor.map(lambda offset: fetch_page(offset, page_size), offsets))
+    return [first_page] + pages
+
+
+async def afetch_all_pages(fetch_page, page_size, concurrency=8):
+    """
+    For internal use.
+    The asyncio version of fetch_all_pages: fetch_page is a coroutine function and at most
+    concurrency pages are requested at the same time.
+    """
+    import asyncio
+
+    first_page = await fetch_page(0, page_size)
+    offsets = _remaining_offsets(first_page, page_size)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def fetch(offset):
+        async with semaphore:
+            return await fetch_page(offset, page_size)
+
+    pages = await asyncio.gather(*(fetch(offset) for offset in offsets))
+    return [first_page] + list(pages)
+
+
+def merge_pages(list_object, pages):
+    """
+    For internal use.
+    Copies the items of every page into list_object (an empty ArchiveList or RenderList),
+    in order. An item that appears on two pages, because the listing changed while the pages
+    were being fetched, is kept once.
+    """
+    seen = set()
+    for page in pages:
+        for item in page.items:
+            if item.id not in seen:
+                seen.add(item.id)
+                list_object.items.append(item)
+    if pages:
+        list_object.count = pages[0].count
+    return list_object
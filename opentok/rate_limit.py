@@ -0,0 +1,126 @@
+import threading
+import time
+
+from .exceptions import RateLimitError
+
+
+class TokenBucket(object):
+    """
+    For internal use.
+    A thread-safe token bucket holding up to burst tokens, refilled at rate tokens per second.
+
+    A caller that is allowed to wait reserves a token even when none is available, which
+    makes the bucket go into debt, and sleeps for the returned delay. The lock is only held
+    while the bucket is updated, never while waiting, so threads and asyncio tasks can share
+    a bucket.
+    """
+
+    def __init__(self, rate, burst=None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, max_wait=None):
+        """
+        Takes a token and returns the number of seconds to wait before using it (0 when a
+        token is available now). Returns None, without taking a token, when the wait would be
+        longer than max_wait.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            wait = max(0.0, (1.0 - self._tokens) / self.rate)
+            if max_wait is not None and wait > max_wait:
+                return None
+            self._tokens -= 1.0
+            return wait
+
+
+class RateLimiter(object):
+    """
+    A client-side rate limiter with one token bucket per endpoint family (see
+    Endpoints.ENDPOINT_FAMILIES): "signal", "archive", "broadcast", "render", "session",
+    "moderation", "stream", "sip", "connect" and "captions". Pass it to the rate_limiter
+    parameter of Client or AsyncClient to keep bursts of calls under the per-project rate
+    limits of the OpenTok API. Share one RateLimiter between the clients of a process
+    (threads and event loops alike) to give them a single budget.
+
+    :param dict rates: The rate of each endpoint family, in requests per second, either as a
+        number or as a (rate, burst) tuple, where burst is the number of requests that can be
+        sent at once after a quiet period (by default the rate, and at least 1).
+        For example ``{"signal": 50, "moderation": (10, 20)}``.
+
+    :param default_rate: The rate of the endpoint families missing from rates, as a number or
+        a (rate, burst) tuple. None (the default) leaves them unlimited.
+
+    :param bool block: Whether a request over the limit waits until its bucket has room
+        (True, the default) or fails fast with a RateLimitError (False).
+
+    :param float max_wait: When block is True, the longest a request waits, in seconds,
+        before failing with a RateLimitError. None waits as long as needed.
+    """
+
+    def __init__(self, rates=None, default_rate=None, block=True, max_wait=None):
+        self.block = block
+        self.max_wait = max_wait
+        self.default_rate = default_rate
+        self._buckets = {}
+        self._lock = threading.Lock()
+        for family, rate in (rates or {}).items():
+            self._buckets[family] = self._create_bucket(rate)
+
+    @staticmethod
+    def _create_bucket(rate):
+        if isinstance(rate, (tuple, list)):
+            return TokenBucket(*rate)
+        return TokenBucket(rate)
+
+    def _bucket(self, family):
+        bucket = self._buckets.get(family)
+        if bucket is None and self.default_rate is not None:
+            with self._lock:
+                bucket = self._buckets.get(family)
+                if bucket is None:
+                    bucket = self._buckets[family] = self._create_bucket(
+                        self.default_rate
+                    )
+        return bucket
+
+    def reserve(self, family):
+        """
+        Takes a token from the bucket of an endpoint family and returns the number of seconds
+        to wait before sending the request. Raises RateLimitError when the request must not
+        be sent.
+        """
+        bucket = self._bucket(family)
+        if bucket is None:
+            return 0.0
+        wait = bucket.reserve(0.0 if not self.block else self.max_wait)
+        if wait is None:
+            raise RateLimitError(
+                "Rate limit of {0:g} requests per second reached for {1} requests".format(
+                    bucket.rate, family
+                )
+            )
+        return wait
+
+    def acquire(self, family):
+        """Blocks until a request of the endpoint family can be sent."""
+        wait = self.reserve(family)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, family):
+        """Waits, without blocking the event loop, until a request of the family can be sent."""
+        import asyncio
+
+        wait = self.reserve(family)
+        if wait > 0:
+            await asyncio.sleep(wait)
@@ -0,0 +1,121 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+
+
+class RetryPolicy(object):
+    """
+    Describes when and how a Client retries a request to the OpenTok API that failed with a
+    retryable status code (such as 429 or 503) or a network error.
+
+    The delay before the n-th retry is ``min(backoff_cap, backoff_base * 2 ** (n - 1))``, with
+    full jitter by default (a random delay between 0 and that value), so that many clients
+    retrying at the same time do not hit the API in lockstep. When the response has a
+    Retry-After header, that delay is used instead.
+
+    Only idempotent requests are retried by default: GET, PUT and DELETE requests, and calls
+    that are safe to repeat such as stop_archive(). Set retry_non_idempotent to True to also
+    retry the others (start_archive(), send_signal(), start_broadcast(), ...), at the risk
+    of performing the operation twice.
+
+    :param int max_attempts: The maximum number of attempts per request, including the first.
+
+    :param float backoff_base: The delay before the first retry, in seconds.
+
+    :param float backoff_cap: The maximum delay between two attempts, in seconds.
+
+    :param bool jitter: Whether to randomize the delays (full jitter).
+
+    :param retry_statuses: The HTTP status codes that are retried.
+
+    :param tuple retry_exceptions: The exception classes raised while sending a request that
+        are retried.
+
+    :param bool retry_non_idempotent: Whether requests that are not idempotent are retried.
+
+    :param bool respect_retry_after: Whether the Retry-After header of a response sets the
+        delay before the next attempt.
+
+    :param float max_retry_after: The longest Retry-After delay, in seconds, the client waits
+        for. When the API asks to wait longer, the response is returned without retrying.
+        Defaults to backoff_cap.
+    """
+
+    DEFAULT_RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+    DEFAULT_RETRY_EXCEPTIONS = (requests.ConnectionError, requests.Timeout)
+
+    def __init__(
+        self,
+        max_attempts=3,
+        backoff_base=0.5,
+        backoff_cap=30.0,
+        jitter=True,
+        retry_statuses=DEFAULT_RETRY_STATUSES,
+        retry_exceptions=DEFAULT_RETRY_EXCEPTIONS,
+        retry_non_idempotent=False,
+        respect_retry_after=True,
+        max_retry_after=None,
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_exceptions = tuple(retry_exceptions)
+        self.retry_non_idempotent = retry_non_idempotent
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = backoff_cap if max_retry_after is None else max_retry_after
+
+    def backoff(self, attempt):
+        """Returns the delay, in seconds, before retrying after the given failed attempt."""
+        delay = min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    @staticmethod
+    def retry_after(response):
+        """
+        Returns the number of seconds set by the Retry-After header of a response, either
+        as a number of seconds or as an HTTP date, or None.
+        """
+        value = response.headers.get("Retry-After") if response is not None else None
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, retry_at.timestamp() - time.time())
+
+    def next_delay(self, request, attempt, response=None, exception=None):
+        """
+        For internal use.
+        Returns the number of seconds to wait before sending the request again after its
+        attempt-th attempt returned response or raised exception, or None when the request
+        must not be retried.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if not (request.idempotent or self.retry_non_idempotent):
+            return None
+        if exception is not None:
+            if not isinstance(exception, self.retry_exceptions):
+                return None
+            return self.backoff(attempt)
+        if response.status_code not in self.retry_statuses:
+            return None
+
+        if self.respect_retry_after:
+            retry_after = self.retry_after(response)
+            if retry_after is not None:
+                return retry_after if retry_after <= self.max_retry_after else None
+        return self.backoff(attempt)
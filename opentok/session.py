@@ -1,5 +1,7 @@
+import json
+
 from six import text_type, u
-from .exceptions import OpenTokException
+from .exceptions import AuthError, OpenTokException
 
 
 class Session(object):
@@ -54,3 +56,84 @@ class Session(object):
           The token string.
         """
         return self.sdk.generate_token(self.session_id, **kwargs)
+
+    def generate_tokens(self, specs, **kwargs):
+        """
+        Generates many tokens for the session. See the OpenTok.generate_tokens() method.
+
+        :param list specs: One item per token to generate, either a dictionary with any of the
+          role, data, expire_time and initial_layout_class_list keys, or a tuple with the same
+          values in that order.
+
+        :rtype:
+          A list of token strings, in the same order as specs.
+        """
+        return self.sdk.generate_tokens(self.session_id, specs, **kwargs)
+
+
+_SESSION_ID_KEY = '"session_id"'
+_WHITESPACE = " \t\r\n"
+
+
+def _skip_whitespace(text, index):
+    while index < len(text) and text[index] in _WHITESPACE:
+        index += 1
+    return index
+
+
+def session_id_from_json(text):
+    """
+    For internal use.
+    Returns the session ID of a JSON response of /session/create, a list of session objects.
+
+    The session ID is read straight from the text when the "session_id" key comes before any
+    nested object of the first session and its value has no escape sequence, which is the
+    case of the API responses. Any other text is parsed with json.loads.
+    """
+    start = _skip_whitespace(text, 0)
+    first = text.find("{", start)
+    key = text.find(_SESSION_ID_KEY, first)
+    if (
+        text.startswith("[", start)
+        and first != -1
+        and key != -1
+        and text.find("{", first + 1, key) == -1
+    ):
+        index = _skip_whitespace(text, key + len(_SESSION_ID_KEY))
+        if text.startswith(":", index):
+            index = _skip_whitespace(text, index + 1)
+            end = text.find('"', index + 1)
+            if text.startswith('"', index) and end != -1:
+                session_id = text[index + 1 : end]
+                if "\\" not in session_id:
+                    return session_id
+    return json.loads(text)[0]["session_id"]
+
+
+def session_id_from_xml(text):
+    """
+    For internal use.
+    Returns the session ID of a legacy XML response of /session/create, or raises an
+    AuthError for an error response.
+
+    The session ID is read straight from the text of the first session_id element when no
+    error element comes before it and the session ID has no markup or entity. Any other
+    response is parsed with ElementTree.
+    """
+    start = text.find("<session_id>")
+    end = text.find("</session_id>", start)
+    if start != -1 and end != -1 and text.find("<error", 0, start) == -1:
+        session_id = text[start + len("<session_id>") : end]
+        if "<" not in session_id and "&" not in session_id:
+            return session_id
+
+    import xml.etree.ElementTree as ElementTree
+
+    root = ElementTree.fromstring(text)
+    error = next(root.iter("error"), None)
+    if error is not None:
+        raise AuthError(
+            "Failed to create session (code=%s): %s"
+            % (error.get("code"), error[0].get("message") if len(error) else None)
+        )
+    return next(root.iter("session_id")).text
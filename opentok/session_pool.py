@@ -0,0 +1,321 @@
+import logging
+import threading
+import time
+from collections import deque
+
+from .opentok import ArchiveModes, MediaModes
+from .session import Session
+
+logger = logging.getLogger("opentok")
+
+CONFIGURATION = (
+    "location",
+    "media_mode",
+    "archive_mode",
+    "archive_name",
+    "archive_resolution",
+    "e2ee",
+)
+"""The create_session() arguments that make up the configuration of a pooled session."""
+
+
+class SessionPool(object):
+    """
+    Keeps sessions created in advance for every configuration of create_session() arguments
+    (location, media_mode, archive_mode, archive_name, archive_resolution and e2ee), so that
+    starting a meeting does not wait for a request to the OpenTok API.
+
+    A background thread creates the sessions with Client.create_sessions(). When fewer than
+    low_watermark sessions are ready for a configuration, it creates new ones, concurrency at
+    a time, until high_watermark sessions are ready. A configuration is tracked from the first call to
+    get() or prime() for it, or from the restored sessions. get() and prime() raise
+    OpenTokException for invalid create_session() arguments, which are never tracked.
+
+    A pooled session is handed out once. Pooled sessions do not expire, so they can be kept
+    across restarts: load returns the sessions saved by the previous process, and save is
+    called with the list of pooled sessions every time it changes. Both use the dictionaries
+    of snapshot(). save is called on the thread that changed the pool, which is the caller
+    of get() when a pooled session is handed out, so it must be fast.
+
+    :param Client client: The client used to create the sessions.
+
+    :param int low_watermark: The number of ready sessions of a configuration below which
+        the pool is refilled.
+
+    :param int high_watermark: The number of ready sessions the pool is refilled up to.
+
+    :param int concurrency: The maximum number of sessions created at the same time.
+
+    :param float refill_interval: The maximum number of seconds between two checks of the
+        pool by the background thread. A configuration whose sessions could not be created
+        is retried after this delay.
+
+    :param callable load: Optional. Called without arguments when the pool starts, returns
+        the sessions to restore, as a list of snapshot() dictionaries.
+
+    :param callable save: Optional. Called with the snapshot() of the pool when it changes.
+
+    :ivar int hits: The number of sessions handed out from the pool.
+
+    :ivar int misses: The number of sessions created inline because the pool was empty.
+
+    :ivar int created: The number of sessions created by the background thread.
+
+    :ivar int failures: The number of sessions the background thread failed to create.
+
+    :ivar int restored: The number of sessions restored from load.
+    """
+
+    def __init__(
+        self,
+        client,
+        low_watermark=5,
+        high_watermark=10,
+        concurrency=4,
+        refill_interval=5.0,
+        load=None,
+        save=None,
+    ):
+        if not 1 <= low_watermark <= high_watermark:
+            raise ValueError("low_watermark must be between 1 and high_watermark")
+        self.client = client
+        self.low_watermark = low_watermark
+        self.high_watermark = high_watermark
+        self.concurrency = concurrency
+        self.refill_interval = refill_interval
+        self.save = save
+        self.hits = 0
+        self.misses = 0
+        self.created = 0
+        self.failures = 0
+        self.restored = 0
+        self._pools = {}  # configuration -> deque of Session
+        self._refilling = set()  # configurations being refilled up to high_watermark
+        self._retry_at = {}  # configuration -> time of the next attempt after a failure
+        self._condition = threading.Condition()
+        self._save_lock = threading.Lock()
+        self._closed = False
+        if load is not None:
+            self.restore(load() or ())
+        self._thread = threading.Thread(
+            target=self._refill_loop, name="opentok-session-pool", daemon=True
+        )
+        self._thread.start()
+
+    def get(
+        self,
+        location=None,
+        media_mode=MediaModes.relayed,
+        archive_mode=ArchiveModes.manual,
+        archive_name=None,
+        archive_resolution=None,
+        e2ee=False,
+    ):
+        """
+        Returns a Session with the given create_session() arguments. The session comes from
+        the pool when one is ready, otherwise it is created inline.
+        """
+        key = (location, media_mode, archive_mode, archive_name, archive_resolution, e2ee)
+        if key not in self._pools:
+            # raises OpenTokException before an invalid configuration is tracked
+            self.client._session_options(*key)
+        with self._condition:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = self._pools[key] = deque()
+            session = pool.popleft() if pool else None
+            if session is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+            self._condition.notify()
+
+        if session is None:
+            return self.client.create_session(**dict(zip(CONFIGURATION, key)))
+        self._save()
+        return session
+
+    def prime(
+        self,
+        location=None,
+        media_mode=MediaModes.relayed,
+        archive_mode=ArchiveModes.manual,
+        archive_name=None,
+        archive_resolution=None,
+        e2ee=False,
+    ):
+        """Starts keeping sessions ready for the create_session() arguments, before get()."""
+        key = (location, media_mode, archive_mode, archive_name, archive_resolution, e2ee)
+        self.client._session_options(*key)
+        with self._condition:
+            self._pools.setdefault(key, deque())
+            self._condition.notify()
+
+    def available(self, **configuration):
+        """
+        Returns the number of sessions ready for the create_session() arguments, or for every
+        configuration when no argument is given.
+        """
+        with self._condition:
+            if not configuration:
+                return sum(len(pool) for pool in self._pools.values())
+            key = self._key(configuration)
+            return len(self._pools.get(key, ()))
+
+    def stats(self):
+        """
+        Returns a dictionary with the hits, misses, created, failures, restored and available
+        counters.
+        """
+        with self._condition:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "created": self.created,
+                "failures": self.failures,
+                "restored": self.restored,
+                "available": sum(len(pool) for pool in self._pools.values()),
+            }
+
+    def snapshot(self):
+        """
+        Returns the pooled sessions as a list of dictionaries that can be serialized to JSON,
+        with the session_id and the create_session() arguments of each session. The
+        media_mode and archive_mode are the names of the MediaModes and ArchiveModes members.
+        """
+        with self._condition:
+            return [
+                dict(self._serialize(key), session_id=session.session_id)
+                for key, pool in self._pools.items()
+                for session in pool
+            ]
+
+    def restore(self, entries):
+        """Adds sessions saved with snapshot() to the pool, and tracks their configurations."""
+        restored = 0
+        with self._condition:
+            for entry in entries:
+                key = self._key(
+                    {
+                        name: entry[name]
+                        for name in CONFIGURATION
+                        if entry.get(name) is not None
+                    }
+                )
+                session = self._session(key, entry["session_id"])
+                self._pools.setdefault(key, deque()).append(session)
+                restored += 1
+            self.restored += restored
+            self._condition.notify()
+        return restored
+
+    def close(self):
+        """Stops the background thread. The pooled sessions are kept in the last save()."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _key(self, configuration):
+        unknown = set(configuration) - set(CONFIGURATION)
+        if unknown:
+            raise TypeError("Unknown create_session() arguments: " + ", ".join(sorted(unknown)))
+        media_mode = configuration.get("media_mode", MediaModes.relayed)
+        archive_mode = configuration.get("archive_mode", ArchiveModes.manual)
+        return (
+            configuration.get("location"),
+            MediaModes[media_mode] if isinstance(media_mode, str) else media_mode,
+            ArchiveModes[archive_mode] if isinstance(archive_mode, str) else archive_mode,
+            configuration.get("archive_name"),
+            configuration.get("archive_resolution"),
+            configuration.get("e2ee", False),
+        )
+
+    @staticmethod
+    def _serialize(key):
+        entry = dict(zip(CONFIGURATION, key))
+        entry["media_mode"] = entry["media_mode"].name
+        entry["archive_mode"] = entry["archive_mode"].name
+        return entry
+
+    def _session(self, key, session_id):
+        location, media_mode, archive_mode, _, _, e2ee = key
+        return Session(
+            self.client,
+            session_id,
+            location=location,
+            media_mode=media_mode,
+            archive_mode=archive_mode,
+            e2ee=e2ee,
+        )
+
+    def _save(self):
+        if self.save is None:
+            return
+        # the snapshot is taken under the save lock, so the last save has the latest state
+        with self._save_lock:
+            try:
+                self.save(self.snapshot())
+            except Exception:
+                logger.exception("Could not save the session pool")
+
+    def _next_refill(self):
+        """Returns the (configuration, count) to create next, or None when the pool is full."""
+        now = time.time()
+        for key, pool in self._pools.items():
+            if self._retry_at.get(key, 0) > now:
+                continue
+            if len(pool) < self.low_watermark:
+                self._refilling.add(key)
+            if key in self._refilling:
+                if len(pool) < self.high_watermark:
+                    return key, self.high_watermark - len(pool)
+                self._refilling.discard(key)
+        return None
+
+    def _refill_loop(self):
+        while True:
+            with self._condition:
+                refill = self._next_refill()
+                while refill is None and not self._closed:
+                    self._condition.wait(self.refill_interval)
+                    refill = self._next_refill()
+                if self._closed:
+                    return
+
+            key, count = refill
+            try:
+                outcomes = self.client.create_sessions(
+                    count, concurrency=self.concurrency, **dict(zip(CONFIGURATION, key))
+                )
+            except Exception as e:
+                # invalid create_session() arguments
+                outcomes = [e]
+            sessions = [outcome for outcome in outcomes if isinstance(outcome, Session)]
+            errors = [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+
+            with self._condition:
+                self.created += len(sessions)
+                self.failures += len(errors)
+                if errors:
+                    self._retry_at[key] = time.time() + self.refill_interval
+                else:
+                    self._retry_at.pop(key, None)
+                pool = self._pools.get(key)
+                if pool is not None:
+                    pool.extend(sessions)
+            if errors:
+                logger.error(
+                    "Could not create %d pooled sessions for %r: %s",
+                    len(errors),
+                    self._serialize(key),
+                    errors[0],
+                )
+            if sessions:
+                self._save()
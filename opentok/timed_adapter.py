@@ -0,0 +1,52 @@
+"""
+For internal use.
+The requests adapter of the Transport, whose connections record how long they take to open.
+It is imported with requests when the Transport sends its first request.
+"""
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from .transport import _connect_time
+
+
+class _ConnectTimer(object):
+    """Adds the time spent in connect() to the connect time of the current thread."""
+
+    def connect(self):
+        start = time.monotonic()
+        try:
+            super(_ConnectTimer, self).connect()
+        finally:
+            _connect_time.value = getattr(_connect_time, "value", 0.0) + (
+                time.monotonic() - start
+            )
+
+
+class _TimedHTTPConnection(_ConnectTimer, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_ConnectTimer, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedHTTPAdapter(HTTPAdapter):
+    """An HTTPAdapter whose connections record how long they take to open."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super(_TimedHTTPAdapter, self).init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
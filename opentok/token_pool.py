@@ -0,0 +1,225 @@
+import logging
+import threading
+import time
+from collections import deque
+
+from .opentok import Roles
+
+logger = logging.getLogger("opentok")
+
+
+class TokenPool(object):
+    """
+    Keeps tokens ready to hand out for (session_id, role) pairs, so that issuing a token does
+    not sign a JWT on the request path.
+
+    A background thread mints tokens with Client.generate_tokens() until every pair tracked
+    by the pool has size tokens, and refills a pair as soon as its tokens are consumed. A pair
+    is tracked from the first call to get() or prime() for it, until remove() is called or
+    until it has not been read by get() for idle_timeout seconds. get() only starts tracking a
+    pair once a token has been generated for it, so an invalid session ID is never tracked.
+
+    Pooled tokens carry no connection data and no initial layout class list. Use
+    Client.generate_token() for tokens that need them.
+
+    :param Client client: The client used to generate the tokens.
+
+    :param int size: The number of ready tokens kept for each (session_id, role) pair.
+
+    :param int token_lifetime: The number of seconds a pooled token is valid for. The default
+        is 24 hours, the same as generate_token().
+
+    :param int min_ttl: Tokens that expire in fewer than this many seconds are discarded
+        instead of being handed out.
+
+    :param float refill_interval: The maximum number of seconds between two checks of the
+        pool by the background thread.
+
+    :param float idle_timeout: The number of seconds after which a pair that has not been read
+        by get() (or primed) is no longer tracked and its ready tokens are dropped. None keeps
+        every pair until remove() is called.
+
+    :ivar int hits: The number of tokens handed out from the pool.
+
+    :ivar int misses: The number of tokens that had to be generated inline because the pool
+        was empty.
+
+    :ivar int discarded: The number of pooled tokens dropped because they were about to expire.
+
+    :ivar int evicted: The number of pairs no longer tracked because they were idle.
+    """
+
+    def __init__(
+        self,
+        client,
+        size=100,
+        token_lifetime=60 * 60 * 24,
+        min_ttl=60 * 5,
+        refill_interval=5.0,
+        idle_timeout=60 * 60,
+    ):
+        if min_ttl >= token_lifetime:
+            raise ValueError("min_ttl must be lower than token_lifetime")
+        self.client = client
+        self.size = size
+        self.token_lifetime = token_lifetime
+        self.min_ttl = min_ttl
+        self.refill_interval = refill_interval
+        self.idle_timeout = idle_timeout
+        self.hits = 0
+        self.misses = 0
+        self.discarded = 0
+        self.evicted = 0
+        self._pools = {}  # (session_id, role) -> deque of (token, expire_time)
+        self._last_used = {}  # (session_id, role) -> time of the last get() or prime()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._refill_loop, name="opentok-token-pool", daemon=True
+        )
+        self._thread.start()
+
+    def get(self, session_id, role=Roles.publisher):
+        """
+        Returns a token for the session and role. The token comes from the pool when one is
+        ready, otherwise it is generated inline.
+        """
+        key = (session_id, role)
+        now = time.time()
+        with self._condition:
+            pool = self._pools.get(key)
+            if pool is not None:
+                self._last_used[key] = now
+                while pool:
+                    token, expire_time = pool.popleft()
+                    if expire_time - now >= self.min_ttl:
+                        self.hits += 1
+                        self._condition.notify()
+                        return token
+                    self.discarded += 1
+            self.misses += 1
+            self._condition.notify()
+
+        token = self.client.generate_token(
+            session_id, role, expire_time=int(now) + self.token_lifetime
+        )
+        # the pair is only tracked once a token could be generated for it
+        self._track(key, now)
+        return token
+
+    def prime(self, session_id, role=Roles.publisher):
+        """
+        Starts keeping tokens ready for the session and role, before the first get(). Raises
+        an OpenTokException when the session ID is not valid.
+        """
+        self.client._validate_token_session_id(session_id)
+        self._track((session_id, role), time.time())
+
+    def remove(self, session_id, role=None):
+        """
+        Stops keeping tokens for the session, for one role or (by default) for all roles,
+        and discards the tokens that are ready.
+        """
+        with self._condition:
+            for key in list(self._pools):
+                if key[0] == session_id and (role is None or key[1] == role):
+                    del self._pools[key]
+                    del self._last_used[key]
+
+    def available(self, session_id, role=Roles.publisher):
+        """Returns the number of tokens ready for the session and role."""
+        with self._condition:
+            return len(self._pools.get((session_id, role), ()))
+
+    def stats(self):
+        """
+        Returns a dictionary with the hits, misses, discarded, evicted and available counters.
+        """
+        with self._condition:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "discarded": self.discarded,
+                "evicted": self.evicted,
+                "available": sum(len(pool) for pool in self._pools.values()),
+            }
+
+    def close(self):
+        """Stops the background thread. Tokens that are ready are discarded."""
+        with self._condition:
+            self._closed = True
+            self._pools.clear()
+            self._last_used.clear()
+            self._condition.notify()
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _track(self, key, now):
+        with self._condition:
+            if self._closed:
+                return
+            self._pools.setdefault(key, deque())
+            self._last_used[key] = now
+            self._condition.notify()
+
+    def _evict_idle(self, now):
+        if self.idle_timeout is None:
+            return
+        idle = [
+            key
+            for key, last_used in self._last_used.items()
+            if now - last_used > self.idle_timeout
+        ]
+        for key in idle:
+            del self._pools[key]
+            del self._last_used[key]
+        self.evicted += len(idle)
+
+    def _discard_expiring(self, pool, now):
+        while pool and pool[0][1] - now < self.min_ttl:
+            pool.popleft()
+            self.discarded += 1
+
+    def _next_refill(self):
+        """Returns the (session_id, role, count) to mint next, or None when the pool is full."""
+        now = time.time()
+        self._evict_idle(now)
+        for key, pool in self._pools.items():
+            self._discard_expiring(pool, now)
+            if len(pool) < self.size:
+                return key[0], key[1], self.size - len(pool)
+        return None
+
+    def _refill_loop(self):
+        while True:
+            with self._condition:
+                refill = self._next_refill()
+                while refill is None and not self._closed:
+                    self._condition.wait(self.refill_interval)
+                    refill = self._next_refill()
+                if self._closed:
+                    return
+
+            session_id, role, count = refill
+            expire_time = int(time.time()) + self.token_lifetime
+            try:
+                tokens = self.client.generate_tokens(
+                    session_id, [(role, None, expire_time)] * count
+                )
+            except Exception:
+                logger.exception(
+                    "Could not refill the token pool for session %r, stop tracking it",
+                    session_id,
+                )
+                self.remove(session_id, role)
+                continue
+
+            with self._condition:
+                pool = self._pools.get((session_id, role))
+                if pool is not None:
+                    pool.extend((token, expire_time) for token in tokens)
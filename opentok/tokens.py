@@ -0,0 +1,138 @@
+import base64
+import hashlib
+import hmac
+import json
+
+
+def base64url_encode(data):
+    """For internal use. Base64url encoding without padding, as used by JWTs."""
+    return base64.urlsafe_b64encode(data).replace(b"=", b"")
+
+
+class TokenMinter(object):
+    """
+    For internal use.
+    Signs client tokens with a fixed key. Everything that does not depend on the token payload
+    (the encoded JWT header segment, the keyed HMAC state or the parsed RSA private key) is
+    computed once, so minting many tokens only costs the payload serialization and the
+    signature itself.
+
+    :param secret: The OpenTok API secret (str) or, with Vonage credentials, the PEM encoded
+        private key (bytes).
+
+    :param String algorithm: "HS256" for OpenTok credentials or "RS256" for Vonage credentials.
+    """
+
+    def __init__(self, secret, algorithm="HS256"):
+        if isinstance(secret, str):
+            secret = secret.encode("utf-8")
+        self.algorithm = algorithm
+        header = json.dumps({"alg": algorithm, "typ": "JWT"}, separators=(",", ":"))
+        self._header_segment = base64url_encode(header.encode("utf-8")) + b"."
+
+        if algorithm == "HS256":
+            self._hmac = hmac.new(secret, digestmod=hashlib.sha256)
+            self._rsa = None
+        elif algorithm == "RS256":
+            from jwt.algorithms import RSAAlgorithm
+
+            self._hmac = None
+            self._rsa = RSAAlgorithm(RSAAlgorithm.SHA256)
+            self._rsa_key = self._rsa.prepare_key(secret)
+        else:
+            raise ValueError("Unsupported algorithm {0}".format(algorithm))
+
+        # T1 tokens are signed with HMAC-SHA1 of the OpenTok API secret, they cannot be signed
+        # with a Vonage private key
+        if algorithm == "HS256":
+            self._legacy_hmac = hmac.new(secret, digestmod=hashlib.sha1)
+        else:
+            self._legacy_hmac = None
+
+    def signing_input(self, payload):
+        """Returns the header and payload segments of the JWT for the payload dictionary."""
+        segment = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        return self._header_segment + base64url_encode(segment)
+
+    def sign(self, signing_input):
+        """Returns the raw signature of a JWT signing input."""
+        if self._hmac is not None:
+            mac = self._hmac.copy()
+            mac.update(signing_input)
+            return mac.digest()
+        return self._rsa.sign(signing_input, self._rsa_key)
+
+    def encode(self, payload):
+        """Returns the signed JWT for the payload dictionary."""
+        signing_input = self.signing_input(payload)
+        return self.join(signing_input, self.sign(signing_input))
+
+    def join(self, signing_input, signature):
+        """Returns the JWT made of a signing input and its signature."""
+        return (signing_input + b"." + base64url_encode(signature)).decode("ascii")
+
+    def sign_legacy(self, string):
+        """Returns the hex HMAC-SHA1 signature used in T1 tokens (HS256 minters only)."""
+        if self._legacy_hmac is None:
+            raise ValueError("T1 tokens can only be signed with an OpenTok API secret")
+        mac = self._legacy_hmac.copy()
+        mac.update(string.encode("utf-8"))
+        return mac.hexdigest()
+
+
+# The TokenMinter of a SigningPool worker process, created once by _init_signing_worker
+_worker_minter = None
+
+
+def _init_signing_worker(secret, algorithm):
+    global _worker_minter
+    _worker_minter = TokenMinter(secret, algorithm)
+
+
+def _sign_in_worker(signing_inputs):
+    return [_worker_minter.sign(signing_input) for signing_input in signing_inputs]
+
+
+class SigningPool(object):
+    """
+    For internal use.
+    Computes JWT signatures in a pool of worker processes, so that CPU-bound RS256 signing is
+    not limited to the one core the GIL allows. Each worker parses the private key once, when
+    it starts.
+
+    :param secret: The key the signatures are made with (see TokenMinter).
+
+    :param String algorithm: The JWT algorithm, "RS256" by default.
+
+    :param int workers: The number of worker processes. Defaults to the number of CPUs.
+
+    :param int chunk_size: The number of signatures computed per task sent to a worker.
+    """
+
+    def __init__(self, secret, algorithm="RS256", workers=None, chunk_size=64):
+        from concurrent.futures import ProcessPoolExecutor
+
+        if isinstance(secret, str):
+            secret = secret.encode("utf-8")
+        self.algorithm = algorithm
+        self.chunk_size = chunk_size
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_signing_worker,
+            initargs=(secret, algorithm),
+        )
+
+    def sign(self, signing_inputs):
+        """Returns the signatures of a list of signing inputs, in the same order."""
+        chunks = [
+            signing_inputs[i : i + self.chunk_size]
+            for i in range(0, len(signing_inputs), self.chunk_size)
+        ]
+        signatures = []
+        for chunk in self._executor.map(_sign_in_worker, chunks):
+            signatures.extend(chunk)
+        return signatures
+
+    def close(self):
+        """Stops the worker processes."""
+        self._executor.shutdown()
@@ -0,0 +1,114 @@
+"""
+For internal use.
+OpenTelemetry spans for the calls of a Client created with a tracer. The tracer is only used
+through its start_as_current_span() method, and the opentelemetry package is only imported
+once a span is started, so the SDK does not depend on it.
+"""
+from .instrumentation import _body_size
+
+ID_ARGUMENTS = (
+    "session_id",
+    "archive_id",
+    "broadcast_id",
+    "render_id",
+    "stream_id",
+    "connection_id",
+    "captions_id",
+)
+"""The arguments of an operation recorded as span attributes, as opentok.<argument>."""
+
+RESULT_IDS = {"Archive": "archive_id", "Broadcast": "broadcast_id", "Render": "render_id"}
+"""The span attribute set to the id of the object returned by an operation, by class name."""
+
+
+def operation_name(operation):
+    name = operation.__name__.lstrip("_")
+    if name.endswith("_operation"):
+        name = name[: -len("_operation")]
+    return name
+
+
+class OperationTrace(object):
+    """
+    For internal use.
+    The span of one SDK call. It must be created before the operation is started, while the
+    arguments of the operation are still the only locals of its generator.
+    """
+
+    def __init__(self, tracer, operation):
+        self.name = operation_name(operation)
+        self.attributes = {"opentok.operation": self.name}
+        arguments = operation.gi_frame.f_locals if operation.gi_frame else {}
+        for argument in ID_ARGUMENTS:
+            value = arguments.get(argument)
+            if isinstance(value, str) and value:
+                self.attributes["opentok." + argument] = value
+        self.retries = 0
+        self.request_bytes = 0
+        self.status_code = None
+        self._context = tracer.start_as_current_span(
+            "opentok." + self.name, attributes=self.attributes
+        )
+        self.span = None
+
+    def __enter__(self):
+        self.span = self._context.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        span = self.span
+        span.set_attribute("opentok.retry_count", self.retries)
+        span.set_attribute("http.request.body.size", self.request_bytes)
+        if self.status_code is not None:
+            span.set_attribute("http.response.status_code", self.status_code)
+        return self._context.__exit__(exc_type, exc_value, traceback)
+
+    def record(self, request, response=None):
+        """Records a request sent by the operation, once it is answered or has failed."""
+        self.retries += max(0, request.attempts - 1)
+        self.request_bytes += _body_size(request.kwargs)
+        if response is not None:
+            self.status_code = response.status_code
+
+    def finish(self, result):
+        """Records the id of the object returned by the operation, and returns it."""
+        attribute = RESULT_IDS.get(type(result).__name__)
+        if attribute is not None and getattr(result, "id", None):
+            self.span.set_attribute("opentok." + attribute, result.id)
+        return result
+
+
+def request_span(tracer, request):
+    """Returns the context manager of the span of one attempt at sending a request."""
+    from opentelemetry.trace import SpanKind
+
+    attributes = {
+        "http.request.method": request.method,
+        "url.full": request.url,
+        "opentok.endpoint_family": request.family,
+        "http.request.body.size": _body_size(request.kwargs),
+    }
+    if request.attempts > 1:
+        attributes["http.request.resend_count"] = request.attempts - 1
+    return tracer.start_as_current_span(
+        "{0} {1}".format(request.method, request.family),
+        kind=SpanKind.CLIENT,
+        attributes=attributes,
+    )
+
+
+def record_response(span, response):
+    """Records the status and the size of a response on the span of its request."""
+    span.set_attribute("http.response.status_code", response.status_code)
+    span.set_attribute("http.response.body.size", len(response.content or b""))
+    if response.status_code >= 400:
+        from opentelemetry.trace import Status, StatusCode
+
+        span.set_status(Status(StatusCode.ERROR, "HTTP %d" % response.status_code))
+
+
+def signing_span(tracer, algorithm):
+    """Returns the context manager of the span of the signature of a JWT auth header."""
+    return tracer.start_as_current_span(
+        "opentok.sign_jwt", attributes={"opentok.jwt.algorithm": algorithm}
+    )
@@ -0,0 +1,284 @@
+import functools
+import json
+import threading
+import time
+
+from .exceptions import OpenTokException
+
+
+class Request(object):
+    """
+    For internal use.
+    Describes a single HTTP request to the OpenTok API: the method, the URL and the keyword
+    arguments (data, json, params, headers) understood by requests.
+
+    A request is idempotent, and therefore safe to retry, when its method is GET, HEAD, PUT or
+    DELETE, unless idempotent is set explicitly. The Client sets family to the endpoint
+    family of the URL (see Endpoints.get_endpoint_family) when the request is sent, and
+    counts the times it is sent in attempts.
+    """
+
+    __slots__ = ("method", "url", "kwargs", "idempotent", "family", "attempts")
+
+    IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "PUT", "DELETE"])
+
+    def __init__(self, method, url, idempotent=None, **kwargs):
+        self.method = method
+        self.url = url
+        self.kwargs = kwargs
+        if idempotent is None:
+            idempotent = method in self.IDEMPOTENT_METHODS
+        self.idempotent = idempotent
+        self.family = None
+        self.attempts = 0
+
+    def __repr__(self):
+        return "Request(%r, %r)" % (self.method, self.url)
+
+
+def operation(func):
+    """
+    For internal use.
+    Turns a generator method that yields Request objects and receives the responses back
+    into a blocking Client method. The original generator function is kept as the
+    ``operation`` attribute so AsyncClient can drive the same code without blocking.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        return self._run(func(self, *args, **kwargs))
+
+    wrapper.operation = func
+    return wrapper
+
+
+class Response(object):
+    """
+    For internal use.
+    A fully read HTTP response returned by the AsyncTransport. It exposes the part of the
+    requests.Response interface that the Client methods rely on.
+    """
+
+    def __init__(self, status_code, headers, content, url=None):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+        self.encoding = "utf-8"
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    def __bool__(self):
+        return self.ok
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+    def json(self, **kwargs):
+        return json.loads(self.text, **kwargs)
+
+    def __repr__(self):
+        return "<Response [%d]>" % self.status_code
+
+
+_connect_time = threading.local()
+
+
+class Transport(object):
+    """
+    For internal use.
+    Connection-pooled HTTP transport shared by every REST call of a Client.
+
+    Connections to the API host are kept alive and reused between calls, so only the
+    first request (or the first request after the pool has been idle for longer than
+    idle_timeout) pays for the TCP and TLS handshakes.
+
+    :param int pool_connections: The number of per-host connection pools to cache.
+
+    :param int pool_maxsize: The maximum number of connections kept open to a single host.
+
+    :param bool pool_block: Whether a request waits for a free connection once pool_maxsize
+        connections to a host are in use (True) or opens an extra, non-pooled
+        connection (False, the default).
+
+    :param float idle_timeout: The number of seconds a pool may stay unused before its
+        connections are discarded and re-opened on the next request. Set this to a value
+        lower than the keep-alive timeout of any load balancer between you and the API
+        host. None (the default) keeps connections for as long as the server allows.
+    """
+
+    def __init__(
+        self, pool_connections=10, pool_maxsize=10, pool_block=False, idle_timeout=None
+    ):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.idle_timeout = idle_timeout
+        self._session = None
+        self._last_used = None
+        self._lock = threading.Lock()
+
+    def _create_session(self):
+        # requests is only imported once the first request is sent, to keep import opentok fast
+        import requests
+
+        from .timed_adapter import _TimedHTTPAdapter
+
+        session = requests.Session()
+        adapter = _TimedHTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @property
+    def session(self):
+        """The underlying requests.Session, created on first use."""
+        with self._lock:
+            now = time.monotonic()
+            if (
+                self._session is not None
+                and self.idle_timeout is not None
+                and now - self._last_used > self.idle_timeout
+            ):
+                self._session.close()
+                self._session = None
+            if self._session is None:
+                self._session = self._create_session()
+            self._last_used = now
+            return self._session
+
+    def request(self, method, url, metrics=None, **kwargs):
+        """
+        Sends a request through the connection pool and returns the requests.Response.
+        The connect time and the time to first byte are recorded in metrics, a
+        RequestMetrics, when it is given.
+        """
+        if metrics is None:
+            return self.session.request(method, url, **kwargs)
+        _connect_time.value = 0.0
+        response = self.session.request(method, url, **kwargs)
+        metrics.connect = _connect_time.value
+        metrics.ttfb = response.elapsed.total_seconds()
+        return response
+
+    def close(self):
+        """Closes every pooled connection. The transport can still be used afterwards."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+async def _on_connection_create_start(session, context, params):
+    context.connect_start = time.monotonic()
+
+
+async def _on_connection_create_end(session, context, params):
+    metrics = context.trace_request_ctx
+    if metrics is not None:
+        metrics.connect += time.monotonic() - context.connect_start
+
+
+class AsyncTransport(object):
+    """
+    For internal use.
+    Connection-pooled asyncio HTTP transport used by AsyncClient, built on aiohttp.
+
+    The aiohttp session is created on the first request, inside the running event loop.
+
+    :param int limit: The maximum number of simultaneous connections.
+
+    :param int limit_per_host: The maximum number of simultaneous connections to a single host.
+
+    :param float idle_timeout: The number of seconds an unused keep-alive connection is kept
+        open. None uses the aiohttp default.
+    """
+
+    def __init__(self, limit=100, limit_per_host=10, idle_timeout=None):
+        try:
+            import aiohttp
+        except ImportError:
+            raise OpenTokException(
+                "AsyncClient requires aiohttp, install it with: pip install opentok[async]"
+            )
+        self._aiohttp = aiohttp
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.idle_timeout = idle_timeout
+        self._session = None
+
+    def _create_session(self):
+        connector_options = {"limit": self.limit, "limit_per_host": self.limit_per_host}
+        if self.idle_timeout is not None:
+            connector_options["keepalive_timeout"] = self.idle_timeout
+        trace_config = self._aiohttp.TraceConfig()
+        trace_config.on_connection_create_start.append(_on_connection_create_start)
+        trace_config.on_connection_create_end.append(_on_connection_create_end)
+        return self._aiohttp.ClientSession(
+            connector=self._aiohttp.TCPConnector(**connector_options),
+            trace_configs=[trace_config],
+        )
+
+    @property
+    def session(self):
+        """The underlying aiohttp.ClientSession, created on first use."""
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+        return self._session
+
+    async def request(
+        self,
+        method,
+        url,
+        data=None,
+        json=None,
+        params=None,
+        headers=None,
+        proxies=None,
+        timeout=None,
+        metrics=None,
+    ):
+        """
+        Sends a request through the connection pool and returns a fully read Response.
+        Timeouts and connection errors are raised as requests.Timeout and
+        requests.ConnectionError, like the exceptions of the Transport. The connect time
+        and the time to first byte are recorded in metrics, a RequestMetrics, when it is
+        given.
+        """
+        import asyncio
+
+        import requests
+
+        options = {"data": data, "json": json, "params": params, "headers": headers}
+        if proxies:
+            options["proxy"] = proxies.get(url.split(":", 1)[0])
+        if timeout is not None:
+            options["timeout"] = self._aiohttp.ClientTimeout(
+                sock_connect=timeout, sock_read=timeout
+            )
+        if metrics is not None:
+            options["trace_request_ctx"] = metrics
+            start = time.monotonic()
+        try:
+            async with self.session.request(method, url, **options) as response:
+                if metrics is not None:
+                    metrics.ttfb = time.monotonic() - start
+                content = await response.read()
+        except asyncio.TimeoutError as e:
+            raise requests.Timeout(e)
+        except self._aiohttp.ClientConnectionError as e:
+            raise requests.ConnectionError(e)
+        return Response(response.status, response.headers, content, str(response.url))
+
+    async def close(self):
+        """Closes every pooled connection. The transport can still be used afterwards."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
@@ -29,6 +29,8 @@ with codecs.open("README.rst", encoding="utf-8") as f:
 
 install_requires = ["requests", "six", "pytz", "pyjwt[crypto]>=1.6.4", "rsa>=4.7"]
 
+extras_require = {"async": ["aiohttp>=3.8"], "tracing": ["opentelemetry-api>=1.20"]}
+
 setup(
     name="opentok",
     version=find_version("opentok", "version.py"),
@@ -62,5 +64,6 @@ setup(
     keywords="video chat tokbox tok opentok python media webrtc archiving realtime",
     packages=find_packages(exclude=["contrib", "docs", "tests*"]),
     install_requires=install_requires,
+    extras_require=extras_require,
     include_package_data=True,
 )
@@ -5,10 +5,11 @@ import httpretty
 from sure import expect
 import textwrap
 import datetime
+import json
 import pytz
 from .validate_jwt import validate_jwt_header
 
-from opentok import Client, Archive, __version__, OutputModes
+from opentok import Client, Archive, ArchiveList, __version__, OutputModes, StreamModes
 
 
 class OpenTokArchiveTest(unittest.TestCase):
@@ -169,3 +170,90 @@ class OpenTokArchiveTest(unittest.TestCase):
             equal(u("application/json"))
         )
         # TODO: test that the object is invalidated
+
+    def archive_values(self, index):
+        return {
+            u("createdAt"): 1395183243556 + index * 1000,
+            u("duration"): index,
+            u("id"): u("ARCHIVE{0}").format(index),
+            u("name"): u(""),
+            u("partnerId"): 123456,
+            u("reason"): u(""),
+            u("sessionId"): u("SESSIONID"),
+            u("size"): 100 * index,
+            u("status"): u("available"),
+            u("hasAudio"): True,
+            u("hasVideo"): True,
+            u("url"): None,
+        }
+
+    def test_archive_slots(self):
+        archive = Archive(self.opentok, self.archive_values(1))
+
+        expect(hasattr(archive, "__dict__")).to(be_false)
+        with self.assertRaises(AttributeError):
+            archive.unknown = 1
+
+        attrs = archive.attrs()
+        expect(attrs).to_not(have_key("sdk"))
+        expect(attrs).to_not(have_key("_created_at"))
+        expect(attrs["created_at"]).to(
+            equal(datetime.datetime.fromtimestamp(1395183244, datetime.timezone.utc))
+        )
+
+    def test_archive_created_at_is_converted_lazily(self):
+        archive = Archive(self.opentok, self.archive_values(0))
+
+        expect(archive._created_at).to(equal(1395183243556))
+        created_at = archive.created_at
+        expect(created_at).to(be_a(datetime.datetime))
+        expect(archive.created_at).to(be(created_at))
+
+    def test_archive_list_shares_repeated_strings(self):
+        payload = json.loads(
+            json.dumps(
+                {u("count"): 3, u("items"): [self.archive_values(i) for i in range(3)]}
+            )
+        )
+        archive_list = ArchiveList(self.opentok, payload)
+
+        assert len(archive_list) == 3
+        archive = archive_list[1]
+        assert isinstance(archive, Archive)
+        assert archive.id == u("ARCHIVE1")
+        assert archive.sdk is self.opentok
+        assert archive.output_mode == OutputModes.composed
+        assert archive.stream_mode == StreamModes.auto
+        assert archive.size == 100
+        # the strings are equal but were decoded separately
+        assert archive_list[0].session_id is archive_list[2].session_id
+        assert archive_list[0].status is archive_list[2].status
+        assert [a.id for a in archive_list.items[1:]] == [u("ARCHIVE1"), u("ARCHIVE2")]
+
+    def test_archive_null_modes(self):
+        values = dict(self.archive_values(0), outputMode=None, streamMode=None)
+
+        fetched = Archive(self.opentok, values)
+        listed = ArchiveList(self.opentok, {u("count"): 1, u("items"): [values]})[0]
+
+        for archive in (fetched, listed):
+            assert archive.output_mode == OutputModes.composed
+            assert archive.stream_mode == StreamModes.auto
+
+    def test_archive_list_items_keep_their_identity(self):
+        archive_list = ArchiveList(
+            self.opentok,
+            {u("count"): 3, u("items"): [self.archive_values(i) for i in range(3)]},
+        )
+
+        archive = archive_list[0]
+        assert archive_list[0] is archive
+        assert archive_list.items[-3] is archive
+        assert archive_list.items[:2][0] is archive
+
+        archive_list[1].status = u("stopped")
+        assert archive_list[1].status == u("stopped")
+        archives = list(archive_list)
+        assert archives[0] is archive
+        assert archives[1].status == u("stopped")
+        assert list(archive_list)[2] is archives[2]
@@ -0,0 +1,127 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import pytest
+from expects import *
+
+from opentok import ArchiveError, Client
+from opentok.emulator import Emulator, _archive_content
+
+
+class ArchiveDownloadTest(unittest.TestCase):
+    def setUp(self):
+        self.api_key = "123456"
+        self.api_secret = "1234567890abcdef1234567890abcdef1234567890"
+        self.emulator = Emulator().start()
+        self.addCleanup(self.emulator.stop)
+        self.opentok = Client(self.api_key, self.api_secret, api_url=self.emulator.url)
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, "archive.mp4")
+
+        archive = self.opentok.start_archive("SESSIONID")
+        self.opentok.stop_archive(archive.id)
+        # 1 MB, or 5 chunks of 200 KB
+        self.emulator.archives[archive.id]["duration"] = 8
+        self.archive = self.opentok.get_archive(archive.id)
+        self.content = _archive_content(archive.id, 0, self.archive.size)
+        self.etag = '"%s"' % self.emulator._etag(archive.id, self.archive.size)
+        self.emulator.request_counts.clear()
+
+    def read(self, path):
+        with open(path, "rb") as f:
+            return f.read()
+
+    def test_download(self):
+        path = self.archive.download(self.path, parallelism=3, chunk_size=200000)
+
+        expect(path).to(equal(self.path))
+        expect(self.read(path) == self.content).to(be_true)
+        expect(os.listdir(self.directory)).to(equal(["archive.mp4"]))
+        # the first byte to learn the size of the file, then one request per chunk
+        expect(self.emulator.request_counts["download"]).to(equal(6))
+        expect(self.emulator.request_counts["archive"]).to(equal(0))
+
+    def test_expired_url_is_refreshed(self):
+        self.emulator.url_lifetime = -1
+        archive = self.opentok.get_archive(self.archive.id)
+        self.emulator.url_lifetime = 600
+        expired_url = archive.url
+
+        archive.download(self.path, chunk_size=200000)
+
+        expect(self.read(self.path) == self.content).to(be_true)
+        expect(archive.url).not_to(equal(expired_url))
+        expect(self.emulator.request_counts["archive"]).to(equal(2))
+
+    def test_failed_requests_are_retried(self):
+        self.emulator.inject_errors(503, count=3, family="download")
+
+        self.archive.download(self.path, parallelism=1, chunk_size=200000)
+
+        expect(self.read(self.path) == self.content).to(be_true)
+        expect(self.emulator.request_counts["download"]).to(equal(9))
+
+    def test_resume(self):
+        chunk_size = 200000
+        # an interrupted download: the last two chunks are missing
+        with open(self.path + ".part", "wb") as f:
+            f.write(self.content[: 3 * chunk_size])
+            f.truncate(len(self.content))
+        with open(self.path + ".part.json", "w") as f:
+            json.dump(
+                {
+                    "size": len(self.content),
+                    "etag": self.etag,
+                    "chunk_size": chunk_size,
+                    "done": [0, chunk_size, 2 * chunk_size],
+                },
+                f,
+            )
+
+        self.archive.download(self.path, chunk_size=chunk_size)
+
+        expect(self.read(self.path) == self.content).to(be_true)
+        expect(self.emulator.request_counts["download"]).to(equal(3))
+        expect(os.listdir(self.directory)).to(equal(["archive.mp4"]))
+
+    def test_checksum_mismatch(self):
+        chunk_size = 512 * 1024
+        with open(self.path + ".part", "wb") as f:
+            f.truncate(len(self.content))
+        with open(self.path + ".part.json", "w") as f:
+            json.dump(
+                {
+                    "size": len(self.content),
+                    "etag": self.etag,
+                    "chunk_size": chunk_size,
+                    "done": [0, chunk_size],
+                },
+                f,
+            )
+
+        with pytest.raises(ArchiveError) as e:
+            self.archive.download(self.path, chunk_size=chunk_size)
+        expect(str(e.value)).to(contain("checksum"))
+        expect(os.path.exists(self.path)).to(be_false)
+
+        # the next download starts over
+        self.archive.download(self.path, chunk_size=chunk_size)
+        expect(self.read(self.path) == self.content).to(be_true)
+
+    def test_size_mismatch(self):
+        self.archive.size += 1
+
+        with pytest.raises(ArchiveError):
+            self.archive.download(self.path)
+        expect(os.listdir(self.directory)).to(be_empty)
+
+    def test_unavailable_archive(self):
+        archive = self.opentok.start_archive("SESSIONID", multi_archive_tag="other")
+
+        with pytest.raises(ArchiveError) as e:
+            archive.download(self.path)
+        expect(str(e.value)).to(contain("its status is started"))
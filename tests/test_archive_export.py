@@ -0,0 +1,116 @@
+import csv
+import io
+import json
+import unittest
+
+import httpretty
+import pytest
+from expects import *
+
+from opentok import Client, ArchiveList, ArchiveColumns, OpenTokException
+from opentok.archive_export import EXPORT_FIELDS, write_csv, write_ndjson
+
+
+def make_archive(index, session_id="SESSION1"):
+    return {
+        "createdAt": 1395183243556 + index * 1000,
+        "duration": 60 * (index + 1),
+        "id": "archive-{0}".format(index),
+        "name": "name {0}".format(index),
+        "partnerId": 123456,
+        "reason": "",
+        "sessionId": session_id,
+        "size": 1000 * (index + 1),
+        "status": "available",
+        "hasAudio": True,
+        "hasVideo": False,
+        "outputMode": "composed",
+        "url": None,
+    }
+
+
+class ArchiveExportTest(unittest.TestCase):
+    def setUp(self):
+        self.api_key = "123456"
+        self.api_secret = "1234567890abcdef1234567890abcdef1234567890"
+        self.opentok = Client(self.api_key, self.api_secret)
+        self.archives = [
+            make_archive(i, "SESSION1" if i % 2 else "SESSION2") for i in range(5)
+        ]
+        self.archive_list = ArchiveList(
+            self.opentok, {"count": 5, "items": self.archives}
+        )
+
+    def test_write_ndjson(self):
+        fp = io.StringIO()
+
+        count = write_ndjson(self.archive_list, fp)
+
+        lines = fp.getvalue().splitlines()
+        expect(count).to(equal(5))
+        expect(lines).to(have_length(5))
+        record = json.loads(lines[1])
+        expect(record["id"]).to(equal("archive-1"))
+        expect(record["session_id"]).to(equal("SESSION1"))
+        expect(record["output_mode"]).to(equal("composed"))
+        expect(record["stream_mode"]).to(equal("auto"))
+        expect(record["created_at"]).to(equal("2014-03-18T22:54:04+00:00"))
+        expect(list(record)).to(equal(list(EXPORT_FIELDS)))
+
+    def test_write_csv(self):
+        fp = io.StringIO(newline="")
+
+        count = write_csv(self.archive_list, fp, fields=("id", "size", "has_video"))
+
+        rows = list(csv.reader(io.StringIO(fp.getvalue())))
+        expect(count).to(equal(5))
+        expect(rows[0]).to(equal(["id", "size", "has_video"]))
+        expect(rows[1]).to(equal(["archive-0", "1000", "False"]))
+        expect(rows).to(have_length(6))
+
+    def test_columns(self):
+        columns = self.archive_list.columns()
+
+        expect(columns).to(be_an(ArchiveColumns))
+        expect(len(columns)).to(equal(5))
+        expect(columns.id).to(equal(["archive-%d" % i for i in range(5)]))
+        expect(columns.size).to(equal([1000, 2000, 3000, 4000, 5000]))
+        expect(columns.total_size()).to(equal(15000))
+        expect(columns.total_duration()).to(equal(900))
+        expect(columns.size_by_session()).to(
+            equal({"SESSION1": 6000, "SESSION2": 9000})
+        )
+        expect(columns.minutes_by_session()).to(
+            equal({"SESSION1": 6.0, "SESSION2": 9.0})
+        )
+
+    @httpretty.activate
+    def test_export_archives(self):
+        def respond(request, uri, response_headers):
+            offset = int(request.querystring["offset"][0])
+            count = int(request.querystring["count"][0])
+            body = {
+                "count": len(self.archives),
+                "items": self.archives[offset : offset + count],
+            }
+            return [200, response_headers, json.dumps(body)]
+
+        httpretty.register_uri(
+            httpretty.GET,
+            "https://api.opentok.com/v2/project/{0}/archive".format(self.api_key),
+            body=respond,
+            content_type="application/json",
+        )
+
+        fp = io.StringIO(newline="")
+        count = self.opentok.export_archives(fp, format="csv", page_size=2)
+
+        rows = list(csv.reader(io.StringIO(fp.getvalue())))
+        expect(count).to(equal(5))
+        expect([row[0] for row in rows[1:]]).to(
+            equal(["archive-%d" % i for i in range(5)])
+        )
+
+    def test_export_archives_invalid_format(self):
+        with pytest.raises(OpenTokException):
+            self.opentok.export_archives(io.StringIO(), format="xml")
@@ -0,0 +1,137 @@
+import json
+import threading
+import unittest
+
+import httpretty
+import pytest
+from expects import *
+
+from opentok import Client, Archive, ArchiveList, OpenTokException
+
+
+def make_archive(index):
+    return {
+        "createdAt": 1395183243556 - index,
+        "duration": 10,
+        "id": "archive-{0}".format(index),
+        "name": "",
+        "partnerId": 123456,
+        "reason": "",
+        "sessionId": "SESSIONID",
+        "size": 1000,
+        "status": "available",
+        "hasAudio": True,
+        "hasVideo": True,
+        "outputMode": "composed",
+        "url": None,
+    }
+
+
+class ArchivePaginationTest(unittest.TestCase):
+    def setUp(self):
+        self.api_key = "123456"
+        self.api_secret = "1234567890abcdef1234567890abcdef1234567890"
+        self.opentok = Client(self.api_key, self.api_secret)
+        self.archives = [make_archive(i) for i in range(250)]
+        self.requested = []
+        self.lock = threading.Lock()
+
+    def register_archives(self):
+        def respond(request, uri, response_headers):
+            offset = int(request.querystring.get("offset", ["0"])[0])
+            count = int(request.querystring.get("count", ["50"])[0])
+            with self.lock:
+                self.requested.append((offset, count, request.querystring.get("sessionId")))
+            body = {
+                "count": len(self.archives),
+                "items": self.archives[offset : offset + count],
+            }
+            return [200, response_headers, json.dumps(body)]
+
+        httpretty.register_uri(
+            httpretty.GET,
+            "https://api.opentok.com/v2/project/{0}/archive".format(self.api_key),
+            body=respond,
+            content_type="application/json",
+        )
+
+    @httpretty.activate
+    def test_iter_archives(self):
+        self.register_archives()
+
+        archives = list(self.opentok.iter_archives(page_size=100, prefetch=2))
+
+        expect(archives).to(have_length(250))
+        expect(archives[0]).to(be_an(Archive))
+        expect([a.id for a in archives]).to(equal([a["id"] for a in self.archives]))
+        expect(sorted(set(offset for offset, _, _ in self.requested))).to(
+            equal([0, 100, 200])
+        )
+
+    @httpretty.activate
+    def test_iter_archives_without_prefetch(self):
+        self.register_archives()
+
+        iterator = self.opentok.iter_archives(session_id="SESSIONID", page_size=100, prefetch=0)
+        first = next(iterator)
+
+        expect(first.id).to(equal("archive-0"))
+        expect(set(offset for offset, _, _ in self.requested)).to(equal({0}))
+        expect(self.requested[0][2]).to(equal(["SESSIONID"]))
+        expect(list(iterator)).to(have_length(249))
+
+    @httpretty.activate
+    def test_iter_archives_skips_shifted_archives(self):
+        self.register_archives()
+        iterator = self.opentok.iter_archives(page_size=100, prefetch=0)
+        first_page = [next(iterator) for _ in range(100)]
+
+        # a new archive is started, every archive moves one offset down
+        self.archives.insert(0, make_archive(-1))
+        rest = list(iterator)
+
+        ids = [a.id for a in first_page + rest]
+        expect(ids).to(have_length(250))
+        expect(len(set(ids))).to(equal(250))
+
+    @httpretty.activate
+    def test_iter_archives_stops_on_short_page(self):
+        self.archives = self.archives[:30]
+        self.register_archives()
+
+        archives = list(self.opentok.iter_archives(page_size=100, prefetch=3))
+
+        expect(archives).to(have_length(30))
+        expect(self.requested).to(have_length(1))
+
+    @httpretty.activate
+    def test_get_all_archives(self):
+        self.register_archives()
+
+        archive_list = self.opentok.get_all_archives(
+            session_id="SESSIONID", page_size=40, concurrency=4
+        )
+
+        expect(archive_list).to(be_an(ArchiveList))
+        expect(archive_list.count).to(equal(250))
+        expect([a.id for a in archive_list]).to(equal([a["id"] for a in self.archives]))
+        expect(sorted(set(offset for offset, _, _ in self.requested))).to(
+            equal(list(range(0, 250, 40)))
+        )
+        expect(set(count for _, count, _ in self.requested)).to(equal({40}))
+
+    @httpretty.activate
+    def test_get_all_archives_single_page(self):
+        self.archives = self.archives[:10]
+        self.register_archives()
+
+        archive_list = self.opentok.get_all_archives()
+
+        expect(archive_list).to(have_length(10))
+        expect(self.requested).to(have_length(1))
+
+    def test_iter_archives_invalid_page_size(self):
+        with pytest.raises(OpenTokException):
+            self.opentok.iter_archives(page_size=1001)
+        with pytest.raises(OpenTokException):
+            self.opentok.get_all_archives(page_size=0)
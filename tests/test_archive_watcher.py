@@ -0,0 +1,192 @@
+import asyncio
+import unittest
+
+import pytest
+from expects import *
+
+from opentok import (
+    Archive,
+    ArchiveError,
+    ArchiveTimeoutError,
+    ArchiveWatcher,
+    Client,
+)
+from opentok.archive_watcher import _ArchiveWait
+from opentok.emulator import Emulator
+from opentok.exceptions import NotFoundError
+
+
+class WaitForArchiveTest(unittest.TestCase):
+    def setUp(self):
+        self.api_key = "123456"
+        self.api_secret = "1234567890abcdef1234567890abcdef1234567890"
+        self.emulator = Emulator(processing_time=0.3).start()
+        self.addCleanup(self.emulator.stop)
+        self.opentok = Client(self.api_key, self.api_secret, api_url=self.emulator.url)
+
+    def stopped_archive(self, session_id="SESSIONID"):
+        archive = self.opentok.start_archive(session_id)
+        self.opentok.stop_archive(archive.id)
+        return archive
+
+    def test_wait_for_archive(self):
+        archive = self.stopped_archive()
+        self.emulator.request_counts.clear()
+
+        ready = self.opentok.wait_for_archive(archive.id, min_interval=0.05)
+
+        expect(ready).to(be_a(Archive))
+        expect(ready.status).to(equal("available"))
+        expect(ready.url).not_to(be_none)
+        # 0.05 + 0.075 + 0.11 + 0.17 s: ready by the fifth poll
+        expect(self.emulator.request_counts["archive"]).to(be_below_or_equal(5))
+
+    def test_timeout(self):
+        self.emulator.processing_time = 10
+        archive = self.stopped_archive()
+
+        with pytest.raises(ArchiveTimeoutError) as e:
+            self.opentok.wait_for_archive(archive.id, timeout=0.2, min_interval=0.05)
+        expect(str(e.value)).to(contain("is still stopped"))
+
+    def test_failed_archive(self):
+        archive = self.opentok.start_archive("SESSIONID")
+        self.emulator.archives[archive.id]["status"] = "failed"
+
+        with pytest.raises(ArchiveError) as e:
+            self.opentok.wait_for_archive(archive.id, min_interval=0.05)
+        expect(e.value).not_to(be_a(ArchiveTimeoutError))
+
+    def test_other_states(self):
+        archive = self.opentok.start_archive("SESSIONID")
+
+        started = self.opentok.wait_for_archive(archive.id, states=["started", "paused"])
+
+        expect(started.status).to(equal("started"))
+
+    def test_async_client(self):
+        pytest.importorskip("aiohttp")
+        from opentok import AsyncClient
+
+        archive = self.stopped_archive()
+
+        async def main():
+            async with AsyncClient(
+                self.api_key, self.api_secret, api_url=self.emulator.url
+            ) as client:
+                return await client.wait_for_archive(archive.id, min_interval=0.05)
+
+        expect(asyncio.run(main()).status).to(equal("available"))
+
+
+class AdaptiveDelayTest(unittest.TestCase):
+    def archive(self, duration):
+        return Archive(None, {"id": "ID", "status": "stopped", "duration": duration})
+
+    def test_long_archives_are_polled_less_often(self):
+        wait = _ArchiveWait("ID", min_interval=1, max_interval=30, processing_ratio=0.1)
+        # a one hour archive is expected to be ready in 6 minutes
+        expect(wait.next_delay(self.archive(3600))).to(equal(30))
+
+        wait.started -= 340
+        expect(wait.next_delay(self.archive(3600))).to(be_within(9.9, 10.1))
+
+        # past the expected processing time, the delay grows from min_interval
+        wait.started -= 20
+        delays = [wait.next_delay(self.archive(3600)) for _ in range(4)]
+        expect(delays).to(equal([1, 1.5, 2.25, 3.375]))
+
+    def test_short_archives(self):
+        wait = _ArchiveWait("ID", min_interval=1, max_interval=4, backoff=2)
+
+        delays = [wait.next_delay(self.archive(5)) for _ in range(5)]
+
+        expect(delays).to(equal([1, 2, 4, 4, 4]))
+
+    def test_timeout(self):
+        wait = _ArchiveWait("ID", timeout=10, min_interval=1, max_interval=30)
+        wait.started -= 9.5
+
+        expect(wait.next_delay(self.archive(3600))).to(be_below_or_equal(0.5))
+        wait.started -= 1
+        with pytest.raises(ArchiveTimeoutError):
+            wait.next_delay(self.archive(3600))
+
+
+class ArchiveWatcherTest(unittest.TestCase):
+    def setUp(self):
+        self.api_key = "123456"
+        self.api_secret = "1234567890abcdef1234567890abcdef1234567890"
+        self.emulator = Emulator(processing_time=0.2).start()
+        self.addCleanup(self.emulator.stop)
+        self.opentok = Client(self.api_key, self.api_secret, api_url=self.emulator.url)
+        self.changes = []
+        self.watcher = ArchiveWatcher(
+            self.opentok,
+            on_change=lambda archive, previous: self.changes.append(
+                (archive.id, previous, archive.status)
+            ),
+            min_interval=0.05,
+            max_interval=0.2,
+        )
+        self.addCleanup(self.watcher.close)
+
+    def stopped_archives(self, session_id, count):
+        archives = []
+        for i in range(count):
+            archive = self.opentok.start_archive(
+                session_id, name="archive%d" % i, multi_archive_tag="tag%d" % i
+            )
+            archives.append(archive)
+        for archive in archives:
+            self.opentok.stop_archive(archive.id)
+        return archives
+
+    def test_watch(self):
+        archives = self.stopped_archives("SESSION1", 3) + self.stopped_archives(
+            "SESSION2", 1
+        )
+
+        futures = [self.watcher.watch(archive.id) for archive in archives]
+
+        for future in futures:
+            expect(future.result(timeout=5).status).to(equal("available"))
+        expect(self.watcher.watching()).to(be_empty)
+        expect(self.changes).to(contain((archives[0].id, None, "stopped")))
+        expect(self.changes).to(contain((archives[0].id, "stopped", "available")))
+
+    def test_archives_of_a_session_share_requests(self):
+        self.emulator.processing_time = 0
+        archives = self.stopped_archives("SESSION1", 5)
+        self.emulator.request_counts.clear()
+
+        with self.watcher._condition:
+            futures = [
+                self.watcher.watch(archive.id, session_id="SESSION1")
+                for archive in archives
+            ]
+
+        for future in futures:
+            future.result(timeout=5)
+        expect(self.watcher.requests).to(equal(1))
+        expect(self.emulator.request_counts["archive"]).to(equal(1))
+
+    def test_failures(self):
+        archive = self.opentok.start_archive("SESSION1")
+        self.emulator.archives[archive.id]["status"] = "expired"
+
+        with pytest.raises(ArchiveError):
+            self.watcher.watch(archive.id).result(timeout=5)
+        with pytest.raises(NotFoundError):
+            self.watcher.watch("UNKNOWN").result(timeout=5)
+
+    def test_unwatch(self):
+        self.emulator.processing_time = 10
+        archive = self.stopped_archives("SESSION1", 1)[0]
+        future = self.watcher.watch(archive.id)
+        expect(self.watcher.watch(archive.id)).to(be(future))
+
+        self.watcher.unwatch(archive.id)
+
+        expect(future.cancelled()).to(be_true)
+        expect(self.watcher.watching()).to(be_empty)
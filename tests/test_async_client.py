@@ -0,0 +1,222 @@
+import asyncio
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from expects import *
+
+pytest.importorskip("aiohttp")
+
+from opentok import (
+    AsyncClient,
+    RetryPolicy,
+    Archive,
+    StreamList,
+    Session,
+    ForceDisconnectError,
+)
+from opentok.exceptions import AuthError
+
+
+ARCHIVE = {
+    "createdAt": 1395183243556,
+    "duration": 0,
+    "id": "30b3ebf1-ba36-4f5b-8def-6f70d9986fe9",
+    "name": "",
+    "partnerId": 123456,
+    "reason": "",
+    "sessionId": "SESSIONID",
+    "size": 0,
+    "status": "started",
+    "hasAudio": True,
+    "hasVideo": True,
+    "outputMode": "composed",
+    "url": None,
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests = []
+
+    def _reply(self, status, body=None):
+        content = json.dumps(body).encode("utf-8") if body is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _handle(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        StubHandler.requests.append((self.command, self.path, self.headers, body))
+
+        if self.path.endswith("/archive/flaky"):
+            # fails once, then succeeds
+            flaky_calls = sum(1 for r in StubHandler.requests if r[1] == self.path)
+            self._reply(503 if flaky_calls == 1 else 200, ARCHIVE)
+        elif self.path == "/session/create":
+            self._reply(200, [{"session_id": "1_MX4xMjM0NTZ-fg"}])
+        elif "/archive?" in self.path:
+            query = parse_qs(urlparse(self.path).query)
+            offset, count = int(query["offset"][0]), int(query["count"][0])
+            items = [
+                dict(ARCHIVE, id="archive-%d" % i)
+                for i in range(offset, min(offset + count, 5))
+            ]
+            self._reply(200, {"count": 5, "items": items})
+        elif self.path.endswith("/archive"):
+            self._reply(200, ARCHIVE)
+        elif self.path.endswith("/signal"):
+            self._reply(204)
+        elif self.path.endswith("/stream"):
+            self._reply(200, {"count": 1, "items": [{"id": "STREAMID"}]})
+        elif "/connection/missing" in self.path:
+            self._reply(404)
+        elif "/connection/" in self.path:
+            self._reply(204)
+        else:
+            self._reply(403)
+
+    do_GET = do_POST = do_DELETE = _handle
+
+    def log_message(self, *args):
+        pass
+
+
+class AsyncClientTest(unittest.TestCase):
+    def setUp(self):
+        self.api_key = "123456"
+        self.api_secret = "1234567890abcdef1234567890abcdef1234567890"
+        self.session_id = "SESSIONID"
+        StubHandler.requests = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.api_url = "http://127.0.0.1:{0}".format(self.server.server_address[1])
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def run_with_client(self, func, **options):
+        async def main():
+            async with AsyncClient(
+                self.api_key, self.api_secret, api_url=self.api_url, **options
+            ) as client:
+                return await func(client)
+
+        return asyncio.run(main())
+
+    def test_create_session(self):
+        session = self.run_with_client(lambda client: client.create_session())
+
+        expect(session).to(be_a(Session))
+        expect(session.session_id).to(equal("1_MX4xMjM0NTZ-fg"))
+
+    def test_start_archive(self):
+        archive = self.run_with_client(
+            lambda client: client.start_archive(self.session_id, name="name")
+        )
+
+        expect(archive).to(be_an(Archive))
+        expect(archive.id).to(equal(ARCHIVE["id"]))
+        method, path, headers, body = StubHandler.requests[-1]
+        expect(method).to(equal("POST"))
+        expect(headers["Content-Type"]).to(equal("application/json"))
+        expect(json.loads(body)).to(have_key("name", "name"))
+
+    def test_send_signal(self):
+        result = self.run_with_client(
+            lambda client: client.send_signal(self.session_id, {"type": "a", "data": "b"})
+        )
+
+        expect(result).to(be_none)
+        expect(StubHandler.requests[-1][1]).to(end_with("/signal"))
+
+    def test_list_streams(self):
+        stream_list = self.run_with_client(
+            lambda client: client.list_streams(self.session_id)
+        )
+
+        expect(stream_list).to(be_a(StreamList))
+        expect(stream_list.count).to(equal(1))
+
+    def test_error_mapping(self):
+        with pytest.raises(ForceDisconnectError):
+            self.run_with_client(
+                lambda client: client.force_disconnect(self.session_id, "missing")
+            )
+        with pytest.raises(AuthError):
+            self.run_with_client(lambda client: client.get_archive("unknown"))
+
+    def test_concurrent_calls(self):
+        async def disconnect_all(client):
+            return await asyncio.gather(
+                *(
+                    client.force_disconnect(self.session_id, "connection%d" % i)
+                    for i in range(200)
+                )
+            )
+
+        results = self.run_with_client(disconnect_all)
+
+        expect(results).to(have_length(200))
+        expect(StubHandler.requests).to(have_length(200))
+
+    def test_iter_archives(self):
+        async def collect(client):
+            return [archive async for archive in client.iter_archives(page_size=2)]
+
+        archives = self.run_with_client(collect)
+
+        expect([archive.id for archive in archives]).to(
+            equal(["archive-%d" % i for i in range(5)])
+        )
+        expect(StubHandler.requests).to(have_length(3))
+
+    def test_get_all_archives(self):
+        archive_list = self.run_with_client(
+            lambda client: client.get_all_archives(page_size=2, concurrency=2)
+        )
+
+        expect(archive_list.count).to(equal(5))
+        expect([archive.id for archive in archive_list]).to(
+            equal(["archive-%d" % i for i in range(5)])
+        )
+        expect(StubHandler.requests).to(have_length(3))
+
+    def test_retry(self):
+        archive = self.run_with_client(
+            lambda client: client.get_archive("flaky"),
+            retry_policy=RetryPolicy(backoff_base=0),
+        )
+
+        expect(archive.id).to(equal(ARCHIVE["id"]))
+        expect(StubHandler.requests).to(have_length(2))
+
+    def test_send_signals(self):
+        signals = [("connection%d" % i, {"type": "t", "data": str(i)}) for i in range(30)]
+
+        results = self.run_with_client(
+            lambda client: client.send_signals(self.session_id, signals, concurrency=4)
+        )
+
+        expect(results).to(have_length(30))
+        expect(set(results)).to(equal({None}))
+        expect(StubHandler.requests).to(have_length(30))
+
+    def test_force_disconnect_many(self):
+        results = self.run_with_client(
+            lambda client: client.force_disconnect_many(
+                self.session_id, ["connection1", "missing", "connection2"], concurrency=2
+            )
+        )
+
+        expect(results["connection1"]).to(be_none)
+        expect(results["missing"]).to(be_a(ForceDisconnectError))
+        expect(results).to(have_length(3))
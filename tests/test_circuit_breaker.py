@@ -0,0 +1,238 @@
+import time
+import unittest
+
+import httpretty
+import pytest
+import requests
+from expects import *
+
+from opentok import (
+    Client,
+    CircuitBreaker,
+    CircuitState,
+    CircuitOpenError,
+    RateLimiter,
+)
+from opentok.exceptions import RateLimitError, RequestError
+from opentok.transport import Response
+
+
+class FakeResponse(object):
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    def setUp(self):
+        self.changes = []
+        self.breaker = CircuitBreaker(
+            failure_threshold=0.5,
+            minimum_requests=4,
+            window_size=10,
+            open_timeout=0.05,
+            half_open_max_calls=2,
+            on_state_change=lambda *change: self.changes.append(change),
+        )
+
+    def fail(self, family="archive", count=1):
+        for _ in range(count):
+            self.breaker.before_request(family)
+            self.breaker.record(family, True, 0.01)
+
+    def succeed(self, family="archive", count=1):
+        for _ in range(count):
+            self.breaker.before_request(family)
+            self.breaker.record(family, False, 0.01)
+
+    def test_opens_on_failure_rate(self):
+        self.succeed(count=2)
+        self.fail()
+        expect(self.breaker.state("archive")).to(equal(CircuitState.closed))
+
+        self.fail()
+
+        expect(self.breaker.state("archive")).to(equal(CircuitState.open))
+        expect(self.changes).to(
+            equal([("archive", CircuitState.closed, CircuitState.open)])
+        )
+        with pytest.raises(CircuitOpenError) as excinfo:
+            self.breaker.before_request("archive")
+        expect(excinfo.value.family).to(equal("archive"))
+        expect(excinfo.value.retry_after).to(be_within(0, 0.05))
+
+    def test_families_are_independent(self):
+        self.fail(count=4)
+
+        expect(self.breaker.state("archive")).to(equal(CircuitState.open))
+        self.breaker.before_request("signal")
+        expect(self.breaker.state("signal")).to(equal(CircuitState.closed))
+
+    def test_half_open_probes_close_the_circuit(self):
+        self.fail(count=4)
+        time.sleep(0.06)
+
+        self.breaker.before_request("archive")
+        self.breaker.before_request("archive")
+        expect(self.breaker.state("archive")).to(equal(CircuitState.half_open))
+        # only half_open_max_calls probes are let through
+        with pytest.raises(CircuitOpenError):
+            self.breaker.before_request("archive")
+
+        self.breaker.record("archive", False, 0.01)
+        self.breaker.record("archive", False, 0.01)
+
+        expect(self.breaker.state("archive")).to(equal(CircuitState.closed))
+        expect([change[2] for change in self.changes]).to(
+            equal([CircuitState.open, CircuitState.half_open, CircuitState.closed])
+        )
+        expect(self.breaker.stats("archive")["requests"]).to(equal(0))
+
+    def test_failed_probe_reopens_the_circuit(self):
+        self.fail(count=4)
+        time.sleep(0.06)
+
+        self.fail()
+
+        expect(self.breaker.state("archive")).to(equal(CircuitState.open))
+
+    def test_is_failure(self):
+        breaker = CircuitBreaker(slow_call_threshold=1.0)
+
+        expect(breaker.is_failure(FakeResponse(503))).to(be_true)
+        expect(breaker.is_failure(FakeResponse(404))).to(be_false)
+        expect(breaker.is_failure(exception=requests.Timeout())).to(be_true)
+        expect(breaker.is_failure(FakeResponse(200), duration=2.0)).to(be_true)
+        expect(breaker.is_failure(FakeResponse(200), duration=0.5)).to(be_false)
+
+    def test_stats(self):
+        self.succeed(count=3)
+        self.breaker.record("archive", True, 0.01)
+
+        stats = self.breaker.stats("archive")
+
+        expect(stats["state"]).to(equal(CircuitState.closed))
+        expect(stats["requests"]).to(equal(4))
+        expect(stats["failure_rate"]).to(equal(0.25))
+        expect(stats["latency"]).to(be_within(0.0099, 0.0101))
+
+
+class ClientCircuitBreakerTest(unittest.TestCase):
+    def setUp(self):
+        self.api_key = "123456"
+        self.api_secret = "1234567890abcdef1234567890abcdef1234567890"
+        self.breaker = CircuitBreaker(minimum_requests=2, open_timeout=60)
+        self.opentok = Client(
+            self.api_key, self.api_secret, circuit_breaker=self.breaker
+        )
+
+    @httpretty.activate
+    def test_fails_fast_while_open(self):
+        calls = []
+
+        def respond(request, uri, response_headers):
+            calls.append(uri)
+            return [503, response_headers, ""]
+
+        httpretty.register_uri(
+            httpretty.GET,
+            "https://api.opentok.com/v2/project/{0}/archive/ARCHIVEID".format(
+                self.api_key
+            ),
+            body=respond,
+        )
+
+        for _ in range(2):
+            with pytest.raises(RequestError):
+                self.opentok.get_archive("ARCHIVEID")
+        with pytest.raises(CircuitOpenError):
+            self.opentok.get_archive("ARCHIVEID")
+
+        expect(calls).to(have_length(2))
+        expect(self.breaker.state("archive")).to(equal(CircuitState.open))
+        expect(self.breaker.state("signal")).to(equal(CircuitState.closed))
+
+    def test_open_circuit_does_not_use_rate_limit_tokens(self):
+        self.opentok.rate_limiter = RateLimiter(rates={"archive": (1, 1)}, block=False)
+        self.breaker.open_timeout = 0.05
+        for _ in range(2):
+            self.breaker.before_request("archive")
+            self.breaker.record("archive", True, 0.01)
+
+        with pytest.raises(CircuitOpenError):
+            self.opentok.get_archive("ARCHIVEID")
+
+        # the only token is still available for the half-open probe
+        time.sleep(0.06)
+        self.opentok.transport.request = lambda *args, **kwargs: Response(
+            503, {}, b""
+        )
+        with pytest.raises(RequestError):
+            self.opentok.get_archive("ARCHIVEID")
+        expect(self.breaker.state("archive")).to(equal(CircuitState.open))
+
+    def test_rate_limited_probe_is_given_back(self):
+        self.breaker.before_request("archive")
+        self.breaker.record("archive", True, 0.01)
+        self.breaker.before_request("archive")
+        self.breaker.record("archive", True, 0.01)
+        self.breaker.open_timeout = 0
+        self.opentok.rate_limiter = RateLimiter(rates={"archive": (1, 1)}, block=False)
+        self.opentok.rate_limiter.reserve("archive")
+
+        with pytest.raises(RateLimitError):
+            self.opentok.get_archive("ARCHIVEID")
+
+        expect(self.breaker.state("archive")).to(equal(CircuitState.half_open))
+        # the probe was not used up by the rejected request
+        self.breaker.before_request("archive")
+
+    def test_create_session_does_not_wrap_fail_fast_errors(self):
+        for _ in range(2):
+            self.breaker.before_request("session")
+            self.breaker.record("session", True, 0.01)
+
+        with pytest.raises(CircuitOpenError) as excinfo:
+            self.opentok.create_session()
+        expect(type(excinfo.value)).to(be(CircuitOpenError))
+
+        self.opentok.circuit_breaker = None
+        self.opentok.rate_limiter = RateLimiter(rates={"session": (1, 1)}, block=False)
+        self.opentok.rate_limiter.reserve("session")
+        with pytest.raises(RateLimitError) as excinfo:
+            self.opentok.create_session()
+        expect(type(excinfo.value)).to(be(RateLimitError))
+
+    def test_moderation_does_not_wrap_fail_fast_errors(self):
+        for _ in range(2):
+            self.breaker.before_request("moderation")
+            self.breaker.record("moderation", True, 0.01)
+
+        with pytest.raises(CircuitOpenError):
+            self.opentok.mute_all("SESSIONID", [])
+        with pytest.raises(CircuitOpenError):
+            self.opentok.mute_stream("SESSIONID", "STREAMID")
+
+        self.opentok.circuit_breaker = None
+        self.opentok.rate_limiter = RateLimiter(
+            rates={"moderation": (1, 1), "sip": (1, 1)}, block=False
+        )
+        self.opentok.rate_limiter.reserve("moderation")
+        self.opentok.rate_limiter.reserve("sip")
+        with pytest.raises(RateLimitError):
+            self.opentok.mute_all("SESSIONID", [])
+        with pytest.raises(RateLimitError):
+            self.opentok.disable_force_mute("SESSIONID")
+        with pytest.raises(RateLimitError):
+            self.opentok.play_dtmf("SESSIONID", None, "1234#")
+
+    def test_connection_errors_are_failures(self):
+        def request(method, url, **kwargs):
+            raise requests.ConnectionError("connection refused")
+
+        self.opentok.transport.request = request
+
+        for _ in range(2):
+            with pytest.raises(requests.ConnectionError):
+                self.opentok.get_archive("ARCHIVEID")
+
+        expect(self.breaker.state("archive")).to(equal(CircuitState.open))
@@ -3,6 +3,7 @@ from six import text_type, u, b, PY2, PY3
 from expects import *
 
 from opentok import Client, __version__
+import threading
 import time
 from jwt import decode
 
@@ -27,3 +28,44 @@ class JwtCustomClaimsTest(unittest.TestCase):
         expect(int(claims[u("exp")])).to(
             be_below(int(time.time()) + (60 * 6))
         )  # below of 6 min
+
+    def test_auth_header_is_reused(self):
+        jwt_token = self.opentok._create_jwt_auth_header()
+        expect(self.opentok._create_jwt_auth_header()).to(equal(jwt_token))
+        expect(self.opentok.get_headers()["X-OPENTOK-AUTH"]).to(equal(jwt_token))
+
+    def test_auth_header_is_refreshed_before_expiry(self):
+        jwt_token = self.opentok._create_jwt_auth_header()
+        refresh_at = self.opentok._jwt_auth_header[1]
+        claims = decode(jwt_token, self.api_secret, algorithms=[u("HS256")])
+        expected = claims["exp"] - self.opentok.JWT_REFRESH_MARGIN
+        expect(refresh_at).to(be_within(expected, expected + 1))
+
+        self.opentok._jwt_auth_header = (jwt_token, time.time() - 1)
+        expect(self.opentok._create_jwt_auth_header()).not_to(equal(jwt_token))
+
+    def test_livetime_change_invalidates_auth_header(self):
+        jwt_token = self.opentok._create_jwt_auth_header()
+        self.opentok.jwt_livetime = 5
+        expect(self.opentok._create_jwt_auth_header()).not_to(equal(jwt_token))
+
+    def test_auth_header_is_signed_once_across_threads(self):
+        calls = []
+        sign = self.opentok._sign_jwt_auth_header
+
+        def counting_sign(*args):
+            calls.append(args)
+            time.sleep(0.01)
+            return sign(*args)
+
+        self.opentok._sign_jwt_auth_header = counting_sign
+        threads = [
+            threading.Thread(target=self.opentok._create_jwt_auth_header)
+            for _ in range(10)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        expect(calls).to(have_length(1))
@@ -0,0 +1,200 @@
+import asyncio
+import time
+import unittest
+
+import pytest
+import requests
+from expects import *
+
+from opentok import Client, RetryPolicy, Archive, ArchiveList, Session, Broadcast
+from opentok.emulator import Emulator
+from opentok.exceptions import (
+    ArchiveError,
+    BroadcastError,
+    CaptioningAlreadyInProgressError,
+    NotFoundError,
+    OpenTokException,
+    RequestError,
+)
+
+
+class EmulatorTest(unittest.TestCase):
+    def setUp(self):
+        self.api_key = "123456"
+        self.api_secret = "1234567890abcdef1234567890abcdef1234567890"
+        self.emulator = Emulator().start()
+        self.addCleanup(self.emulator.stop)
+        self.opentok = Client(self.api_key, self.api_secret, api_url=self.emulator.url)
+
+    def test_create_session(self):
+        session = self.opentok.create_session()
+
+        expect(session).to(be_a(Session))
+        token = self.opentok.generate_token(session.session_id)
+        expect(token).to(be_a(str))
+
+    def test_archive_lifecycle(self):
+        archive = self.opentok.start_archive("SESSIONID", name="demo")
+
+        expect(archive).to(be_an(Archive))
+        expect(archive.status).to(equal("started"))
+        expect(archive.partner_id).to(equal(123456))
+        with pytest.raises(ArchiveError):
+            self.opentok.start_archive("SESSIONID")
+
+        expect(self.opentok.stop_archive(archive.id).status).to(equal("stopped"))
+        archive = self.opentok.get_archive(archive.id)
+        expect(archive.status).to(equal("available"))
+        expect(archive.url).to(contain(".mp4?expires="))
+
+        self.opentok.delete_archive(archive.id)
+        with pytest.raises(NotFoundError):
+            self.opentok.get_archive(archive.id)
+
+    def test_processing_time(self):
+        self.emulator.processing_time = 60
+        archive = self.opentok.start_archive("SESSIONID")
+        self.opentok.stop_archive(archive.id)
+
+        expect(self.opentok.get_archive(archive.id).status).to(equal("stopped"))
+
+    def test_list_archives(self):
+        ids = [self.opentok.start_archive("SESSION%d" % i).id for i in range(5)]
+
+        archives = self.opentok.list_archives(offset=1, count=2)
+        expect(archives).to(be_an(ArchiveList))
+        expect(archives.count).to(equal(5))
+        expect([archive.id for archive in archives]).to(equal([ids[3], ids[2]]))
+        expect(self.opentok.list_archives(session_id="SESSION0").count).to(equal(1))
+        expect([a.id for a in self.opentok.iter_archives(page_size=2)]).to(
+            equal(ids[::-1])
+        )
+
+    def test_broadcast_lifecycle(self):
+        options = {"outputs": {"hls": {}}}
+        broadcast = self.opentok.start_broadcast("SESSIONID", options)
+
+        expect(broadcast).to(be_a(Broadcast))
+        expect(broadcast.broadcastUrls["hls"]).to(end_with(".m3u8"))
+        with pytest.raises(BroadcastError):
+            self.opentok.start_broadcast("SESSIONID", options)
+
+        self.opentok.set_broadcast_layout(broadcast.id, "bestFit")
+        expect(self.opentok.stop_broadcast(broadcast.id).status).to(equal("stopped"))
+        expect(self.opentok.get_broadcast(broadcast.id).status).to(equal("stopped"))
+
+    def test_render(self):
+        render = self.opentok.start_render("SESSIONID", "TOKEN", "https://example.com")
+
+        expect(render.status).to(equal("starting"))
+        expect(self.opentok.get_render(render.id).status).to(equal("started"))
+        expect(self.opentok.list_renders().count).to(equal(1))
+        self.opentok.stop_render(render.id)
+        expect(self.opentok.get_render(render.id).status).to(equal("stopped"))
+
+    def test_streams_and_moderation(self):
+        call = self.opentok.dial("SESSIONID", "TOKEN", "sip:user@sip.example.com")
+        stream_id = self.emulator.add_stream("SESSIONID", name="presenter")
+
+        streams = self.opentok.list_streams("SESSIONID")
+        expect([stream.id for stream in streams.items]).to(
+            equal([call.streamId, stream_id])
+        )
+        expect(self.opentok.get_stream("SESSIONID", stream_id).name).to(
+            equal("presenter")
+        )
+        self.opentok.set_stream_class_lists(
+            "SESSIONID", [{"id": stream_id, "layoutClassList": ["full"]}]
+        )
+        expect(self.opentok.get_stream("SESSIONID", stream_id).layoutClassList).to(
+            equal(["full"])
+        )
+
+        self.opentok.send_signal("SESSIONID", {"type": "chat", "data": "hi"})
+        self.opentok.force_disconnect("SESSIONID", "CONNECTIONID")
+        self.opentok.mute_stream("SESSIONID", stream_id)
+        self.opentok.mute_all("SESSIONID", [])
+        self.opentok.play_dtmf("SESSIONID", None, "1234#")
+        with pytest.raises(OpenTokException):
+            self.opentok.mute_stream("SESSIONID", "UNKNOWN")
+
+        expect(self.emulator.request_counts["moderation"]).to(equal(4))
+        expect(self.emulator.request_counts["signal"]).to(equal(1))
+
+    def test_connect_and_captions(self):
+        connection = self.opentok.connect_audio_to_websocket(
+            "SESSIONID", "TOKEN", {"uri": "wss://example.com/ws"}
+        )
+        expect(connection.connectionId).not_to(be_none)
+
+        captions = self.opentok.start_captions("SESSIONID", "TOKEN")
+        with pytest.raises(CaptioningAlreadyInProgressError):
+            self.opentok.start_captions("SESSIONID", "TOKEN")
+        self.opentok.stop_captions(captions.captions_id)
+
+    def test_injected_errors(self):
+        archive = self.opentok.start_archive("SESSIONID")
+        self.opentok.retry_policy = RetryPolicy(max_attempts=3, backoff_base=0)
+
+        self.emulator.inject_errors(503, count=2, family="archive")
+        self.opentok.create_session()
+        expect(self.opentok.get_archive(archive.id).id).to(equal(archive.id))
+
+        self.emulator.inject_errors(503, count=3)
+        with pytest.raises(RequestError):
+            self.opentok.get_archive(archive.id)
+        expect(self.emulator.request_counts["archive"]).to(equal(7))
+
+    def test_error_rate(self):
+        self.emulator.error_rate = 1
+
+        with pytest.raises(RequestError):
+            self.opentok.get_archive("ARCHIVEID")
+
+    def test_rate_limit(self):
+        emulator = Emulator(rate_limits={"signal": (1, 1)}).start()
+        self.addCleanup(emulator.stop)
+        url = emulator.url + "/v2/project/123456/session/SESSIONID/signal"
+        headers = {"X-OPENTOK-AUTH": "token"}
+
+        expect(requests.post(url, headers=headers).status_code).to(equal(204))
+        response = requests.post(url, headers=headers)
+        expect(response.status_code).to(equal(429))
+        expect(response.headers["Retry-After"]).to(equal("1"))
+
+    def test_latency(self):
+        self.emulator.latency = 0.05
+
+        start = time.monotonic()
+        self.opentok.list_streams("SESSIONID")
+        expect(time.monotonic() - start).to(be_above_or_equal(0.05))
+
+    def test_requires_auth_header(self):
+        response = requests.get(self.emulator.url + "/v2/project/123456/archive")
+
+        expect(response.status_code).to(equal(403))
+
+    def test_unknown_route(self):
+        response = requests.get(
+            self.emulator.url + "/v2/project/123456/unknown",
+            headers={"X-OPENTOK-AUTH": "token"},
+        )
+
+        expect(response.status_code).to(equal(404))
+
+    def test_async_client(self):
+        pytest.importorskip("aiohttp")
+        from opentok import AsyncClient
+
+        async def main():
+            async with AsyncClient(
+                self.api_key, self.api_secret, api_url=self.emulator.url
+            ) as client:
+                return await asyncio.gather(
+                    *(client.start_archive("SESSION%d" % i) for i in range(10))
+                )
+
+        archives = asyncio.run(main())
+
+        expect(len(set(archive.id for archive in archives))).to(equal(10))
+        expect(self.emulator.archives).to(have_length(10))
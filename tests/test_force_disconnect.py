@@ -1,3 +1,5 @@
+import re
+import time
 import unittest
 from six import u
 from expects import *
@@ -79,3 +81,78 @@ class OpenTokForceDisconnectTest(unittest.TestCase):
             self.session_id,
             self.connection_id,
         )
+
+    @httpretty.activate
+    def test_force_disconnect_many(self):
+        def respond(request, uri, response_headers):
+            connection_id = uri.rsplit("/", 1)[1]
+            if connection_id == "slow":
+                time.sleep(0.2)
+            status = {"gone": 404, "invalid": 400}.get(connection_id, 204)
+            return [status, response_headers, ""]
+
+        httpretty.register_uri(
+            httpretty.DELETE,
+            re.compile(
+                u(
+                    "https://api.opentok.com/v2/project/{0}/session/{1}/connection/.+"
+                ).format(self.api_key, self.session_id)
+            ),
+            body=respond,
+        )
+        connection_ids = ["slow"] + ["connection%d" % i for i in range(20)]
+        connection_ids += ["gone", "invalid"]
+
+        start = time.time()
+        results = self.opentok.force_disconnect_many(
+            self.session_id, connection_ids, concurrency=4, rate=None
+        )
+
+        # the slow connection only holds up one worker
+        expect(time.time() - start).to(be_below(0.4))
+        expect(results).to(have_length(23))
+        expect(results["slow"]).to(be_none)
+        expect(results["connection19"]).to(be_none)
+        expect(results["gone"]).to(be_a(ForceDisconnectError))
+        expect(results["invalid"]).to(be_a(ForceDisconnectError))
+
+    @httpretty.activate
+    def test_force_disconnect_many_rate(self):
+        httpretty.register_uri(
+            httpretty.DELETE,
+            re.compile(
+                u(
+                    "https://api.opentok.com/v2/project/{0}/session/{1}/connection/.+"
+                ).format(self.api_key, self.session_id)
+            ),
+            status=204,
+        )
+
+        start = time.time()
+        results = self.opentok.force_disconnect_many(
+            self.session_id, ["a", "b", "c", "d"], concurrency=4, rate=20
+        )
+
+        expect(set(results.values())).to(equal({None}))
+        expect(time.time() - start).to(be_above_or_equal(0.14))
+
+    @httpretty.activate
+    def test_force_disconnect_many_is_paced_by_default(self):
+        httpretty.register_uri(
+            httpretty.DELETE,
+            re.compile(
+                u(
+                    "https://api.opentok.com/v2/project/{0}/session/{1}/connection/.+"
+                ).format(self.api_key, self.session_id)
+            ),
+            status=204,
+        )
+
+        start = time.time()
+        results = self.opentok.force_disconnect_many(
+            self.session_id, ["a", "b", "c", "d"], concurrency=4
+        )
+
+        expect(set(results.values())).to(equal({None}))
+        # at most DEFAULT_BULK_RATE (20) requests per second
+        expect(time.time() - start).to(be_above_or_equal(0.14))
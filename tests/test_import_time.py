@@ -0,0 +1,49 @@
+import importlib.util
+import os
+import unittest
+
+from expects import *
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_benchmark():
+    spec = importlib.util.spec_from_file_location(
+        "import_time", os.path.join(ROOT, "benchmarks", "import_time.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class ImportTimeTest(unittest.TestCase):
+    def setUp(self):
+        self.benchmark = load_benchmark()
+
+    def test_import_loads_no_heavy_modules(self):
+        # the time budget is checked by make bench, wall-clock times are too noisy here
+        result = self.benchmark.measure(runs=1)
+
+        expect(result.loaded).to(be_empty)
+        expect(result.modules).to(have_key("opentok.opentok"))
+
+    def test_token_generation_stays_light(self):
+        result = self.benchmark.measure(
+            statement=(
+                "import opentok\n"
+                "client = opentok.Client('123456', '1234567890abcdef1234567890abcdef1234567890')\n"
+                "client.generate_token('1_MX4xMjM0NTZ-flNhdCBNYXIgMTUgMTQ6NDI6MjMgUERUIDIwMTR-MC40OTAxMzAyNX4')"
+            ),
+            runs=1,
+        )
+
+        expect(result.loaded).to(be_empty)
+
+    def test_heavy_modules_load_on_first_use(self):
+        result = self.benchmark.measure(
+            statement="import opentok\nopentok.RetryPolicy\nopentok.Client('123456', 'secret').get_headers()",
+            runs=1,
+        )
+
+        expect(result.loaded).to(contain("requests", "jwt", "uuid"))
+        expect(result.loaded).not_to(contain("asyncio", "xml.dom.minidom"))
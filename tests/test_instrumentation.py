@@ -0,0 +1,175 @@
+import asyncio
+import socket
+import unittest
+
+import pytest
+import requests
+from expects import *
+
+from opentok import Client, LatencyHistogram, RequestMetrics
+from opentok.emulator import Emulator
+
+
+class ClientHooksTest(unittest.TestCase):
+    def setUp(self):
+        self.api_key = "123456"
+        self.api_secret = "1234567890abcdef1234567890abcdef1234567890"
+        self.emulator = Emulator().start()
+        self.addCleanup(self.emulator.stop)
+        self.opentok = Client(self.api_key, self.api_secret, api_url=self.emulator.url)
+        self.requests = []
+        self.responses = []
+        self.opentok.add_request_hook(
+            lambda metrics: self.requests.append((metrics, metrics.status_code))
+        )
+        self.opentok.add_response_hook(self.responses.append)
+
+    def test_hooks(self):
+        archive = self.opentok.start_archive("SESSIONID")
+        self.opentok.get_archive(archive.id)
+
+        expect(self.requests).to(have_length(2))
+        metrics, status_code = self.requests[0]
+        expect(status_code).to(be_none)
+        expect(metrics).to(be_a(RequestMetrics))
+        expect(self.responses).to(equal([metrics, self.requests[1][0]]))
+
+        expect(metrics.method).to(equal("POST"))
+        expect(metrics.family).to(equal("archive"))
+        expect(metrics.status_code).to(equal(200))
+        expect(metrics.request_bytes).to(be_above(0))
+        expect(metrics.response_bytes).to(be_above(0))
+        expect(metrics.connect).to(be_above(0))
+        expect(metrics.ttfb).to(be_above(0))
+        expect(metrics.total).to(be_above_or_equal(metrics.ttfb))
+
+        second = self.responses[1]
+        expect(second.method).to(equal("GET"))
+        expect(second.request_bytes).to(equal(0))
+        # the pooled connection is reused
+        expect(second.connect).to(equal(0))
+
+    def test_failed_request(self):
+        self.opentok.transport.close()
+        self.emulator.stop()
+
+        with pytest.raises(requests.ConnectionError):
+            self.opentok.list_streams("SESSIONID")
+
+        metrics = self.responses[0]
+        expect(metrics.family).to(equal("stream"))
+        expect(metrics.status_code).to(be_none)
+        expect(metrics.exception).to(be_a(requests.ConnectionError))
+
+    def test_hook_exceptions_are_ignored(self):
+        def broken(metrics):
+            raise ValueError("broken hook")
+
+        self.opentok.add_response_hook(broken)
+
+        self.opentok.send_signal("SESSIONID", {"type": "t"})
+        expect(self.responses).to(have_length(1))
+
+    def test_remove_hook(self):
+        self.opentok.remove_hook(self.responses.append)
+        self.opentok.send_signal("SESSIONID", {"type": "t"})
+
+        expect(self.requests).to(have_length(1))
+        expect(self.responses).to(be_empty)
+
+    def test_no_metrics_without_hooks(self):
+        client = Client(self.api_key, self.api_secret, api_url=self.emulator.url)
+        calls = []
+        request = client.transport.request
+        client.transport.request = lambda method, url, **kwargs: calls.append(
+            kwargs
+        ) or request(method, url, **kwargs)
+
+        client.send_signal("SESSIONID", {"type": "t"})
+
+        expect(calls[0]).not_to(have_key("metrics"))
+
+    def test_latency_histogram(self):
+        histogram = LatencyHistogram()
+        self.opentok.add_response_hook(histogram)
+
+        for _ in range(3):
+            self.opentok.send_signal("SESSIONID", {"type": "t"})
+
+        expect(histogram.families()).to(equal(["signal"]))
+        expect(histogram.count("signal")).to(equal(3))
+        expect(histogram.percentile("signal", 0.99)).to(be_above(0))
+
+    def test_async_client(self):
+        pytest.importorskip("aiohttp")
+        from opentok import AsyncClient
+
+        async def main():
+            async with AsyncClient(
+                self.api_key, self.api_secret, api_url=self.emulator.url
+            ) as client:
+                client.add_response_hook(self.responses.append)
+                await client.list_streams("SESSIONID")
+                await client.list_streams("SESSIONID")
+
+        asyncio.run(main())
+
+        first, second = self.responses
+        expect(first.family).to(equal("stream"))
+        expect(first.status_code).to(equal(200))
+        expect(first.connect).to(be_above(0))
+        expect(second.connect).to(equal(0))
+        expect(second.total).to(be_above_or_equal(second.ttfb))
+
+
+class LatencyHistogramTest(unittest.TestCase):
+    def setUp(self):
+        self.histogram = LatencyHistogram(buckets=(0.1, 0.2, 0.5))
+        for duration in [0.05] * 50 + [0.15] * 40 + [0.3] * 9 + [2.0]:
+            self.histogram.observe("archive", duration, 200)
+        self.histogram.observe("signal", 0.01, "error")
+
+    def test_percentiles(self):
+        expect(self.histogram.percentile("archive", 0.5)).to(equal(0.1))
+        expect(self.histogram.percentile("archive", 0.9)).to(equal(0.2))
+        expect(self.histogram.percentile("archive", 0.95)).to(be_within(0.2, 0.5))
+        expect(self.histogram.percentile("archive", 1)).to(equal(2.0))
+        expect(self.histogram.percentile("render", 0.5)).to(be_none)
+
+        summary = self.histogram.summary()
+        expect(summary["archive"]["count"]).to(equal(100))
+        expect(summary["signal"]["p99"]).to(be_within(0, 0.0101))
+
+    def test_prometheus(self):
+        text = self.histogram.prometheus()
+
+        expect(text).to(contain("# TYPE opentok_request_duration_seconds histogram"))
+        expect(text).to(
+            contain('opentok_request_duration_seconds_bucket{family="archive",le="0.2"} 90')
+        )
+        expect(text).to(
+            contain('opentok_request_duration_seconds_bucket{family="archive",le="+Inf"} 100')
+        )
+        expect(text).to(contain('opentok_request_duration_seconds_count{family="archive"} 100'))
+        expect(text).to(contain('opentok_requests_total{family="signal",status="error"} 1'))
+
+    def test_statsd(self):
+        lines = self.histogram.statsd_lines(prefix="app.opentok")
+
+        expect(lines).to(contain("app.opentok.archive.count:100|g"))
+        expect(lines).to(contain("app.opentok.archive.p50:100.000|g"))
+
+        receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.addCleanup(receiver.close)
+        receiver.bind(("127.0.0.1", 0))
+        receiver.settimeout(5)
+
+        sent = self.histogram.send_statsd(port=receiver.getsockname()[1])
+
+        expect(sent).to(equal(8))
+        expect(receiver.recv(1024)).to(equal(b"opentok.archive.count:100|g"))
+
+    def test_reset(self):
+        self.histogram.reset()
+
+        expect(self.histogram.families()).to(be_empty)
@@ -1,3 +1,4 @@
+import re
 import unittest
 
 import requests
@@ -6,6 +7,7 @@ import random
 import string
 
 from opentok import Client
+from opentok.exceptions import NotFoundError, OpenTokException, RequestError
 
 
 class OpenTokTest(unittest.TestCase):  
@@ -157,3 +159,48 @@ class OpenTokTest(unittest.TestCase):
         response.headers["x-opentok-auth"].should.equal(self.jwt_token_string)
         response.headers["Content-Type"].should.equal("application/json")
 
+
+    @httpretty.activate
+    def test_mute_streams(self):
+        def respond(request, uri, response_headers):
+            stream_id = uri.split("/stream/")[1].split("/")[0]
+            return [404 if stream_id == "gone" else 200, response_headers, "{}"]
+
+        httpretty.register_uri(
+            httpretty.POST,
+            re.compile(
+                "https://api.opentok.com/v2/project/{0}/session/{1}/stream/.+/mute".format(
+                    self.api_key, self.session_id
+                )
+            ),
+            body=respond,
+        )
+
+        results = self.opentok.mute_streams(
+            self.session_id, ["Stream1", "Stream2", "gone"], concurrency=2
+        )
+
+        assert results["Stream1"] is None
+        assert results["Stream2"] is None
+        assert isinstance(results["gone"], NotFoundError)
+
+    @httpretty.activate
+    def test_mute_stream_server_error(self):
+        httpretty.register_uri(
+            httpretty.POST,
+            "https://api.opentok.com/v2/project/{0}/session/{1}/stream/{2}/mute".format(
+                self.api_key, self.session_id, self.stream_id_1
+            ),
+            status=500,
+        )
+
+        # mute_stream returns None for the statuses it does not handle
+        assert self.opentok.mute_stream(self.session_id, self.stream_id_1) is None
+
+        results = self.opentok.mute_streams(self.session_id, [self.stream_id_1])
+        assert isinstance(results[self.stream_id_1], RequestError)
+
+    def test_mute_streams_requires_stream_ids(self):
+        results = self.opentok.mute_streams(self.session_id, [""])
+
+        assert isinstance(results[""], OpenTokException)
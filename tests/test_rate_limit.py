@@ -0,0 +1,154 @@
+import asyncio
+import threading
+import time
+import unittest
+
+import httpretty
+import pytest
+from expects import *
+
+from opentok import Client, RateLimiter, RateLimitError
+from opentok.endpoints import Endpoints
+from opentok.rate_limit import TokenBucket
+
+
+class EndpointFamilyTest(unittest.TestCase):
+    def setUp(self):
+        self.endpoints = Endpoints("https://api.opentok.com", "123456")
+
+    def test_families(self):
+        e = self.endpoints
+        family = e.get_endpoint_family
+
+        expect(family(e.get_session_url(), "POST")).to(equal("session"))
+        expect(family(e.get_archive_url("ID") + "/stop", "POST")).to(equal("archive"))
+        expect(family(e.get_archive_url() + "?offset=0", "GET")).to(equal("archive"))
+        expect(family(e.get_broadcast_url("ID", stop=True), "POST")).to(
+            equal("broadcast")
+        )
+        expect(family(e.get_render_url("ID"), "DELETE")).to(equal("render"))
+        expect(family(e.get_signaling_url("S", "C"), "POST")).to(equal("signal"))
+        expect(family(e.get_signaling_url("S"), "POST")).to(equal("signal"))
+        expect(family(e.force_disconnect_url("S", "C"), "DELETE")).to(
+            equal("moderation")
+        )
+        expect(family(e.get_mute_all_url("S"), "POST")).to(equal("moderation"))
+        expect(family(e.get_stream_url("S", "ST") + "/mute", "POST")).to(
+            equal("moderation")
+        )
+        expect(family(e.get_stream_url("S"), "GET")).to(equal("stream"))
+        expect(family(e.set_stream_class_lists_url("S"), "PUT")).to(equal("stream"))
+        expect(family(e.dial_url(), "POST")).to(equal("sip"))
+        expect(family(e.get_dtmf_specific_url("S", "C"), "POST")).to(equal("sip"))
+        expect(family(e.get_audio_connector_url(), "POST")).to(equal("connect"))
+        expect(family(e.get_captions_url("ID"), "POST")).to(equal("captions"))
+        expect(family("https://example.com/unknown", "GET")).to(equal("other"))
+
+
+class RateLimiterTest(unittest.TestCase):
+    def test_bucket_burst_then_rate(self):
+        bucket = TokenBucket(rate=10, burst=3)
+
+        waits = [bucket.reserve() for _ in range(5)]
+
+        expect(waits[:3]).to(equal([0, 0, 0]))
+        expect(waits[3]).to(be_within(0.09, 0.1))
+        expect(waits[4]).to(be_within(0.19, 0.2))
+
+    def test_bucket_max_wait(self):
+        bucket = TokenBucket(rate=1, burst=1)
+
+        expect(bucket.reserve(max_wait=0)).to(equal(0))
+        expect(bucket.reserve(max_wait=0)).to(be_none)
+        expect(bucket.reserve(max_wait=0.5)).to(be_none)
+        expect(bucket.reserve(max_wait=2)).to(be_within(0.9, 1))
+
+    def test_unlimited_families(self):
+        limiter = RateLimiter({"signal": 1})
+
+        for _ in range(100):
+            expect(limiter.reserve("archive")).to(equal(0))
+
+    def test_default_rate(self):
+        limiter = RateLimiter(default_rate=(1, 2), block=False)
+
+        limiter.reserve("archive")
+        limiter.reserve("archive")
+        with pytest.raises(RateLimitError):
+            limiter.reserve("archive")
+        expect(limiter.reserve("render")).to(equal(0))
+
+    def test_blocking_acquire(self):
+        limiter = RateLimiter({"signal": (20, 1)})
+
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.acquire("signal")
+
+        expect(time.monotonic() - start).to(be_above_or_equal(0.09))
+
+    def test_shared_between_threads(self):
+        limiter = RateLimiter({"signal": (0.001, 50)}, block=False)
+        results = []
+
+        def worker():
+            for _ in range(20):
+                try:
+                    limiter.reserve("signal")
+                    results.append(True)
+                except RateLimitError:
+                    results.append(False)
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        expect(results.count(True)).to(equal(50))
+
+    def test_acquire_async(self):
+        limiter = RateLimiter({"signal": (20, 1)})
+
+        async def main():
+            start = time.monotonic()
+            await asyncio.gather(*(limiter.acquire_async("signal") for _ in range(3)))
+            return time.monotonic() - start
+
+        expect(asyncio.run(main())).to(be_above_or_equal(0.09))
+
+
+class ClientRateLimitTest(unittest.TestCase):
+    def setUp(self):
+        self.api_key = "123456"
+        self.api_secret = "1234567890abcdef1234567890abcdef1234567890"
+        self.session_id = "SESSIONID"
+        self.opentok = Client(
+            self.api_key,
+            self.api_secret,
+            rate_limiter=RateLimiter({"signal": (1, 2)}, block=False),
+        )
+
+    @httpretty.activate
+    def test_fail_fast(self):
+        calls = []
+
+        def respond(request, uri, response_headers):
+            calls.append(uri)
+            return [204, response_headers, ""]
+
+        httpretty.register_uri(
+            httpretty.POST,
+            "https://api.opentok.com/v2/project/{0}/session/{1}/signal".format(
+                self.api_key, self.session_id
+            ),
+            body=respond,
+        )
+        payload = {"type": "type", "data": "data"}
+
+        self.opentok.send_signal(self.session_id, payload)
+        self.opentok.send_signal(self.session_id, payload)
+        with pytest.raises(RateLimitError):
+            self.opentok.send_signal(self.session_id, payload)
+
+        expect(calls).to(have_length(2))
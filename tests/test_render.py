@@ -214,3 +214,34 @@ class OpenTokRenderTest(unittest.TestCase):
         expect(render_list.items[1]).to(have_property(u("status"), u("stopped")))
         expect(render_list.items[1]).to(have_property(u("streamId"), u("d2334b35690a92f78945")))
         expect(render_list.items[1]).to(have_property(u("reason"), u("Maximum duration exceeded")))
+
+    @httpretty.activate
+    def test_list_all_renders(self):
+        renders = [
+            {"id": "render-{0}".format(i), "sessionId": self.session_id, "status": "started"}
+            for i in range(25)
+        ]
+        requested = []
+
+        def respond(request, uri, response_headers):
+            offset = int(request.querystring["offset"][0])
+            count = int(request.querystring["count"][0])
+            requested.append(offset)
+            body = {"count": len(renders), "items": renders[offset : offset + count]}
+            return [200, response_headers, json.dumps(body)]
+
+        httpretty.register_uri(
+            httpretty.GET,
+            u("https://api.opentok.com/v2/project/{0}/render").format(self.api_key),
+            body=respond,
+            content_type=u("application/json"),
+        )
+
+        render_list = self.opentok.list_all_renders(page_size=10, concurrency=2)
+
+        expect(render_list).to(be_a(RenderList))
+        expect(render_list).to(have_property(u("count"), 25))
+        expect([render.id for render in render_list.items]).to(
+            equal([render["id"] for render in renders])
+        )
+        expect(sorted(set(requested))).to(equal([0, 10, 20]))
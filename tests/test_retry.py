@@ -0,0 +1,216 @@
+import json
+import time
+import unittest
+from email.utils import formatdate
+
+import httpretty
+import pytest
+import requests
+from expects import *
+
+from opentok import Client, Archive, RetryPolicy
+from opentok.exceptions import RequestError
+from opentok.transport import Request
+
+
+ARCHIVE = {
+    "createdAt": 1395183243556,
+    "duration": 0,
+    "id": "ARCHIVEID",
+    "name": "",
+    "partnerId": 123456,
+    "reason": "",
+    "sessionId": "SESSIONID",
+    "size": 0,
+    "status": "stopped",
+    "hasAudio": True,
+    "hasVideo": True,
+    "outputMode": "composed",
+    "url": None,
+}
+
+
+class FakeResponse(object):
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = requests.structures.CaseInsensitiveDict(headers or {})
+
+
+class RetryPolicyTest(unittest.TestCase):
+    def setUp(self):
+        self.get = Request("GET", "https://api.opentok.com/v2/project/123456/archive")
+        self.post = Request("POST", "https://api.opentok.com/v2/project/123456/archive")
+
+    def test_idempotent_requests(self):
+        expect(self.get.idempotent).to(be_true)
+        expect(Request("DELETE", "url").idempotent).to(be_true)
+        expect(self.post.idempotent).to(be_false)
+        expect(Request("POST", "url", idempotent=True).idempotent).to(be_true)
+
+    def test_backoff(self):
+        policy = RetryPolicy(backoff_base=1, backoff_cap=5, jitter=False)
+
+        expect([policy.backoff(attempt) for attempt in range(1, 6)]).to(
+            equal([1, 2, 4, 5, 5])
+        )
+
+        policy = RetryPolicy(backoff_base=1, backoff_cap=5)
+        for attempt in range(1, 6):
+            expect(policy.backoff(attempt)).to(be_within(0, 5))
+
+    def test_next_delay(self):
+        policy = RetryPolicy(max_attempts=3, backoff_base=1, jitter=False)
+
+        expect(policy.next_delay(self.get, 1, FakeResponse(503))).to(equal(1))
+        expect(policy.next_delay(self.get, 2, FakeResponse(429))).to(equal(2))
+        expect(policy.next_delay(self.get, 3, FakeResponse(503))).to(be_none)
+        expect(policy.next_delay(self.get, 1, FakeResponse(404))).to(be_none)
+        expect(policy.next_delay(self.post, 1, FakeResponse(503))).to(be_none)
+        expect(
+            policy.next_delay(self.get, 1, exception=requests.ConnectionError())
+        ).to(equal(1))
+        expect(policy.next_delay(self.get, 1, exception=ValueError())).to(be_none)
+
+        policy = RetryPolicy(retry_non_idempotent=True, jitter=False)
+        expect(policy.next_delay(self.post, 1, FakeResponse(503))).to(equal(0.5))
+
+    def test_retry_after(self):
+        policy = RetryPolicy(max_retry_after=10)
+
+        expect(policy.next_delay(self.get, 1, FakeResponse(429, {"Retry-After": "3"}))).to(
+            equal(3)
+        )
+        expect(
+            policy.next_delay(self.get, 1, FakeResponse(429, {"Retry-After": "60"}))
+        ).to(be_none)
+
+        date = formatdate(time.time() + 5, usegmt=True)
+        delay = policy.next_delay(self.get, 1, FakeResponse(503, {"Retry-After": date}))
+        expect(delay).to(be_within(3, 5.01))
+
+        policy = RetryPolicy(respect_retry_after=False, jitter=False)
+        expect(
+            policy.next_delay(self.get, 1, FakeResponse(429, {"Retry-After": "60"}))
+        ).to(equal(0.5))
+
+    def test_invalid_max_attempts(self):
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+
+class ClientRetryTest(unittest.TestCase):
+    def setUp(self):
+        self.api_key = "123456"
+        self.api_secret = "1234567890abcdef1234567890abcdef1234567890"
+        self.policy = RetryPolicy(max_attempts=3, backoff_base=0, jitter=False)
+        self.opentok = Client(self.api_key, self.api_secret, retry_policy=self.policy)
+        self.calls = 0
+
+    def register(self, method, path, statuses, body=ARCHIVE):
+        def respond(request, uri, response_headers):
+            status = statuses[min(self.calls, len(statuses) - 1)]
+            self.calls += 1
+            return [status, response_headers, json.dumps(body) if status < 300 else ""]
+
+        httpretty.register_uri(
+            method,
+            "https://api.opentok.com/v2/project/{0}/archive{1}".format(self.api_key, path),
+            body=respond,
+            content_type="application/json",
+        )
+
+    @httpretty.activate
+    def test_retries_get(self):
+        self.register(httpretty.GET, "/ARCHIVEID", [503, 502, 200])
+
+        archive = self.opentok.get_archive("ARCHIVEID")
+
+        expect(archive).to(be_an(Archive))
+        expect(self.calls).to(equal(3))
+
+    @httpretty.activate
+    def test_retries_sign_the_auth_header_again(self):
+        tokens = []
+
+        def respond(request, uri, response_headers):
+            tokens.append(request.headers["X-OPENTOK-AUTH"])
+            if len(tokens) == 1:
+                # the cached JWT reaches its refresh time before the retry is sent
+                token, _ = self.opentok._jwt_auth_header
+                self.opentok._jwt_auth_header = (token, 0)
+                return [503, response_headers, ""]
+            return [200, response_headers, json.dumps(ARCHIVE)]
+
+        httpretty.register_uri(
+            httpretty.GET,
+            "https://api.opentok.com/v2/project/{0}/archive/ARCHIVEID".format(
+                self.api_key
+            ),
+            body=respond,
+            content_type="application/json",
+        )
+
+        self.opentok.get_archive("ARCHIVEID")
+
+        expect(tokens).to(have_length(2))
+        expect(tokens[1]).not_to(equal(tokens[0]))
+        expect(tokens[1]).to(equal(self.opentok._jwt_auth_header[0]))
+
+    @httpretty.activate
+    def test_gives_up_after_max_attempts(self):
+        self.register(httpretty.GET, "/ARCHIVEID", [503])
+
+        with pytest.raises(RequestError):
+            self.opentok.get_archive("ARCHIVEID")
+        expect(self.calls).to(equal(3))
+
+    @httpretty.activate
+    def test_retries_stop_archive(self):
+        self.register(httpretty.POST, "/ARCHIVEID/stop", [429, 200])
+
+        archive = self.opentok.stop_archive("ARCHIVEID")
+
+        expect(archive.status).to(equal("stopped"))
+        expect(self.calls).to(equal(2))
+
+    @httpretty.activate
+    def test_does_not_retry_non_idempotent_calls_by_default(self):
+        self.register(httpretty.POST, "", [503, 200])
+
+        with pytest.raises(RequestError):
+            self.opentok.start_archive("SESSIONID")
+        expect(self.calls).to(equal(1))
+
+    @httpretty.activate
+    def test_retries_non_idempotent_calls_on_opt_in(self):
+        self.register(httpretty.POST, "", [503, 200])
+        self.opentok.retry_policy = RetryPolicy(
+            backoff_base=0, retry_non_idempotent=True
+        )
+
+        archive = self.opentok.start_archive("SESSIONID")
+
+        expect(archive).to(be_an(Archive))
+        expect(self.calls).to(equal(2))
+
+    @httpretty.activate
+    def test_no_retry_without_policy(self):
+        self.register(httpretty.GET, "/ARCHIVEID", [503, 200])
+        self.opentok.retry_policy = None
+
+        with pytest.raises(RequestError):
+            self.opentok.get_archive("ARCHIVEID")
+        expect(self.calls).to(equal(1))
+
+    def test_retries_connection_errors(self):
+        attempts = []
+
+        def request(method, url, **kwargs):
+            attempts.append(url)
+            raise requests.ConnectionError("connection refused")
+
+        self.opentok.transport.request = request
+
+        with pytest.raises(requests.ConnectionError):
+            self.opentok.get_archive("ARCHIVEID")
+        expect(attempts).to(have_length(3))
@@ -1,7 +1,12 @@
+import json
 import unittest
+
+import pytest
+from expects import *
 from six import text_type, u
 
-from opentok import Client, Session, Roles, MediaModes
+from opentok import AuthError, Client, Session, Roles, MediaModes
+from opentok.session import session_id_from_json, session_id_from_xml
 from .helpers import token_decoder
 
 
@@ -30,3 +35,63 @@ class SessionTest(unittest.TestCase):
         assert isinstance(token, text_type)
         assert token_decoder(token, self.api_secret)[u("session_id")] == self.session_id
         assert token_decoder(token, self.api_secret)[u("role")] == u("moderator")
+
+
+class SessionIdParsingTest(unittest.TestCase):
+    def setUp(self):
+        self.session_id = u(
+            "1_MX4xMjM0NTZ-flNhdCBNYXIgMTUgMTQ6NDI6MjMgUERUIDIwMTR-MC40OTAxMzAyNX4"
+        )
+
+    def test_json(self):
+        text = json.dumps(
+            [
+                {
+                    "session_id": self.session_id,
+                    "project_id": "123456",
+                    "ice_servers": [{"urls": ["turn:example.com"]}] * 100,
+                }
+            ]
+        )
+
+        expect(session_id_from_json(text)).to(equal(self.session_id))
+
+    def test_json_fallbacks(self):
+        # the session_id key of a nested object, after it and escaped values
+        text = ' [ {"properties": {"session_id": "nested"}, "session_id" : "top"} ]'
+        expect(session_id_from_json(text)).to(equal(u("top")))
+        expect(session_id_from_json('[{"session_id": "a\\u0062c"}]')).to(equal(u("abc")))
+        expect(session_id_from_json('[{"type": "session_id", "session_id": "id"}]')).to(
+            equal(u("id"))
+        )
+
+        with pytest.raises(Exception):
+            session_id_from_json('{"session_id": "not a list"}')
+        with pytest.raises(Exception):
+            session_id_from_json("[]")
+
+    def test_xml(self):
+        text = (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?><sessions><Session>'
+            "<session_id>{0}</session_id><partner_id>123456</partner_id>"
+            "</Session></sessions>"
+        ).format(self.session_id)
+
+        expect(session_id_from_xml(text)).to(equal(self.session_id))
+        expect(
+            session_id_from_xml(
+                "<sessions><Session><session_id>a&amp;b</session_id></Session></sessions>"
+            )
+        ).to(equal(u("a&b")))
+
+    def test_xml_error(self):
+        text = (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Errors><error code="-1"><notFound message="Invalid partner"/></error></Errors>'
+        )
+
+        with pytest.raises(AuthError) as e:
+            session_id_from_xml(text)
+        expect(str(e.value)).to(
+            equal("Failed to create session (code=-1): Invalid partner")
+        )
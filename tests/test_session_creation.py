@@ -1,3 +1,4 @@
+import asyncio
 from time import time
 from jwt import decode
 import pytest
@@ -17,6 +18,7 @@ from opentok import (
     OpenTokException,
     __version__,
 )
+from opentok.emulator import Emulator
 
 
 class OpenTokSessionCreationTest(unittest.TestCase):
@@ -395,3 +397,59 @@ class OpenTokSessionCreationTest(unittest.TestCase):
 
     # TODO: all the cases that throw exceptions
     # TODO: custom api_url requests
+
+
+class CreateSessionsTest(unittest.TestCase):
+    def setUp(self):
+        self.api_key = u("123456")
+        self.api_secret = u("1234567890abcdef1234567890abcdef1234567890")
+        self.emulator = Emulator().start()
+        self.addCleanup(self.emulator.stop)
+        self.opentok = Client(self.api_key, self.api_secret, api_url=self.emulator.url)
+
+    def test_create_sessions(self):
+        self.emulator.inject_errors(403, count=2, family="session")
+
+        results = self.opentok.create_sessions(
+            12, media_mode=MediaModes.routed, location=u("12.34.56.78"), concurrency=4
+        )
+
+        expect(results).to(have_length(12))
+        sessions = [result for result in results if isinstance(result, Session)]
+        failures = [result for result in results if isinstance(result, Exception)]
+        expect(sessions).to(have_length(10))
+        expect(failures).to(have_length(2))
+        expect(failures[0]).to(be_a(OpenTokException))
+        expect(set(session.session_id for session in sessions)).to(have_length(10))
+        expect(sessions[0].media_mode).to(equal(MediaModes.routed))
+        expect(sessions[0].location).to(equal(u("12.34.56.78")))
+
+    def test_create_sessions_rate(self):
+        start = time()
+        results = self.opentok.create_sessions(4, concurrency=4, rate=20)
+
+        expect(time() - start).to(be_above_or_equal(0.14))
+        expect(all(isinstance(result, Session) for result in results)).to(be_true)
+
+    def test_create_sessions_validates_options_once(self):
+        with pytest.raises(OpenTokException):
+            self.opentok.create_sessions(3, location=u("not an ip"))
+        with pytest.raises(OpenTokException):
+            self.opentok.create_sessions(3, archive_mode=ArchiveModes.always)
+
+        expect(self.emulator.request_counts["session"]).to(equal(0))
+
+    def test_create_sessions_async(self):
+        pytest.importorskip("aiohttp")
+        from opentok import AsyncClient
+
+        async def main():
+            async with AsyncClient(
+                self.api_key, self.api_secret, api_url=self.emulator.url
+            ) as client:
+                return await client.create_sessions(5, e2ee=True, concurrency=5)
+
+        results = asyncio.run(main())
+
+        expect(results).to(have_length(5))
+        expect(all(result.e2ee for result in results)).to(be_true)
@@ -0,0 +1,132 @@
+import json
+import unittest
+
+import pytest
+from expects import *
+
+from opentok import ArchiveModes, Client, MediaModes, Session, SessionPool
+from opentok.emulator import Emulator
+from opentok.exceptions import OpenTokException
+
+from .test_token_pool import wait_until
+
+
+class SessionPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.api_key = "123456"
+        self.api_secret = "1234567890abcdef1234567890abcdef1234567890"
+        self.emulator = Emulator().start()
+        self.addCleanup(self.emulator.stop)
+        self.opentok = Client(self.api_key, self.api_secret, api_url=self.emulator.url)
+        self.pool = SessionPool(
+            self.opentok, low_watermark=2, high_watermark=4, refill_interval=0.05
+        )
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_first_get_is_a_miss_then_refills(self):
+        session = self.pool.get()
+
+        expect(session).to(be_a(Session))
+        expect(self.pool.misses).to(equal(1))
+        wait_until(lambda: self.pool.available() == 4)
+
+        pooled = self.pool.get()
+        expect(pooled.session_id).not_to(equal(session.session_id))
+        expect(pooled.media_mode).to(equal(MediaModes.relayed))
+        expect(self.pool.stats()).to(have_keys(hits=1, misses=1, created=4, available=3))
+
+    def test_watermarks(self):
+        self.pool.prime()
+        wait_until(lambda: self.pool.available() == 4)
+
+        # above the low watermark, the pool is not refilled
+        self.pool.get()
+        self.pool.get()
+        expect(self.pool.available()).to(equal(2))
+        expect(self.pool.created).to(equal(4))
+
+        self.pool.get()
+        wait_until(lambda: self.pool.available() == 4)
+        expect(self.pool.created).to(equal(7))
+        expect(self.emulator.request_counts["session"]).to(equal(7))
+
+    def test_sessions_are_kept_per_configuration(self):
+        self.pool.prime(media_mode=MediaModes.routed, archive_mode=ArchiveModes.always)
+        wait_until(
+            lambda: self.pool.available(media_mode="routed", archive_mode="always") == 4
+        )
+
+        expect(self.pool.available(media_mode=MediaModes.relayed)).to(equal(0))
+        session = self.pool.get(
+            media_mode=MediaModes.routed, archive_mode=ArchiveModes.always
+        )
+        expect(session.archive_mode).to(equal(ArchiveModes.always))
+        expect(self.pool.hits).to(equal(1))
+
+        with pytest.raises(TypeError):
+            self.pool.available(mediamode="routed")
+
+    def test_failures_are_retried(self):
+        self.pool.close()
+        self.emulator.inject_errors(500, count=3, family="session")
+        self.pool = SessionPool(
+            self.opentok, low_watermark=1, high_watermark=2, refill_interval=0.05
+        )
+
+        self.pool.prime()
+
+        wait_until(lambda: self.pool.available() == 2)
+        expect(self.pool.failures).to(be_above_or_equal(1))
+
+    def test_persistence(self):
+        saved = []
+        self.pool.close()
+        self.pool = SessionPool(
+            self.opentok,
+            low_watermark=2,
+            high_watermark=3,
+            refill_interval=0.05,
+            save=lambda entries: saved.append(json.loads(json.dumps(entries))),
+        )
+        self.pool.prime(location="12.34.56.78", e2ee=True)
+        wait_until(lambda: saved and len(saved[-1]) == 3)
+        session = self.pool.get(location="12.34.56.78", e2ee=True)
+        self.pool.close()
+
+        expect(saved[-1]).to(have_length(2))
+        expect(saved[-1][0]).to(
+            have_keys(location="12.34.56.78", media_mode="relayed", e2ee=True)
+        )
+        expect([entry["session_id"] for entry in saved[-1]]).not_to(
+            contain(session.session_id)
+        )
+
+        self.pool = SessionPool(
+            self.opentok,
+            low_watermark=1,
+            high_watermark=2,
+            refill_interval=0.05,
+            load=lambda: saved[-1],
+        )
+        expect(self.pool.restored).to(equal(2))
+        restored = self.pool.get(location="12.34.56.78", e2ee=True)
+        expect(restored.session_id).to(equal(saved[-1][0]["session_id"]))
+        expect(restored.e2ee).to(be_true)
+        expect(self.pool.hits).to(equal(1))
+
+    def test_invalid_configuration_is_not_tracked(self):
+        # the always archive mode requires the routed media mode
+        with pytest.raises(OpenTokException):
+            self.pool.get(archive_mode=ArchiveModes.always)
+        with pytest.raises(OpenTokException):
+            self.pool.prime(archive_mode=ArchiveModes.always)
+
+        expect(self.pool._pools).to(be_empty)
+        expect(self.pool.misses).to(equal(0))
+        expect(self.emulator.request_counts["session"]).to(equal(0))
+
+    def test_invalid_watermarks(self):
+        with pytest.raises(ValueError):
+            SessionPool(self.opentok, low_watermark=5, high_watermark=4)
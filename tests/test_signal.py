@@ -1,6 +1,13 @@
+import re
+import threading
+import time
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
 from six import text_type, u, b, PY2, PY3
 from opentok import Client, Session, __version__
+from opentok.exceptions import AuthError, RequestError, SignalingError
 import httpretty
 import json
 import textwrap
@@ -97,3 +104,108 @@ class OpenTokSignalTest(unittest.TestCase):
             body = json.loads(httpretty.last_request().body.decode("utf-8"))
         expect(body).to(have_key(u("type"), u("type test")))
         expect(body).to(have_key(u("data"), u("test data")))
+
+    def register_connection_signals(self, statuses, delay=0):
+        # a local server rather than httpretty, which mixes up concurrent requests
+        self.signals = []
+        lock = threading.Lock()
+        in_flight = [0, 0]  # current, maximum
+        signals = self.signals
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                connection_id = None
+                if "/connection/" in self.path:
+                    connection_id = self.path.split("/connection/")[1].split("/")[0]
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                with lock:
+                    signals.append((connection_id, json.loads(body)))
+                    in_flight[0] += 1
+                    in_flight[1] = max(in_flight)
+                time.sleep(delay)
+                with lock:
+                    in_flight[0] -= 1
+                self.send_response(statuses.get(connection_id, 204))
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.opentok = Client(
+            self.api_key,
+            self.api_secret,
+            api_url="http://127.0.0.1:{0}".format(server.server_address[1]),
+        )
+        return in_flight
+
+    def test_signal_error_mapping(self):
+        self.register_connection_signals({"invalid": 400, "gone": 404, "big": 413, "auth": 403})
+        payload = {u("type"): u("type test"), u("data"): u("test data")}
+
+        for connection_id in ("invalid", "gone", "big"):
+            with pytest.raises(SignalingError):
+                self.opentok.send_signal(self.session_id, payload, connection_id)
+        with pytest.raises(AuthError):
+            self.opentok.send_signal(self.session_id, payload, "auth")
+
+    def test_send_signals(self):
+        self.register_connection_signals({"gone": 404, "broken": 500})
+        signals = [
+            ("connection%d" % i, {u("type"): u("grade"), u("data"): str(i)})
+            for i in range(20)
+        ]
+        signals += [("gone", {u("type"): u("a")}), ("broken", {u("type"): u("b")})]
+
+        results = self.opentok.send_signals(self.session_id, signals, concurrency=5)
+
+        expect(results).to(have_length(22))
+        expect(results[3]).to(be_none)
+        expect(results[20]).to(be_a(SignalingError))
+        expect(results[21]).to(be_a(RequestError))
+        expect(dict(self.signals)["connection7"]).to(
+            equal({u("type"): u("grade"), u("data"): u("7")})
+        )
+
+    def test_send_signals_bounded_concurrency(self):
+        in_flight = self.register_connection_signals({}, delay=0.02)
+        signals = [("connection%d" % i, {u("type"): u("t")}) for i in range(12)]
+
+        results = self.opentok.send_signals(self.session_id, signals, concurrency=3)
+
+        expect(set(results)).to(equal({None}))
+        expect(in_flight[1]).to(be_within(1, 3.01))
+
+    def test_send_signals_to_the_same_target(self):
+        self.register_connection_signals({"broken": 500})
+        signals = [
+            ("broken", {u("type"): u("first")}),
+            ("connection1", {u("type"): u("a")}),
+            ("connection1", {u("type"): u("b")}),
+            ("broken", {u("type"): u("second")}),
+            (None, {u("type"): u("c")}),
+            (None, {u("type"): u("d")}),
+        ]
+
+        results = self.opentok.send_signals(self.session_id, signals, concurrency=3)
+
+        # every signal has its own outcome, even when a connection is signalled twice
+        expect(results).to(have_length(6))
+        expect(results[0]).to(be_a(RequestError))
+        expect(results[1:3]).to(equal([None, None]))
+        expect(results[3]).to(be_a(RequestError))
+        expect(results[4:]).to(equal([None, None]))
+        expect(self.signals).to(have_length(6))
+
+    def test_send_signals_serializes_payloads_first(self):
+        signals = [("connection1", {u("type"): u("t")}), ("connection2", {u("data"): object()})]
+
+        with pytest.raises(TypeError):
+            self.opentok.send_signals(self.session_id, signals)
@@ -5,7 +5,7 @@ import time
 import datetime
 import calendar
 
-from opentok import Client, Roles, OpenTokException
+from opentok import Client, Roles, Session, OpenTokException
 
 from .helpers import token_decoder, token_signature_validator
 
@@ -117,3 +117,98 @@ class OpenTokTokenGenerationTest(unittest.TestCase):
                 "1_MX42NTQzMjF-flNhdCBNYXIgMTUgMTQ6NDI6MjMgUERUIDIwMTR-MC40OTAxMzAyNX4"
             )
             self.opentok.generate_token(session_id)
+
+    def test_generate_tokens(self):
+        expire_time = int(time.time()) + 100
+        tokens = self.opentok.generate_tokens(
+            self.session_id,
+            [
+                {"role": Roles.moderator, "data": u("name=Johnny")},
+                (Roles.subscriber, None, expire_time, [u("focus")]),
+                (),
+            ],
+        )
+
+        assert len(tokens) == 3
+        claims = [token_decoder(token, self.api_secret) for token in tokens]
+        assert all(c[u("session_id")] == self.session_id for c in claims)
+        assert claims[0][u("role")] == Roles.moderator.value
+        assert claims[0][u("connection_data")] == u("name=Johnny")
+        assert claims[1][u("role")] == Roles.subscriber.value
+        assert claims[1][u("exp")] == expire_time
+        assert claims[1][u("initial_layout_class_list")] == u("focus")
+        assert claims[2][u("role")] == Roles.publisher.value
+        assert u("connection_data") not in claims[2]
+
+    def test_generate_tokens_t1(self):
+        tokens = self.opentok.generate_tokens(
+            self.session_id, [(Roles.moderator,)] * 2, use_jwt=False
+        )
+
+        assert len(tokens) == 2
+        for token in tokens:
+            assert token_decoder(token)[u("role")] == Roles.moderator.value
+            assert token_signature_validator(token, self.api_secret)
+
+    def test_generate_tokens_vonage_wrapper(self):
+        vonage_wrapper = Client(
+            self.api_key, './tests/fake_data/dummy_private_key.txt'
+        )
+        with open('./tests/fake_data/dummy_public_key.txt', 'r') as file:
+            public_key = file.read()
+
+        tokens = vonage_wrapper.generate_tokens(self.session_id, [{}, {}])
+
+        jtis = set()
+        for token in tokens:
+            claims = token_decoder(token, public_key)
+            assert claims[u("session_id")] == self.session_id
+            jtis.add(claims[u("jti")])
+        assert len(jtis) == 2
+
+    def test_does_not_generate_t1_tokens_with_vonage_credentials(self):
+        vonage_wrapper = Client(
+            self.api_key, './tests/fake_data/dummy_private_key.txt'
+        )
+
+        with pytest.raises(OpenTokException):
+            vonage_wrapper.generate_token(self.session_id, use_jwt=False)
+        with pytest.raises(OpenTokException):
+            vonage_wrapper.generate_tokens(self.session_id, [{}], use_jwt=False)
+
+    def test_session_generate_tokens(self):
+        session = Session(self.opentok, self.session_id)
+        tokens = session.generate_tokens([(Roles.subscriber,)])
+
+        assert token_decoder(tokens[0], self.api_secret)[u("role")] == u("subscriber")
+
+    def test_does_not_generate_tokens_with_invalid_spec(self):
+        with pytest.raises(OpenTokException):
+            self.opentok.generate_tokens(u("NOT A REAL SESSIONID"), [{}])
+        with pytest.raises(OpenTokException):
+            self.opentok.generate_tokens(self.session_id, [{}, {"role": "owner"}])
+        with pytest.raises(OpenTokException):
+            self.opentok.generate_tokens(self.session_id, [{"expire_time": 10}])
+
+    def test_generate_tokens_with_signing_pool(self):
+        vonage_wrapper = Client(
+            self.api_key, './tests/fake_data/dummy_private_key.txt'
+        )
+        with open('./tests/fake_data/dummy_public_key.txt', 'r') as file:
+            public_key = file.read()
+
+        vonage_wrapper.enable_signing_pool(workers=2, chunk_size=3)
+        try:
+            specs = [{"data": u("user={0}").format(i)} for i in range(10)]
+            tokens = vonage_wrapper.generate_tokens(self.session_id, specs)
+        finally:
+            vonage_wrapper.close()
+
+        assert vonage_wrapper._signing_pool is None
+        for i, token in enumerate(tokens):
+            claims = token_decoder(token, public_key)
+            assert claims[u("connection_data")] == u("user={0}").format(i)
+
+    def test_signing_pool_is_not_used_with_opentok_credentials(self):
+        self.opentok.enable_signing_pool(workers=1)
+        assert self.opentok._signing_pool is None
@@ -0,0 +1,125 @@
+import time
+import unittest
+
+import pytest
+from expects import *
+
+from opentok import Client, OpenTokException, Roles, TokenPool
+
+from .helpers import token_decoder
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while not condition():
+        if time.time() > deadline:
+            raise AssertionError("condition not met within {0}s".format(timeout))
+        time.sleep(0.01)
+
+
+class TokenPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.api_key = "123456"
+        self.api_secret = "1234567890abcdef1234567890abcdef1234567890"
+        self.session_id = (
+            "1_MX4xMjM0NTZ-flNhdCBNYXIgMTUgMTQ6NDI6MjMgUERUIDIwMTR-MC40OTAxMzAyNX4"
+        )
+        self.opentok = Client(self.api_key, self.api_secret)
+        self.pool = TokenPool(self.opentok, size=5, refill_interval=0.05)
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_first_get_is_a_miss_then_refills(self):
+        token = self.pool.get(self.session_id)
+
+        expect(token_decoder(token, self.api_secret)["session_id"]).to(
+            equal(self.session_id)
+        )
+        expect(self.pool.misses).to(equal(1))
+        expect(self.pool.hits).to(equal(0))
+
+        wait_until(lambda: self.pool.available(self.session_id) == 5)
+        token = self.pool.get(self.session_id)
+        expect(self.pool.hits).to(equal(1))
+        claims = token_decoder(token, self.api_secret)
+        expect(claims["role"]).to(equal(Roles.publisher.value))
+        expect(claims["exp"]).to(be_above(int(time.time()) + 60 * 60 * 23))
+
+        # the consumed token is replaced
+        wait_until(lambda: self.pool.available(self.session_id) == 5)
+
+    def test_tokens_are_kept_per_role(self):
+        self.pool.prime(self.session_id, Roles.moderator)
+        wait_until(lambda: self.pool.available(self.session_id, Roles.moderator) == 5)
+
+        expect(self.pool.available(self.session_id)).to(equal(0))
+        token = self.pool.get(self.session_id, Roles.moderator)
+        expect(token_decoder(token, self.api_secret)["role"]).to(
+            equal(Roles.moderator.value)
+        )
+        expect(self.pool.stats()).to(have_keys(hits=1, misses=0))
+
+    def test_expiring_tokens_are_discarded(self):
+        self.pool.close()
+        self.pool = TokenPool(
+            self.opentok, size=5, token_lifetime=120, min_ttl=100, refill_interval=0.05
+        )
+        self.pool.prime(self.session_id)
+        wait_until(lambda: self.pool.available(self.session_id) == 5)
+
+        # pretend the pooled tokens were minted a minute ago
+        with self.pool._condition:
+            pool = self.pool._pools[(self.session_id, Roles.publisher)]
+            aged = [(token, expire_time - 60) for token, expire_time in pool]
+            pool.clear()
+            pool.extend(aged)
+
+        self.pool.get(self.session_id)
+
+        expect(self.pool.discarded).to(be_above_or_equal(1))
+        expect(self.pool.hits + self.pool.misses).to(equal(1))
+
+    def test_remove(self):
+        self.pool.prime(self.session_id)
+        self.pool.prime(self.session_id, Roles.moderator)
+        wait_until(lambda: self.pool.stats()["available"] == 10)
+
+        self.pool.remove(self.session_id, Roles.moderator)
+        expect(self.pool.available(self.session_id, Roles.moderator)).to(equal(0))
+        expect(self.pool.available(self.session_id)).to(equal(5))
+
+        self.pool.remove(self.session_id)
+        expect(self.pool.stats()["available"]).to(equal(0))
+
+    def test_invalid_session_is_not_pooled(self):
+        with pytest.raises(OpenTokException):
+            self.pool.get("invalid")
+        expect(self.pool._pools).not_to(have_key(("invalid", Roles.publisher)))
+
+        with pytest.raises(OpenTokException):
+            self.pool.prime("invalid")
+        expect(self.pool._pools).to(be_empty)
+
+    def test_idle_pairs_are_evicted(self):
+        self.pool.close()
+        self.pool = TokenPool(
+            self.opentok, size=5, refill_interval=0.05, idle_timeout=0.3
+        )
+        self.pool.prime(self.session_id)
+        self.pool.prime(self.session_id, Roles.moderator)
+        wait_until(lambda: self.pool.stats()["available"] == 10)
+
+        # reading a pair keeps it tracked
+        deadline = time.time() + 0.6
+        while time.time() < deadline:
+            self.pool.get(self.session_id)
+            time.sleep(0.05)
+
+        expect(self.pool.available(self.session_id, Roles.moderator)).to(equal(0))
+        expect(self.pool.evicted).to(equal(1))
+        expect(self.pool.available(self.session_id)).to(be_above(0))
+
+    def test_min_ttl_must_be_below_lifetime(self):
+        with pytest.raises(ValueError):
+            TokenPool(self.opentok, token_lifetime=100, min_ttl=100)
@@ -0,0 +1,152 @@
+import asyncio
+import unittest
+
+import pytest
+from expects import *
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import SpanKind, StatusCode
+
+from opentok import Client, RetryPolicy
+from opentok.emulator import Emulator
+from opentok.exceptions import NotFoundError
+
+
+class TracingTest(unittest.TestCase):
+    def setUp(self):
+        self.api_key = "123456"
+        self.api_secret = "1234567890abcdef1234567890abcdef1234567890"
+        self.exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(self.exporter))
+        self.tracer = provider.get_tracer("opentok-tests")
+        self.emulator = Emulator().start()
+        self.addCleanup(self.emulator.stop)
+        self.opentok = Client(
+            self.api_key, self.api_secret, api_url=self.emulator.url, tracer=self.tracer
+        )
+
+    def spans(self):
+        return {span.name: span for span in self.exporter.get_finished_spans()}
+
+    def test_operation_spans(self):
+        archive = self.opentok.start_archive("SESSIONID")
+
+        spans = self.spans()
+        expect(set(spans)).to(
+            equal({"opentok.start_archive", "POST archive", "opentok.sign_jwt"})
+        )
+        operation = spans["opentok.start_archive"]
+        expect(operation.parent).to(be_none)
+        expect(operation.attributes["opentok.session_id"]).to(equal("SESSIONID"))
+        expect(operation.attributes["opentok.archive_id"]).to(equal(archive.id))
+        expect(operation.attributes["http.response.status_code"]).to(equal(200))
+        expect(operation.attributes["opentok.retry_count"]).to(equal(0))
+        expect(operation.attributes["http.request.body.size"]).to(be_above(0))
+
+        request = spans["POST archive"]
+        expect(request.kind).to(equal(SpanKind.CLIENT))
+        expect(request.parent.span_id).to(equal(operation.context.span_id))
+        expect(request.attributes["opentok.endpoint_family"]).to(equal("archive"))
+        expect(request.attributes["http.response.body.size"]).to(be_above(0))
+
+        signing = spans["opentok.sign_jwt"]
+        expect(signing.parent.span_id).to(equal(operation.context.span_id))
+        expect(signing.attributes["opentok.jwt.algorithm"]).to(equal("HS256"))
+
+    def test_jwt_signature_is_cached(self):
+        self.opentok.send_signal("SESSIONID", {"type": "t"})
+        self.exporter.clear()
+
+        self.opentok.send_signal("SESSIONID", {"type": "t"})
+
+        expect(set(self.spans())).to(equal({"opentok.send_signal", "POST signal"}))
+
+    def test_retries(self):
+        archive = self.opentok.start_archive("SESSIONID")
+        self.exporter.clear()
+        self.opentok.retry_policy = RetryPolicy(backoff_base=0)
+        self.emulator.inject_errors(503)
+
+        self.opentok.get_archive(archive.id)
+
+        requests = [
+            span
+            for span in self.exporter.get_finished_spans()
+            if span.name == "GET archive"
+        ]
+        expect(requests).to(have_length(2))
+        expect(requests[0].status.status_code).to(equal(StatusCode.ERROR))
+        expect(requests[1].attributes["http.request.resend_count"]).to(equal(1))
+        operation = self.spans()["opentok.get_archive"]
+        expect(operation.attributes["opentok.retry_count"]).to(equal(1))
+        expect(operation.attributes["opentok.archive_id"]).to(equal(archive.id))
+
+    def test_failed_operation(self):
+        with pytest.raises(NotFoundError):
+            self.opentok.get_archive("UNKNOWN")
+
+        operation = self.spans()["opentok.get_archive"]
+        expect(operation.status.status_code).to(equal(StatusCode.ERROR))
+        expect(operation.attributes["http.response.status_code"]).to(equal(404))
+        expect(operation.events[0].name).to(equal("exception"))
+
+    def test_bulk_calls(self):
+        stream_ids = [self.emulator.add_stream("SESSIONID") for _ in range(3)]
+
+        self.opentok.mute_streams("SESSIONID", stream_ids)
+
+        operations = [
+            span
+            for span in self.exporter.get_finished_spans()
+            if span.name == "opentok.mute_stream"
+        ]
+        expect(
+            sorted(span.attributes["opentok.stream_id"] for span in operations)
+        ).to(equal(sorted(stream_ids)))
+
+    def test_bulk_signals_are_named_like_send_signal(self):
+        payload = {"type": "chat", "data": "hi"}
+
+        self.opentok.send_signal("SESSIONID", payload)
+        self.opentok.send_signals("SESSIONID", [("CONNECTION1", payload), (None, payload)])
+
+        names = [
+            span.name
+            for span in self.exporter.get_finished_spans()
+            if span.name.startswith("opentok.") and span.name != "opentok.sign_jwt"
+        ]
+        expect(names).to(equal(["opentok.send_signal"] * 3))
+
+    def test_async_client(self):
+        pytest.importorskip("aiohttp")
+        from opentok import AsyncClient
+
+        async def main():
+            async with AsyncClient(
+                self.api_key,
+                self.api_secret,
+                api_url=self.emulator.url,
+                tracer=self.tracer,
+            ) as client:
+                await asyncio.gather(
+                    client.list_streams("SESSION1"), client.list_streams("SESSION2")
+                )
+
+        asyncio.run(main())
+
+        spans = self.exporter.get_finished_spans()
+        operations = {
+            span.attributes["opentok.session_id"]: span
+            for span in spans
+            if span.name == "opentok.list_streams"
+        }
+        requests = [span for span in spans if span.name == "GET stream"]
+        expect(set(operations)).to(equal({"SESSION1", "SESSION2"}))
+        expect(set(span.parent.span_id for span in requests)).to(
+            equal(set(span.context.span_id for span in operations.values()))
+        )
@@ -0,0 +1,65 @@
+import unittest
+import httpretty
+import time
+from expects import *
+
+from opentok import Client
+from opentok.transport import Transport
+
+
+class TransportTest(unittest.TestCase):
+    def setUp(self):
+        self.api_key = "123456"
+        self.api_secret = "1234567890abcdef1234567890abcdef1234567890"
+        self.session_id = "SESSIONID"
+
+    def test_pool_settings_are_applied(self):
+        transport = Transport(pool_connections=4, pool_maxsize=20, pool_block=True)
+        adapter = transport.session.get_adapter("https://api.opentok.com")
+
+        expect(adapter._pool_connections).to(equal(4))
+        expect(adapter._pool_maxsize).to(equal(20))
+        expect(adapter._pool_block).to(be_true)
+
+    def test_session_is_reused(self):
+        transport = Transport()
+        expect(transport.session).to(be(transport.session))
+
+    def test_idle_session_is_recycled(self):
+        transport = Transport(idle_timeout=0.01)
+        session = transport.session
+        time.sleep(0.02)
+        expect(transport.session).not_to(be(session))
+
+    def test_close(self):
+        transport = Transport()
+        session = transport.session
+        transport.close()
+        expect(transport.session).not_to(be(session))
+
+    def test_client_pool_settings(self):
+        opentok = Client(
+            self.api_key, self.api_secret, pool_maxsize=50, pool_idle_timeout=30
+        )
+        expect(opentok.transport.pool_maxsize).to(equal(50))
+        expect(opentok.transport.idle_timeout).to(equal(30))
+
+    @httpretty.activate
+    def test_requests_share_the_client_transport(self):
+        httpretty.register_uri(
+            httpretty.POST,
+            "https://api.opentok.com/v2/project/{0}/session/{1}/signal".format(
+                self.api_key, self.session_id
+            ),
+            status=204,
+        )
+
+        with Client(self.api_key, self.api_secret) as opentok:
+            opentok.send_signal(self.session_id, {"type": "a", "data": "b"})
+            session = opentok.transport.session
+            opentok.send_signal(self.session_id, {"type": "a", "data": "b"})
+
+            expect(opentok.transport.session).to(be(session))
+            expect(httpretty.last_request().headers["connection"]).to(
+                equal("keep-alive")
+            )